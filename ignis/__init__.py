@@ -1,3 +1,5 @@
+# must be the first import to measure the import time of everything else
+from ignis import _startup_profiler
 import gi
 import os
 import sys
@@ -142,12 +144,17 @@ def _prepend_gvc() -> None:
 
 
 def _init() -> None:
-    _init_asyncio()
+    with _startup_profiler.phase("asyncio init"):
+        _init_asyncio()
     _makedirs()
-    _load_gtk_layer_shell()
-    _require_versions()
-    _prepend_gvc()
+    with _startup_profiler.phase("load gtk4-layer-shell"):
+        _load_gtk_layer_shell()
+    with _startup_profiler.phase("GI require versions"):
+        _require_versions()
+    with _startup_profiler.phase("prepend Gvc to GI repository"):
+        _prepend_gvc()
 
 
 if not is_sphinx_build:
     _init()
+    _startup_profiler.phase_since_start("import ignis")
@@ -0,0 +1,64 @@
+from loguru import logger
+from contextlib import contextmanager
+from collections.abc import Callable, Iterator
+
+# Objects created while the configuration is imported (polls, file monitors, application signal handlers)
+# register a cleanup here, so an in-process reload can tear down everything the previous configuration created.
+# This module must not import gi or other Ignis modules.
+
+_cleanups: list[Callable[[], None]] | None = None
+
+
+def add_cleanup(func: Callable[[], None]) -> None:
+    """
+    Register a function that tears down an object created by the configuration.
+    Does nothing outside of :func:`collect`.
+    """
+    if _cleanups is not None:
+        _cleanups.append(func)
+
+
+@contextmanager
+def collect() -> Iterator[list[Callable[[], None]]]:
+    """
+    Collect cleanups registered by the code inside the ``with`` block.
+    """
+    global _cleanups
+
+    previous = _cleanups
+    cleanups: list[Callable[[], None]] = []
+    _cleanups = cleanups
+    try:
+        yield cleanups
+    finally:
+        _cleanups = previous
+
+
+@contextmanager
+def suspended() -> Iterator[None]:
+    """
+    Don't collect cleanups inside the ``with`` block,
+    e.g., for singletons that are created by the configuration but outlive it.
+    """
+    global _cleanups
+
+    previous = _cleanups
+    _cleanups = None
+    try:
+        yield
+    finally:
+        _cleanups = previous
+
+
+def run_cleanups(cleanups: list[Callable[[], None]]) -> None:
+    """
+    Call the collected cleanups, newest first.
+    """
+    while cleanups:
+        cleanup = cleanups.pop()
+        try:
+            cleanup()
+        except Exception:
+            logger.exception(
+                f"Failed to clean up after the previous configuration: {cleanup}"
+            )
@@ -0,0 +1,121 @@
+import time
+import cProfile
+from contextlib import contextmanager
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+# This module is imported first by ignis/__init__.py, so it must not import gi or other Ignis modules.
+
+_start = time.perf_counter()
+
+
+@dataclass
+class _Phase:
+    name: str
+    # milliseconds since the start of the Ignis import
+    start: float
+    duration: float
+
+
+_phases: list[_Phase] = []
+_enabled = False
+_finished = False
+_profiler: cProfile.Profile | None = None
+_profile_output: str | None = None
+
+
+def _now() -> float:
+    return (time.perf_counter() - _start) * 1000
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Record the duration of the code inside the ``with`` block as a startup phase.
+    Does nothing after the first frame has been rendered.
+    """
+    if _finished:
+        yield
+        return
+
+    start = _now()
+    try:
+        yield
+    finally:
+        _phases.append(_Phase(name=name, start=start, duration=_now() - start))
+
+
+def phase_since_start(name: str) -> None:
+    """
+    Record a phase from the start of the Ignis import until now.
+    """
+    if not _finished:
+        _phases.append(_Phase(name=name, start=0.0, duration=_now()))
+
+
+def mark(name: str) -> None:
+    """
+    Record a point in time without a duration.
+    """
+    if not _finished:
+        _phases.append(_Phase(name=name, start=_now(), duration=0.0))
+
+
+def enable(profile_output: str | None = None) -> None:
+    """
+    Enable printing of the startup report.
+    If ``profile_output`` is provided, also run cProfile until the first frame and dump pstats to this path.
+    """
+    global _enabled, _profiler, _profile_output
+
+    _enabled = True
+
+    if profile_output:
+        _profile_output = profile_output
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def finish() -> None:
+    """
+    Mark the first frame and stop recording.
+    """
+    global _finished
+
+    if _finished:
+        return
+
+    mark("first frame")
+    _finished = True
+
+    from loguru import logger
+
+    if _profiler is not None and _profile_output is not None:
+        _profiler.disable()
+        _profiler.dump_stats(_profile_output)
+        logger.info(f"Startup profile saved to: {_profile_output}")
+
+    if _enabled:
+        logger.info(f"Startup report:\n{format_report(get_phases())}")
+
+
+def get_phases() -> list[tuple[str, float, float]]:
+    """
+    Get recorded phases as ``(name, start, duration)`` tuples, in milliseconds.
+    """
+    return [
+        (phase.name, phase.start, phase.duration)
+        for phase in sorted(_phases, key=lambda phase: phase.start)
+    ]
+
+
+def format_report(phases: list[tuple[str, float, float]]) -> str:
+    """
+    Format phases (as returned by :func:`get_phases`) as a table.
+    """
+    lines = [f"{'start, ms':>10}  {'duration, ms':>12}  phase"]
+    for name, start, duration in phases:
+        duration_str = f"{duration:.2f}" if duration else "-"
+        lines.append(f"{start:>10.2f}  {duration_str:>12}  {name}")
+
+    return "\n".join(lines)
@@ -1,15 +1,24 @@
 from __future__ import annotations
 import os
+import ast
 import sys
+import time
+import asyncio
+import inspect
+import functools
+import importlib
 import datetime
 import ignis
 import shutil
-from dataclasses import dataclass
-from typing import Literal
+from types import CodeType, ModuleType
+from dataclasses import dataclass, field
+from typing import Any, Literal
+from collections.abc import Callable
 from ignis.dbus import DBusService
+from ignis.base_service import BaseService
 from ignis import utils
 from loguru import logger
-from gi.repository import Gtk, Gio, GLib  # type: ignore
+from gi.repository import Gtk, Gdk, Gio, GLib  # type: ignore
 from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
 from ignis.exceptions import (
     WindowNotFoundError,
@@ -19,6 +28,11 @@ from ignis.exceptions import (
 )
 from ignis.log_utils import configure_logger
 from ignis.window_manager import WindowManager
+from ignis.options_manager import _flush_all_managers
+from ignis.utils.sass import get_dependencies
+from ignis.widgets._bindings import disconnect_widget_bindings
+from ignis.utils.shell import _live_streaming_processes, _stop_streaming_processes
+from ignis import _startup_profiler, _config_scope
 from ignis._deprecation import (
     deprecated,
     deprecation_warning,
@@ -27,6 +41,8 @@ from ignis._deprecation import (
 
 StylePriority = Literal["application", "fallback", "settings", "theme", "user"]
 
+ReloadMode = Literal["restart", "in_process"]
+
 GTK_STYLE_PRIORITIES: dict[StylePriority, int] = {
     "application": Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
     "fallback": Gtk.STYLE_PROVIDER_PRIORITY_FALLBACK,
@@ -37,6 +53,17 @@ GTK_STYLE_PRIORITIES: dict[StylePriority, int] = {
 
 window_manager = WindowManager.get_default()
 
+# files and directories in the config directory that are not watched for changes
+_CONFIG_WATCH_IGNORE = [
+    "__pycache__",
+    ".git",
+    "node_modules",
+    ".venv",
+    "venv",
+    "*.swp",
+    "*~",
+]
+
 
 def _get_wm_depr_msg(name: str):
     return f"IgnisApp.{name}() is deprecated, use WindowManager.{name}() instead."
@@ -54,12 +81,71 @@ def _is_elf_file(path: str) -> bool:
         return magic == b"\x7fELF"
 
 
+# the code to execute and the code of the trailing expression (its value is the result)
+_CompiledCode = tuple[CodeType, CodeType | None]
+
+
+def _compile(source: str, filename: str) -> _CompiledCode:
+    tree = ast.parse(source, filename)
+
+    expression = None
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        expression = ast.Expression(tree.body.pop().value)
+
+    return (
+        compile(tree, filename, "exec"),
+        compile(expression, filename, "eval") if expression else None,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_source(source: str) -> _CompiledCode:
+    return _compile(source, "<run-python>")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_file(path: str, mtime_ns: int, size: int) -> _CompiledCode:
+    # mtime and size are a part of the cache key, so an edited file is compiled again
+    with open(path) as file:
+        return _compile(file.read(), path)
+
+
+@functools.cache
+def _get_exec_base_namespace() -> dict[str, Any]:
+    # only the names snippets usually need, copying the whole module namespace on every call is wasteful
+    return {
+        "__builtins__": __builtins__,
+        "__name__": "__ignis_exec__",
+        "os": os,
+        "sys": sys,
+        "asyncio": asyncio,
+        "ignis": ignis,
+        "utils": utils,
+        "logger": logger,
+        "Gtk": Gtk,
+        "Gdk": Gdk,
+        "Gio": Gio,
+        "GLib": GLib,
+        "IgnisApp": IgnisApp,
+        "window_manager": window_manager,
+    }
+
+
+def _is_config_module(module: object, config_dir: str) -> bool:
+    path = getattr(module, "__file__", None)
+    if not path:
+        return False
+    return os.path.abspath(path).startswith(config_dir + os.sep)
+
+
 @dataclass
 class _CssProviderInfo:
     provider: Gtk.CssProvider
     path: str
     priority: StylePriority
     compiler: Literal["sass", "grass"] | None = None
+    # real paths of the style file and all files it imports
+    dependencies: set[str] = field(default_factory=set)
 
 
 class IgnisApp(Gtk.Application, IgnisGObject):
@@ -105,6 +191,11 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         self.__dbus.register_dbus_method(name="RunFile", method=self.__RunFile)
         self.__dbus.register_dbus_method(name="Reload", method=self.__Reload)
         self.__dbus.register_dbus_method(name="ListWindows", method=self.__ListWindows)
+        self.__dbus.register_dbus_method(
+            name="StartupReport", method=self.__StartupReport
+        )
+        self.__dbus.register_dbus_method(name="Batch", method=self.__Batch)
+        self.__dbus.register_dbus_method(name="EvalPython", method=self.__EvalPython)
 
         self._config_path: str | None = None
         self._css_providers: dict[str, _CssProviderInfo] = {}
@@ -113,6 +204,15 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         self._reload_on_monitors_change: bool = True
         self._is_ready = False
         self._widgets_style_priority: StylePriority = "application"
+        self._reload_mode: ReloadMode = "restart"
+        # paths applied again during an in-process reload, None if not reloading
+        self._reapplied_css: set[str] | None = None
+        self._persistent_exec_namespace: bool = False
+        self._exec_namespace: dict[str, Any] | None = None
+        # cleanups of polls, file monitors and signal handlers created by the current configuration
+        self._config_cleanups: list[Callable[[], None]] = []
+
+        self.connect("shutdown", lambda *_: _stop_streaming_processes())
 
     def __watch_config(
         self, file_monitor: utils.FileMonitor, path: str, event_type: str
@@ -120,12 +220,12 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         if event_type != "changes_done_hint":
             return
 
-        if not os.path.isdir(path) and "__pycache__" not in path:
+        if not os.path.isdir(path):
             extension = os.path.splitext(path)[1]
             if extension == ".py" and self.autoreload_config:
                 self.reload()
             elif extension in (".css", ".scss", ".sass") and self.autoreload_css:
-                self.reload_css()
+                self.reload_css(path)
 
     def __watch_monitors(self) -> None:
         def callback(*_) -> None:
@@ -145,6 +245,23 @@ class IgnisApp(Gtk.Application, IgnisGObject):
             cls._instance = cls()
         return cls._instance
 
+    def connect(self, signal_name: str, handler: Callable, *args) -> int:
+        """
+        :meta private:
+        """
+        handler_id = super().connect(signal_name, handler, *args)
+
+        # handlers connected by the configuration are disconnected on an in-process reload,
+        # otherwise they would accumulate (e.g., "ready" handlers run again after each reload)
+        _config_scope.add_cleanup(
+            lambda: (
+                self.disconnect(handler_id)
+                if self.handler_is_connected(handler_id)
+                else None
+            )
+        )
+        return handler_id
+
     @IgnisSignal
     def ready(self):
         """
@@ -211,6 +328,64 @@ class IgnisApp(Gtk.Application, IgnisGObject):
     def reload_on_monitors_change(self, value: bool) -> None:
         self._reload_on_monitors_change = value
 
+    @IgnisProperty
+    def reload_mode(self) -> ReloadMode:
+        """
+        How :func:`reload` reloads the configuration.
+
+        - ``"restart"``: quit and restart the whole Ignis process.
+        - ``"in_process"``: destroy all windows and re-import only the configuration modules (files inside the config directory).
+          Already initialized services and compiled CSS styles are kept alive, so reloading is much faster.
+
+        If the configuration fails to import during an in-process reload, the previous windows are kept.
+
+        Default: ``"restart"``.
+
+        Before the new configuration is started, objects created by the previous one are torn down:
+        windows, bindings (:class:`~ignis.gobject.Binding`), :class:`~ignis.utils.Poll` and :class:`~ignis.utils.FileMonitor` instances,
+        :class:`~ignis.utils.StreamingProcess` instances, and signal handlers connected to the application (e.g., ``app.connect("ready", ...)``).
+        Objects created by services are kept.
+
+        .. warning::
+            Signal handlers connected manually to other objects (e.g., ``service.connect(...)``) and threads created by the configuration are **not** removed,
+            so they will run once more after each reload.
+            Use the ``"restart"`` mode if your configuration relies on them.
+
+        .. code-block:: python
+
+            from ignis.app import IgnisApp
+
+            app = IgnisApp.get_default()
+
+            app.reload_mode = "in_process"
+        """
+        return self._reload_mode
+
+    @reload_mode.setter
+    def reload_mode(self, value: ReloadMode) -> None:
+        self._reload_mode = value
+
+    @IgnisProperty
+    def persistent_exec_namespace(self) -> bool:
+        """
+        Whether code executed with ``ignis run-python`` and ``ignis run-file`` (or :class:`~ignis.client.IgnisClient`)
+        shares one namespace across calls.
+        If ``True``, variables, functions, and imports defined by one call are available in the following ones.
+
+        In any case, the code has access to this application as ``self`` and to a few common names:
+        ``os``, ``sys``, ``asyncio``, ``ignis``, ``utils``, ``logger``, ``Gtk``, ``Gdk``, ``Gio``, ``GLib``,
+        ``IgnisApp``, and ``window_manager``. Anything else must be imported.
+
+        Default: ``False``.
+        """
+        return self._persistent_exec_namespace
+
+    @persistent_exec_namespace.setter
+    def persistent_exec_namespace(self, value: bool) -> None:
+        self._persistent_exec_namespace = value
+        if not value:
+            self._exec_namespace = None
+
     @IgnisProperty
     def widgets_style_priority(self) -> StylePriority:
         """
@@ -273,8 +448,45 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         """
 
         if style_path in self._css_providers:
-            raise StylePathAppliedError(style_path)
+            if (
+                self._reapplied_css is not None
+                and style_path not in self._reapplied_css
+            ):
+                # in-process reload: keep the already compiled style if nothing has changed
+                self._reapplied_css.add(style_path)
+                provider_info = self._css_providers[style_path]
+                if (
+                    provider_info.priority == style_priority
+                    and provider_info.compiler == compiler
+                ):
+                    return
+                self.remove_css(style_path)
+            else:
+                raise StylePathAppliedError(style_path)
+        elif self._reapplied_css is not None:
+            self._reapplied_css.add(style_path)
+
+        provider = self.__create_css_provider(style_path, compiler)
 
+        Gtk.StyleContext.add_provider_for_display(
+            utils.get_gdk_display(),
+            provider,
+            GTK_STYLE_PRIORITIES[style_priority],
+        )
+
+        self._css_providers[style_path] = _CssProviderInfo(
+            provider=provider,
+            path=style_path,
+            priority=style_priority,
+            compiler=compiler,
+            dependencies=get_dependencies(style_path),
+        )
+
+        logger.info(f"Applied css: {style_path}")
+
+    def __create_css_provider(
+        self, style_path: str, compiler: Literal["sass", "grass"] | None
+    ) -> Gtk.CssProvider:
         if not os.path.exists(style_path):
             raise FileNotFoundError(
                 f"Provided style path doesn't exists: '{style_path}'"
@@ -294,21 +506,7 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         provider.connect("parsing-error", raise_css_parsing_error)
 
         provider.load_from_string(css_style)
-
-        Gtk.StyleContext.add_provider_for_display(
-            utils.get_gdk_display(),
-            provider,
-            GTK_STYLE_PRIORITIES[style_priority],
-        )
-
-        self._css_providers[style_path] = _CssProviderInfo(
-            provider=provider,
-            path=style_path,
-            priority=style_priority,
-            compiler=compiler,
-        )
-
-        logger.info(f"Applied css: {style_path}")
+        return provider
 
     def remove_css(self, style_path: str) -> None:
         """
@@ -342,23 +540,71 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         for style_path in self._css_providers.copy().keys():
             self.remove_css(style_path)
 
-    def reload_css(self) -> None:
+    def reload_css(self, changed_path: str | None = None) -> None:
         """
-        Reload all applied CSS/SCSS/SASS styles.
+        Reload applied CSS/SCSS/SASS styles.
+
+        All styles are compiled first, and only then the old styles are replaced with the new ones,
+        so widgets are never rendered without styles.
+        If compilation of any style fails, all old styles are kept.
+
+        Args:
+            changed_path: The path to a changed file. If provided, only styles that are this file or import it (directly or through other files) are reloaded.
+                If not provided, all styles are reloaded.
 
         Raises:
             DisplayNotFoundError
         """
-        css_providers = self._css_providers.copy().values()
-        self.reset_css()
+        if changed_path is None:
+            dirty = list(self._css_providers.values())
+        else:
+            real_path = os.path.realpath(changed_path)
+            dirty = [
+                provider_info
+                for provider_info in self._css_providers.values()
+                if real_path in provider_info.dependencies
+            ]
+
+        if not dirty:
+            return
+
+        new_providers = {
+            provider_info.path: self.__create_css_provider(
+                provider_info.path, provider_info.compiler
+            )
+            for provider_info in dirty
+        }
+
+        self.__swap_css_providers(new_providers)
 
-        for provider_info in css_providers:
-            self.apply_css(
-                style_path=provider_info.path,
-                style_priority=provider_info.priority,
-                compiler=provider_info.compiler,
+        for provider_info in dirty:
+            provider_info.dependencies = get_dependencies(provider_info.path)
+            logger.info(f"Reloaded css: {provider_info.path}")
+
+    def __swap_css_providers(self, new_providers: dict[str, Gtk.CssProvider]) -> None:
+        display = utils.get_gdk_display()
+        priorities = {self._css_providers[path].priority for path in new_providers}
+
+        # GTK applies styles with the same priority in the order they were added,
+        # so unchanged styles added after a changed one must be re-added too to keep the order.
+        readd = False
+        for provider_info in self._css_providers.values():
+            if provider_info.path in new_providers:
+                readd = True
+            if not readd or provider_info.priority not in priorities:
+                continue
+
+            new_provider = new_providers.get(provider_info.path, provider_info.provider)
+
+            Gtk.StyleContext.remove_provider_for_display(
+                display, provider_info.provider
+            )
+            Gtk.StyleContext.add_provider_for_display(
+                display, new_provider, GTK_STYLE_PRIORITIES[provider_info.priority]
             )
 
+            provider_info.provider = new_provider
+
     def add_icons(self, path: str) -> None:
         """
         Add custom SVG icons from a directory.
@@ -398,10 +644,47 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         icon_theme = Gtk.IconTheme.get_for_display(utils.get_gdk_display())
         icon_theme.add_search_path(path)
 
+    async def init_services_async(self, *services: type[BaseService]) -> None:
+        """
+        Initialize several services concurrently, without blocking the main loop.
+
+        Each service is created with :func:`~ignis.base_service.BaseService.get_default_async`,
+        so later calls to ``get_default()`` return the already initialized instance.
+
+        Args:
+            *services: Service classes to initialize.
+
+        .. code-block:: python
+
+            import asyncio
+            from ignis.app import IgnisApp
+            from ignis.services.mpris import MprisService
+            from ignis.services.systemd import SystemdService
+            from ignis.services.backlight import BacklightService
+
+            app = IgnisApp.get_default()
+
+            async def setup() -> None:
+                await app.init_services_async(MprisService, SystemdService, BacklightService)
+                # ... create widgets that use these services
+
+            asyncio.create_task(setup())
+        """
+
+        async def init_service(service: type[BaseService]) -> None:
+            start = time.perf_counter()
+            with _startup_profiler.phase(f"init_services_async: {service.__name__}"):
+                await service.get_default_async()
+            elapsed = (time.perf_counter() - start) * 1000
+            logger.debug(f"Initialized {service.__name__} in {elapsed:.2f} ms")
+
+        await asyncio.gather(*(init_service(service) for service in services))
+
     def do_activate(self) -> None:
         """
         :meta private:
         """
+        _startup_profiler.mark("application activated")
         self.hold()
         self.__watch_monitors()
 
@@ -419,16 +702,28 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         logger.info(f"Using configuration file: {self._config_path}")
 
         self._monitor = utils.FileMonitor(
-            path=config_dir, callback=self.__watch_config, recursive=True
+            path=config_dir,
+            callback=self.__watch_config,
+            recursive=True,
+            ignore=_CONFIG_WATCH_IGNORE,
+            debounce=100,
         )
 
         sys.path.append(config_dir)
-        __import__(config_filename)
+        with (
+            _startup_profiler.phase("config import"),
+            _config_scope.collect() as cleanups,
+        ):
+            __import__(config_filename)
+
+        self._config_cleanups = cleanups
 
         self._is_ready = True
         self.emit("ready")
         logger.info("Ready.")
 
+        self.__track_first_frame()
+
         date = datetime.datetime.now()
 
         if date.month == 12 and date.day in [30, 31]:
@@ -436,13 +731,135 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         elif date.month == 1 and date.day in [1, 2]:
             self.__happy_new_year()
 
+    def __track_first_frame(self) -> None:
+        windows = [window for window in window_manager.windows if window.get_mapped()]
+        _startup_profiler.mark(f"windows realized: {len(windows)}")
+
+        if not windows:
+            GLib.idle_add(_startup_profiler.finish)
+            return
+
+        frame_clock = windows[0].get_frame_clock()
+        if frame_clock is None:
+            GLib.idle_add(_startup_profiler.finish)
+            return
+
+        def on_after_paint(clock: Gdk.FrameClock) -> None:
+            clock.disconnect(handler_id)
+            _startup_profiler.finish()
+
+        handler_id = frame_clock.connect("after-paint", on_after_paint)
+
     def __happy_new_year(self) -> None:
         logger.success("Happy New Year!")
 
     def reload(self) -> None:
         """
         Reload Ignis.
+        The behavior depends on :attr:`reload_mode`.
         """
+        if self._reload_mode == "in_process":
+            self.__reload_in_process()
+        else:
+            self.__restart()
+
+    def __reload_in_process(self) -> None:
+        if not self._config_path:
+            raise ValueError("Set up config_path before trying to reload application")
+
+        start = time.perf_counter()
+
+        config_dir = os.path.dirname(os.path.abspath(self._config_path))
+        config_filename = os.path.splitext(os.path.basename(self._config_path))[0]
+
+        # Unregister (but don't destroy yet) old windows, so the new configuration can reuse their namespaces.
+        # They are destroyed only after the new windows are created, so there is no blank frame in between.
+        old_windows: dict[str, Gtk.Window] = {}
+        for window_name in window_manager.list_window_names():
+            old_windows[window_name] = window_manager.get_window(window_name)
+            window_manager.remove_window(window_name)
+
+        old_modules = {
+            name: module
+            for name, module in sys.modules.items()
+            if _is_config_module(module, config_dir)
+        }
+        for name in old_modules:
+            del sys.modules[name]
+
+        old_css = set(self._css_providers)
+        self._reapplied_css = set()
+        old_processes = set(_live_streaming_processes)
+
+        importlib.invalidate_caches()
+
+        try:
+            with _config_scope.collect() as cleanups:
+                importlib.import_module(config_filename)
+        except Exception:
+            logger.exception(
+                "Failed to reload configuration, keeping the previous one."
+            )
+            # polls, monitors and handlers created before the error
+            _config_scope.run_cleanups(cleanups)
+            self.__rollback_reload(
+                config_dir, old_windows, old_modules, old_css, old_processes
+            )
+            return
+        finally:
+            reapplied_css = self._reapplied_css
+            self._reapplied_css = None
+
+        # before "ready" is emitted again, so handlers of the previous configuration don't run
+        _config_scope.run_cleanups(self._config_cleanups)
+        self._config_cleanups = cleanups
+
+        for window in old_windows.values():
+            disconnect_widget_bindings(window)
+            window.destroy()
+
+        # the new configuration has started its own processes
+        _stop_streaming_processes(old_processes)
+
+        for style_path in old_css - reapplied_css:
+            if style_path in self._css_providers:
+                self.remove_css(style_path)
+
+        self.emit("ready")
+
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.info(f"Reloaded configuration in {elapsed:.2f} ms.")
+
+    def __rollback_reload(
+        self,
+        config_dir: str,
+        old_windows: dict[str, Gtk.Window],
+        old_modules: dict[str, ModuleType],
+        old_css: set[str],
+        old_processes: set[utils.StreamingProcess],
+    ) -> None:
+        # destroy windows that were created before the error
+        for window_name in window_manager.list_window_names():
+            window = window_manager.get_window(window_name)
+            window_manager.remove_window(window_name)
+            disconnect_widget_bindings(window)
+            window.destroy()
+
+        for window_name, window in old_windows.items():
+            window_manager.add_window(window_name, window)
+
+        for name, module in list(sys.modules.items()):
+            if _is_config_module(module, config_dir):
+                del sys.modules[name]
+        sys.modules.update(old_modules)
+
+        for style_path in set(self._css_providers) - old_css:
+            self.remove_css(style_path)
+
+        # processes started before the error
+        _stop_streaming_processes(_live_streaming_processes - old_processes)
+
+    def __restart(self) -> None:
         self.quit()
 
         # https://github.com/linkfrg/ignis/issues/267
@@ -457,6 +874,12 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         """
         Quit Ignis.
         """
+        # autosave is debounced, don't lose the latest option changes
+        _flush_all_managers()
+
+        # also before a restart, "shutdown" isn't emitted before os.execl()
+        _stop_streaming_processes()
+
         if ignis._temp_dir:
             logger.debug(f"Removing temp dir: {ignis._temp_dir}")
             try:
@@ -492,15 +915,71 @@ class IgnisApp(Gtk.Application, IgnisGObject):
     def __ListWindows(self, invocation) -> GLib.Variant:
         return GLib.Variant("(as)", (window_manager.list_window_names(),))
 
+    def __StartupReport(self, invocation) -> GLib.Variant:
+        return GLib.Variant("(a(sdd))", (_startup_profiler.get_phases(),))
+
+    def __get_exec_namespace(self) -> dict[str, Any]:
+        if not self._persistent_exec_namespace:
+            return {**_get_exec_base_namespace(), "self": self}
+
+        if self._exec_namespace is None:
+            self._exec_namespace = {**_get_exec_base_namespace(), "self": self}
+
+        return self._exec_namespace
+
+    def __run_code(self, compiled: _CompiledCode) -> Any:
+        code, expression = compiled
+        namespace = self.__get_exec_namespace()
+
+        exec(code, namespace)
+        if expression is not None:
+            return eval(expression, namespace)
+
+        return None
+
+    def __run_python(self, code: str) -> Any:
+        return self.__run_code(_compile_source(code))
+
+    def __run_file(self, path: str) -> Any:
+        stat = os.stat(path)
+        return self.__run_code(_compile_file(path, stat.st_mtime_ns, stat.st_size))
+
     def __RunPython(self, invocation, code: str) -> None:
         invocation.return_value(None)
-        exec(code)
+        self.__run_python(code)
 
     def __RunFile(self, invocation, path: str) -> None:
         invocation.return_value(None)
-        with open(path) as file:
-            code = file.read()
-            exec(code)
+        self.__run_file(path)
+
+    async def __EvalPython(self, invocation, code: str) -> GLib.Variant:
+        result = self.__run_python(code)
+        if inspect.isawaitable(result):
+            result = await result
+
+        return GLib.Variant("(s)", ("" if result is None else str(result),))
+
+    def __run_batch_operation(self, operation: str, argument: str) -> None:
+        if operation in ("open_window", "close_window", "toggle_window"):
+            getattr(window_manager, operation)(argument)
+        elif operation == "run_python":
+            self.__run_python(argument)
+        elif operation == "run_file":
+            self.__run_file(argument)
+        else:
+            raise ValueError(f"Unknown batch operation: {operation}")
+
+    def __Batch(self, invocation, operations: list[tuple[str, str]]) -> GLib.Variant:
+        results = []
+        for operation, argument in operations:
+            try:
+                self.__run_batch_operation(operation, argument)
+                results.append((True, ""))
+            except Exception as e:
+                logger.opt(exception=e).debug(f"Batch operation failed: {operation}")
+                results.append((False, f"{type(e).__name__}: {e}"))
+
+        return GLib.Variant("(a(bs))", (results,))
 
     def __Inspector(self, invocation) -> None:
         self.inspector()
@@ -573,6 +1052,8 @@ def run_app(config_path: str, debug: bool) -> None:
 
     app._setup(config_path)
 
+    _startup_profiler.mark("run application")
+
     try:
         app.run(None)
     except KeyboardInterrupt:
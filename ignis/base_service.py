@@ -1,11 +1,79 @@
+import asyncio
+from typing import Any, TypeVar
 from ignis.gobject import IgnisGObjectSingleton
+from ignis import _startup_profiler, _config_scope
+
+_ServiceT = TypeVar("_ServiceT", bound="BaseService")
+
+_init_tasks: dict[type, asyncio.Future] = {}
 
 
-# FIXME: Probably it should be deprecated due to its lack of utility.
-# But I will leave it as is for now in case I find a meaningful use for it.
 class BaseService(IgnisGObjectSingleton):
     """
     Bases: :class:`~ignis.gobject.IgnisGObjectSingleton`.
 
     The base class for all services.
     """
+
+    @classmethod
+    def get_default(cls: type[_ServiceT]) -> _ServiceT:
+        """
+        Returns the default instance for this process, creating it if necessary.
+        """
+        if cls._instance is None:
+            # services outlive the configuration, their polls and monitors are not torn down on reload
+            with (
+                _startup_profiler.phase(f"service: {cls.__name__}"),
+                _config_scope.suspended(),
+            ):
+                cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    async def get_default_async(cls: type[_ServiceT]) -> _ServiceT:
+        """
+        Asynchronously get the default instance for this process, creating it if necessary.
+
+        Unlike :func:`get_default`, services that perform D-Bus calls during initialization
+        do it without blocking the main loop.
+        Concurrent calls share a single initialization.
+        """
+        if cls._instance is not None:
+            return cls._instance
+
+        task = _init_tasks.get(cls, None)
+        if task is None:
+            task = asyncio.ensure_future(cls.__get_init_kwargs_profiled())
+            _init_tasks[cls] = task
+
+        try:
+            kwargs = await task
+        finally:
+            _init_tasks.pop(cls, None)
+
+        # get_default() could have been called while we were waiting,
+        # the instance is created only now, so a second one with live subscriptions is never built
+        if cls._instance is None:
+            with (
+                _startup_profiler.phase(f"service: {cls.__name__} (async)"),
+                _config_scope.suspended(),
+            ):
+                cls._instance = cls(**kwargs)
+
+        return cls._instance
+
+    @classmethod
+    async def __get_init_kwargs_profiled(cls) -> dict[str, Any]:
+        with _startup_profiler.phase(f"service: {cls.__name__} (async prepare)"):
+            return await cls._get_init_kwargs_async()
+
+    @classmethod
+    async def _get_init_kwargs_async(cls) -> dict[str, Any]:
+        """
+        :meta private:
+
+        Asynchronously prepare keyword arguments for the constructor (e.g., D-Bus proxies).
+        Services that block during initialization should override this,
+        and accept the prepared objects in the constructor instead of creating them synchronously.
+        """
+        return {}
@@ -1,5 +1,6 @@
 from gi.repository import Gtk, GObject, GLib  # type: ignore
 from typing import Any
+from collections import OrderedDict
 from collections.abc import Callable
 from ignis.gobject import IgnisGObject, IgnisProperty
 from ignis.exceptions import CssParsingError
@@ -15,6 +16,55 @@ def raise_css_parsing_error(
     raise CssParsingError(section, gerror)
 
 
+_StyleKey = tuple[str, StylePriority]
+
+
+class _StyleProviderCache:
+    """
+    Interned CSS providers for the ``style`` property.
+
+    Widgets with identical styles share one parsed provider.
+    Providers are reference counted; a few unused ones are kept,
+    so styles that are switched back and forth (e.g., bound to a property) are not parsed again.
+    """
+
+    MAX_UNUSED = 64
+
+    def __init__(self) -> None:
+        self._providers: dict[_StyleKey, Gtk.CssProvider] = {}
+        self._refcounts: dict[_StyleKey, int] = {}
+        self._unused: OrderedDict[_StyleKey, None] = OrderedDict()
+
+    def acquire(self, key: _StyleKey) -> Gtk.CssProvider:
+        provider = self._providers.get(key, None)
+
+        if provider is None:
+            provider = Gtk.CssProvider()
+            provider.connect("parsing-error", raise_css_parsing_error)
+            provider.load_from_string(key[0])
+            self._providers[key] = provider
+
+        self._unused.pop(key, None)
+        self._refcounts[key] = self._refcounts.get(key, 0) + 1
+        return provider
+
+    def release(self, key: _StyleKey) -> None:
+        refcount = self._refcounts.get(key, 0) - 1
+        if refcount > 0:
+            self._refcounts[key] = refcount
+            return
+
+        self._refcounts.pop(key, None)
+        self._unused[key] = None
+
+        while len(self._unused) > self.MAX_UNUSED:
+            unused_key, _ = self._unused.popitem(last=False)
+            self._providers.pop(unused_key, None)
+
+
+_style_cache = _StyleProviderCache()
+
+
 class BaseWidget(Gtk.Widget, IgnisGObject):
     """
     Bases: :class:`~ignis.gobject.IgnisGObject`.
@@ -38,7 +88,15 @@ class BaseWidget(Gtk.Widget, IgnisGObject):
         Gtk.Widget.__init__(self)
 
         self._style: str | None = None
-        self._css_provider: Gtk.CssProvider | None = None
+        self._css_vars: dict[str, Any] = {}
+        self._css_class_states: dict[str, bool] = {}
+        # cache key and provider of the current style
+        self._style_entry: tuple[_StyleKey, Gtk.CssProvider] | None = None
+        # values of css_vars change often and rarely repeat (e.g., an animated level),
+        # so they have their own provider, which is reloaded instead of interning a provider per value
+        self._css_vars_provider: Gtk.CssProvider | None = None
+        self._css_vars_css: str | None = None
+        self._css_destroy_handler: int | None = None
         self._style_priority: StylePriority = (
             app.widgets_style_priority if style_priority is None else style_priority
         )
@@ -61,25 +119,152 @@ class BaseWidget(Gtk.Widget, IgnisGObject):
 
     @style.setter
     def style(self, value: str) -> None:
-        if self._css_provider:
-            with ignore_deprecation_warnings():
-                self.get_style_context().remove_provider(self._css_provider)
-
         if "{" not in value and "}" not in value:
             value = "* {" + value + "}"
 
-        css_provider = Gtk.CssProvider()
-        css_provider.connect("parsing-error", raise_css_parsing_error)
+        self.__set_style_css(value)
+        self._style = value
+
+    @IgnisProperty
+    def css_vars(self) -> dict[str, Any]:
+        """
+        CSS custom properties (variables) for this widget, e.g., ``{"level": "50%"}``.
+        Names are prefixed with ``--`` automatically if needed.
+
+        Custom properties are inherited, so they can be used in styles of this widget
+        and its children with ``var()``, e.g., in the application stylesheet.
+        Unlike :attr:`style`, a stylesheet is written once and only values change.
+        The widget keeps a single provider for its variables, and a change reloads only this provider,
+        which contains just the variable declarations (the stylesheet using them is not parsed again).
+        Setting the same values again does nothing.
 
-        css_provider.load_from_string(value)
+        Requires GTK 4.16 or higher.
 
-        with ignore_deprecation_warnings():
-            self.get_style_context().add_provider(
-                css_provider, GTK_STYLE_PRIORITIES[self._style_priority]
+        .. code-block:: python
+
+            from ignis import widgets
+            from ignis.services.audio import AudioService
+
+            audio = AudioService.get_default()
+
+            widgets.Box(
+                css_classes=["volume-bar"],
+                css_vars=audio.speaker.bind("volume", lambda value: {"level": f"{round(value)}%"}),
             )
 
-        self._css_provider = css_provider
-        self._style = value
+        .. code-block:: css
+
+            .volume-bar {
+                background: linear-gradient(to right, @accent_color var(--level), transparent var(--level));
+            }
+        """
+        return self._css_vars
+
+    @css_vars.setter
+    def css_vars(self, value: dict[str, Any] | None) -> None:
+        if not value:
+            if self._css_vars_provider is not None:
+                with ignore_deprecation_warnings():
+                    self.get_style_context().remove_provider(self._css_vars_provider)
+                self._css_vars_provider = None
+                self._css_vars_css = None
+
+            self._css_vars = {}
+            return
+
+        declarations = "".join(
+            f"{name if name.startswith('--') else '--' + name}: {var_value};"
+            for name, var_value in value.items()
+        )
+        css = "* {" + declarations + "}"
+
+        if css != self._css_vars_css:
+            if self._css_vars_provider is None:
+                self._css_vars_provider = Gtk.CssProvider()
+                self._css_vars_provider.connect(
+                    "parsing-error", raise_css_parsing_error
+                )
+                with ignore_deprecation_warnings():
+                    self.get_style_context().add_provider(
+                        self._css_vars_provider,
+                        GTK_STYLE_PRIORITIES[self._style_priority],
+                    )
+
+            self._css_vars_provider.load_from_string(css)
+            self._css_vars_css = css
+
+        self._css_vars = dict(value)
+
+    @IgnisProperty
+    def css_class_states(self) -> dict[str, bool]:
+        """
+        A mapping of CSS class names to whether the class is applied to this widget.
+
+        Classes are added and removed without touching the CSS parser, so it is the cheapest way to switch between styles defined in a stylesheet.
+        Classes that were in the previous mapping but are missing from the new one are removed.
+        Other CSS classes of the widget are not affected.
+
+        .. code-block:: python
+
+            from ignis import widgets
+            from ignis.services.upower import UPowerService
+
+            battery = UPowerService.get_default().display_device
+
+            widgets.Label(
+                css_classes=["battery"],
+                label=battery.bind("percent", lambda value: f"{value:.0f}%"),
+                css_class_states=battery.bind_many(
+                    ["percent", "charging"],
+                    lambda percent, charging: {"low": percent < 20 and not charging, "charging": charging},
+                ),
+            )
+        """
+        return self._css_class_states
+
+    @css_class_states.setter
+    def css_class_states(self, value: dict[str, bool] | None) -> None:
+        value = value or {}
+
+        for name in self._css_class_states.keys() - value.keys():
+            self.remove_css_class(name)
+
+        for name, enabled in value.items():
+            if enabled:
+                self.add_css_class(name)
+            else:
+                self.remove_css_class(name)
+
+        self._css_class_states = dict(value)
+
+    def __set_style_css(self, css: str | None) -> None:
+        current = self._style_entry
+        key = (css, self._style_priority) if css is not None else None
+
+        if current is not None and current[0] == key:
+            return
+
+        if key is not None:
+            css_provider = _style_cache.acquire(key)
+
+            with ignore_deprecation_warnings():
+                self.get_style_context().add_provider(
+                    css_provider, GTK_STYLE_PRIORITIES[self._style_priority]
+                )
+
+            self._style_entry = (key, css_provider)
+
+            if self._css_destroy_handler is None:
+                self._css_destroy_handler = self.connect(
+                    "destroy", lambda *_: self.__set_style_css(None)
+                )
+        else:
+            self._style_entry = None
+
+        if current is not None:
+            with ignore_deprecation_warnings():
+                self.get_style_context().remove_provider(current[1])
+            _style_cache.release(current[0])
 
     @IgnisProperty
     def style_priority(self) -> StylePriority:
@@ -8,9 +8,18 @@ from ignis.exceptions import WindowNotFoundError
 from typing import Any
 from gi.repository import GLib  # type: ignore
 from ignis import is_editable_install
+from ignis import _startup_profiler
 
 DEFAULT_CONFIG_PATH = f"{GLib.get_user_config_dir()}/ignis/config.py"
 
+BATCH_OPERATIONS = (
+    "open-window",
+    "close-window",
+    "toggle-window",
+    "run-python",
+    "run-file",
+)
+
 
 class OrderedGroup(click.Group):
     def __init__(self, name=None, commands=None, **attrs):
@@ -116,8 +125,28 @@ def cli():
     metavar="PATH",
 )
 @click.option("--debug", help="Print debug information to the terminal.", is_flag=True)
-def init(config: str, debug: bool) -> None:
-    from ignis.app import run_app
+@click.option(
+    "--profile-startup",
+    help="Print startup phase timings once the first frame is rendered.",
+    is_flag=True,
+)
+@click.option(
+    "--profile-output",
+    help="Run cProfile until the first frame is rendered and save pstats to this file (implies --profile-startup).",
+    default=None,
+    type=str,
+    metavar="PATH",
+)
+def init(
+    config: str, debug: bool, profile_startup: bool, profile_output: str | None
+) -> None:
+    if profile_startup or profile_output:
+        _startup_profiler.enable(
+            get_full_path(profile_output) if profile_output else None
+        )
+
+    with _startup_profiler.phase("import ignis.app"):
+        from ignis.app import run_app
 
     client = IgnisClient()
 
@@ -157,8 +186,17 @@ def list_windows() -> None:
     name="run-python", help="Execute a Python code inside the running Ignis process."
 )
 @click.argument("code")
-def run_python(code: str) -> None:
-    call_client_func("run_python", code)
+@click.option(
+    "--print-result",
+    "-p",
+    help="Wait for the code to finish and print the value of its last expression (awaited if it's a coroutine).",
+    is_flag=True,
+)
+def run_python(code: str, print_result: bool) -> None:
+    if print_result:
+        print(call_client_func("eval_python", code))
+    else:
+        call_client_func("run_python", code)
 
 
 @cli.command(
@@ -174,6 +212,45 @@ def inspector() -> None:
     call_client_func("inspector")
 
 
+@cli.command(
+    name="batch",
+    help="""Run several operations in a single call, e.g.:
+    ignis batch toggle-window bar-0 toggle-window bar-1 run-python "print(1)".
+    Supported operations: open-window, close-window, toggle-window, run-python, run-file.""",
+)
+@click.argument("operations", nargs=-1, required=True)
+def batch(operations: tuple[str, ...]) -> None:
+    if len(operations) % 2 != 0:
+        raise click.UsageError("Each operation must be followed by its argument.")
+
+    pairs = []
+    for operation, argument in zip(operations[::2], operations[1::2], strict=True):
+        if operation not in BATCH_OPERATIONS:
+            raise click.UsageError(f"Unknown operation: {operation}")
+        if operation == "run-file":
+            argument = get_full_path(argument)
+        pairs.append((operation.replace("-", "_"), argument))
+
+    results = call_client_func("batch", pairs)
+
+    failed = False
+    for (operation, argument), (success, message) in zip(pairs, results, strict=True):
+        if not success:
+            failed = True
+            print(f"{operation} {argument}: {message}")
+
+    if failed:
+        exit(1)
+
+
+@cli.command(
+    name="startup-report", help="Print startup phase timings of the running Ignis."
+)
+def startup_report() -> None:
+    phases = call_client_func("startup_report")
+    print(_startup_profiler.format_report(phases))
+
+
 @cli.command(name="reload", help="Reload Ignis.")
 def reload() -> None:
     call_client_func("reload")
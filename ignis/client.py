@@ -103,6 +103,21 @@ class IgnisClient:
         """
         self.__call_dbus_method("RunPython", "(s)", code)
 
+    def eval_python(self, code: str) -> str:
+        """
+        Run a Python code inside the Ignis process and get the result.
+
+        If the last statement of the code is an expression, its value is the result.
+        If the value is awaitable (e.g., a coroutine), it is awaited first.
+
+        Args:
+            code: The Python code to execute.
+
+        Returns:
+            str: The result converted to a string, or an empty string if the result is ``None``.
+        """
+        return self.__call_dbus_method("EvalPython", "(s)", code)
+
     def run_file(self, path: str) -> None:
         """
         Run a Python file inside Ignis daemon.
@@ -112,6 +127,49 @@ class IgnisClient:
         """
         self.__call_dbus_method("RunFile", "(s)", path)
 
+    def batch(self, operations: list[tuple[str, str]]) -> list[tuple[bool, str]]:
+        """
+        Run several operations in a single D-Bus call.
+        Operations are run in order; a failed operation doesn't stop the rest.
+
+        Supported operations (the argument is in parentheses):
+
+        - ``"open_window"`` (window name)
+        - ``"close_window"`` (window name)
+        - ``"toggle_window"`` (window name)
+        - ``"run_python"`` (Python code)
+        - ``"run_file"`` (path to a Python file)
+
+        Args:
+            operations: A list of ``(operation, argument)`` tuples.
+
+        Returns:
+            list[tuple[bool, str]]: A ``(success, error message)`` tuple for each operation.
+
+        .. code-block:: python
+
+            from ignis.client import IgnisClient
+
+            client = IgnisClient()
+            results = client.batch(
+                [
+                    ("toggle_window", "bar-0"),
+                    ("toggle_window", "bar-1"),
+                    ("run_python", "print('switched')"),
+                ]
+            )
+        """
+        return self.__call_dbus_method("Batch", "(a(ss))", operations)
+
+    def startup_report(self) -> list[tuple[str, float, float]]:
+        """
+        Get the startup phase timings of the running Ignis process.
+
+        Returns:
+            list[tuple[str, float, float]]: A list of ``(name, start, duration)`` tuples, in milliseconds since the start of the Ignis import.
+        """
+        return self.__call_dbus_method("StartupReport")
+
     def reload(self) -> None:
         """
         Same as :func:`~ignis.app.IgnisApp.reload`.
@@ -1,7 +1,13 @@
+import os
+import time
 import asyncio
+import inspect
+import threading
+from contextlib import contextmanager
 from gi.repository import Gio, GLib  # type: ignore
 from typing import Any, overload
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from loguru import logger
 from ignis import utils
 from ignis.gobject import IgnisGObject, IgnisProperty
 from ignis.exceptions import DBusMethodNotFoundError, DBusPropertyNotFoundError
@@ -9,6 +15,70 @@ from typing import Literal
 
 BUS_TYPE = {"session": Gio.BusType.SESSION, "system": Gio.BusType.SYSTEM}
 
+_audit_sync_calls: bool = os.getenv("IGNIS_AUDIT_SYNC_DBUS") == "1"
+
+
+def set_sync_call_audit(enabled: bool) -> None:
+    """
+    Enable or disable auditing of synchronous D-Bus calls.
+
+    When enabled, every synchronous D-Bus call made by :class:`DBusProxy` on the main thread
+    is logged as a warning, along with the time it blocked the main loop.
+    Useful for finding what slows down startup or causes UI freezes.
+
+    Can also be enabled by setting the ``IGNIS_AUDIT_SYNC_DBUS=1`` environment variable.
+
+    Args:
+        enabled: Whether to enable auditing.
+    """
+    global _audit_sync_calls
+    _audit_sync_calls = enabled
+
+
+# Unpacking may take a while for large variants (e.g., pixbufs in notifications and tray icons),
+# so it is done in a small shared pool instead of a new thread per call.
+_UNPACK_POOL_NAME = "dbus-unpack"
+_UNPACK_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+# Variants smaller than this (in bytes) are unpacked directly on the calling thread,
+# for them a thread hop costs more than the unpacking itself.
+_INLINE_UNPACK_MAX_SIZE = 4096
+
+
+def _should_unpack_inline(variant: GLib.Variant) -> bool:
+    # the size matters, not the type: a single string can be large too
+    return variant.get_size() <= _INLINE_UNPACK_MAX_SIZE
+
+
+async def _unpack_async(variant: GLib.Variant, unpack: Callable[[], Any]) -> Any:
+    if _should_unpack_inline(variant):
+        return unpack()
+
+    return await _get_unpack_pool().run_async(unpack)
+
+
+def _get_unpack_pool() -> utils.ThreadPool:
+    return utils.get_thread_pool(_UNPACK_POOL_NAME, max_workers=_UNPACK_POOL_SIZE)
+
+
+@contextmanager
+def _audit_sync_call(description: str) -> Iterator[None]:
+    if (
+        not _audit_sync_calls
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.warning(
+            f"Synchronous D-Bus call on the main thread: {description} ({elapsed:.2f} ms)"
+        )
+
 
 class DBusService(IgnisGObject):
     """
@@ -154,18 +224,57 @@ class DBusService(IgnisGObject):
     ) -> None:
         def callback(func: Callable, unpacked_params) -> None:
             result = func(invocation, *unpacked_params)
+            if inspect.isawaitable(result):
+                asyncio.ensure_future(self.__return_async(invocation, result))
+                return
             invocation.return_value(result)
 
         func = self._methods.get(method_name, None)
         if not func:
             raise DBusMethodNotFoundError(method_name)
 
+        if _should_unpack_inline(params):
+            callback(func, params.unpack())
+            return
+
         # params can contain pixbuf, very large amount of data
         # and unpacking may take some time and block the main thread
-        # so we unpack in another thread, and call DBus method when unpacking is finished
-        utils.ThreadTask(
-            target=params.unpack, callback=lambda result: callback(func, result)
-        ).run()
+        # so we unpack in the pool, and call DBus method on the main thread when unpacking is finished
+        def on_unpacked(future) -> None:
+            try:
+                unpacked_params = future.result()
+            except Exception as e:
+                logger.opt(exception=e).error(
+                    f"Failed to unpack parameters of D-Bus method {method_name}"
+                )
+                # reply anyway, otherwise the caller waits until its timeout
+                GLib.idle_add(
+                    invocation.return_dbus_error,
+                    "org.freedesktop.DBus.Error.InvalidArgs",
+                    f"{type(e).__name__}: {e}",
+                )
+                return
+
+            GLib.idle_add(callback, func, unpacked_params)
+
+        future = _get_unpack_pool().submit(params.unpack)
+        future.add_done_callback(on_unpacked)
+
+    async def __return_async(
+        self, invocation: Gio.DBusMethodInvocation, result: Any
+    ) -> None:
+        try:
+            value = await result
+        except Exception as e:
+            logger.opt(exception=e).error(
+                f"D-Bus method {invocation.get_method_name()} raised an exception"
+            )
+            invocation.return_dbus_error(
+                "org.freedesktop.DBus.Error.Failed", f"{type(e).__name__}: {e}"
+            )
+            return
+
+        invocation.return_value(value)
 
     def __handle_get_property(
         self,
@@ -193,6 +302,7 @@ class DBusService(IgnisGObject):
             - Must accept :class:`Gio.DBusMethodInvocation` as the first argument.
             - Must accept all other arguments typical for this method (specified by interface info).
             - Must return :class:`GLib.Variant` or ``None``, as specified by interface info.
+            - Can be a coroutine function, in which case the reply is sent when it finishes. If it raises an exception, the caller gets a D-Bus error.
         """
         self._methods[name] = method
 
@@ -291,6 +401,9 @@ class DBusProxy(IgnisGObject):
 
         self._gproxy = gproxy
 
+        self._cached_properties: dict[str, Any] = {}
+        self._cache_handler_id: int | None = None
+
         for method in self.info.methods:
             self._methods.append(method.name)
 
@@ -316,15 +429,16 @@ class DBusProxy(IgnisGObject):
             info: A :class:`Gio.DBusInterfaceInfo` instance. You can get it from XML using :class:`~ignis.utils.utils.load_interface_xml`.
             bus_type: The type of the bus.
         """
-        gproxy = Gio.DBusProxy.new_for_bus_sync(
-            BUS_TYPE[bus_type],
-            Gio.DBusProxyFlags.NONE,
-            info,
-            name,
-            object_path,
-            interface_name,
-            None,
-        )
+        with _audit_sync_call(f"new proxy {name} {object_path} {interface_name}"):
+            gproxy = Gio.DBusProxy.new_for_bus_sync(
+                BUS_TYPE[bus_type],
+                Gio.DBusProxyFlags.NONE,
+                info,
+                name,
+                object_path,
+                interface_name,
+                None,
+            )
         return cls(bus_type=bus_type, gproxy=gproxy)
 
     @classmethod
@@ -425,6 +539,25 @@ class DBusProxy(IgnisGObject):
         """
         return self._properties
 
+    @IgnisProperty
+    def cached_properties(self) -> dict[str, Any]:
+        """
+        A dictionary of unpacked D-Bus property values, keyed by D-Bus property name.
+
+        The cache is empty until :func:`get_all_dbus_properties` or :func:`get_all_dbus_properties_async` is called.
+        After that, it is kept up to date from the ``PropertiesChanged`` D-Bus signal,
+        so reading it doesn't require a D-Bus call.
+        Invalidated properties are fetched again automatically.
+
+        .. hint::
+            You can connect to ``notify::cached-properties`` to be notified when the cache changes.
+
+        .. note::
+            Some interfaces (e.g., ``org.kde.StatusNotifierItem``) do not emit ``PropertiesChanged``.
+            For them, call :func:`get_all_dbus_properties_async` again to refresh the cache.
+        """
+        return self._cached_properties
+
     @IgnisProperty
     def has_owner(self) -> bool:
         """
@@ -444,7 +577,7 @@ class DBusProxy(IgnisGObject):
             return await self.call_async(name.replace("Async", ""), *args, **kwargs)
 
         if name in self.methods:
-            return getattr(self._gproxy, name)
+            return self.__get_sync_method(name)
         elif name.endswith("Async") and name.replace("Async", "") in self.methods:
             return async_method_wrapper
         elif name in self.properties:
@@ -458,6 +591,18 @@ class DBusProxy(IgnisGObject):
         else:
             return super().__setattr__(name, value)
 
+    def __get_sync_method(self, name: str) -> Callable:
+        method = getattr(self._gproxy, name)
+
+        if not _audit_sync_calls:
+            return method
+
+        def audited_method(*args, **kwargs):
+            with _audit_sync_call(f"{self.name} {self.interface_name}.{name}"):
+                return method(*args, **kwargs)
+
+        return audited_method
+
     def signal_subscribe(
         self,
         signal_name: str,
@@ -517,13 +662,14 @@ class DBusProxy(IgnisGObject):
         Returns:
             The returned data from the D-Bus method.
         """
-        variant = self._gproxy.call_sync(
-            method_name=method_name,
-            parameters=self.__get_variant(signature, *args) if signature else None,
-            flags=flags,
-            timeout_msec=timeout,
-            cancellable=None,
-        )
+        with _audit_sync_call(f"{self.name} {self.interface_name}.{method_name}"):
+            variant = self._gproxy.call_sync(
+                method_name=method_name,
+                parameters=self.__get_variant(signature, *args) if signature else None,
+                flags=flags,
+                timeout_msec=timeout,
+                cancellable=None,
+            )
         return variant.unpack()
 
     async def call_async(
@@ -553,7 +699,7 @@ class DBusProxy(IgnisGObject):
             timeout_msec=timeout,
         )
 
-        return await asyncio.to_thread(lambda: variant.unpack())
+        return await _unpack_async(variant, variant.unpack)
 
     @overload
     def get_dbus_property(
@@ -578,20 +724,23 @@ class DBusProxy(IgnisGObject):
             The value of the D-Bus property or :class:`GLib.Variant`.
         """
         try:
-            variant = self.connection.call_sync(
-                self.name,
-                self.object_path,
-                "org.freedesktop.DBus.Properties",
-                "Get",
-                GLib.Variant(
-                    "(ss)",
-                    (self.interface_name, property_name),
-                ),
-                None,
-                Gio.DBusCallFlags.NONE,
-                -1,
-                None,
-            )
+            with _audit_sync_call(
+                f"{self.name} Get {self.interface_name}.{property_name}"
+            ):
+                variant = self.connection.call_sync(
+                    self.name,
+                    self.object_path,
+                    "org.freedesktop.DBus.Properties",
+                    "Get",
+                    GLib.Variant(
+                        "(ss)",
+                        (self.interface_name, property_name),
+                    ),
+                    None,
+                    Gio.DBusCallFlags.NONE,
+                    -1,
+                    None,
+                )
 
             if unpack:
                 return variant[0]
@@ -639,8 +788,7 @@ class DBusProxy(IgnisGObject):
         )
 
         if unpack:
-            # unpack in thread
-            return await asyncio.to_thread(lambda: variant[0])
+            return await _unpack_async(variant, lambda: variant[0])
         else:
             return variant
 
@@ -652,20 +800,21 @@ class DBusProxy(IgnisGObject):
             property_name: The name of the property to set.
             value: The new value for the property.
         """
-        self.connection.call_sync(
-            self.name,
-            self.object_path,
-            "org.freedesktop.DBus.Properties",
-            "Set",
-            GLib.Variant(
-                "(ssv)",
-                (self.interface_name, property_name, value),
-            ),
-            None,
-            Gio.DBusCallFlags.NONE,
-            -1,
-            None,
-        )
+        with _audit_sync_call(f"{self.name} Set {self.interface_name}.{property_name}"):
+            self.connection.call_sync(
+                self.name,
+                self.object_path,
+                "org.freedesktop.DBus.Properties",
+                "Set",
+                GLib.Variant(
+                    "(ssv)",
+                    (self.interface_name, property_name, value),
+                ),
+                None,
+                Gio.DBusCallFlags.NONE,
+                -1,
+                None,
+            )
 
     async def set_dbus_property_async(
         self, property_name: str, value: GLib.Variant
@@ -692,6 +841,92 @@ class DBusProxy(IgnisGObject):
             -1,
         )
 
+    def get_all_dbus_properties(self) -> dict[str, Any]:
+        """
+        Get the values of all D-Bus properties with a single ``org.freedesktop.DBus.Properties.GetAll`` call.
+        This also fills :attr:`cached_properties`.
+
+        Returns:
+            A dictionary of unpacked property values, keyed by D-Bus property name.
+
+        Raises:
+            GLib.Error: If the D-Bus call fails.
+        """
+        with _audit_sync_call(f"{self.name} GetAll {self.interface_name}"):
+            variant = self.connection.call_sync(
+                self.name,
+                self.object_path,
+                "org.freedesktop.DBus.Properties",
+                "GetAll",
+                GLib.Variant("(s)", (self.interface_name,)),
+                None,
+                Gio.DBusCallFlags.NONE,
+                -1,
+                None,
+            )
+
+        properties = variant[0]
+        self.__update_cache(properties)
+        return properties
+
+    async def get_all_dbus_properties_async(self) -> dict[str, Any]:
+        """
+        Asynchronously get the values of all D-Bus properties with a single ``org.freedesktop.DBus.Properties.GetAll`` call.
+        This also fills :attr:`cached_properties`.
+
+        Returns:
+            A dictionary of unpacked property values, keyed by D-Bus property name.
+
+        Raises:
+            GLib.Error: If the D-Bus call fails.
+        """
+        variant = await self.connection.call(
+            self.name,
+            self.object_path,
+            "org.freedesktop.DBus.Properties",
+            "GetAll",
+            GLib.Variant("(s)", (self.interface_name,)),
+            None,
+            Gio.DBusCallFlags.NONE,
+            -1,
+        )
+
+        properties = await _unpack_async(variant, lambda: variant[0])
+        self.__update_cache(properties)
+        return properties
+
+    def __update_cache(self, properties: dict[str, Any]) -> None:
+        self._cached_properties.update(properties)
+
+        if self._cache_handler_id is None:
+            self._cache_handler_id = self._gproxy.connect(
+                "g-properties-changed", self.__on_properties_changed
+            )
+
+        self.notify("cached-properties")
+
+    def __on_properties_changed(
+        self,
+        gproxy: Gio.DBusProxy,
+        changed_properties: GLib.Variant,
+        invalidated_properties: list[str],
+    ) -> None:
+        self._cached_properties.update(changed_properties.unpack())
+
+        for name in invalidated_properties:
+            self._cached_properties.pop(name, None)
+
+        self.notify("cached-properties")
+
+        if invalidated_properties:
+            asyncio.create_task(self.__refetch_invalidated())
+
+    async def __refetch_invalidated(self) -> None:
+        try:
+            await self.get_all_dbus_properties_async()
+        except GLib.Error:
+            pass
+
     def watch_name(
         self,
         on_name_appeared: Callable | None = None,
@@ -1,6 +1,7 @@
 import asyncio
 import weakref
-from gi.repository import Gtk, GLib  # type: ignore
+from typing import Any
+from gi.repository import Gtk, Gio, GLib  # type: ignore
 from ignis.dbus import DBusProxy
 from ignis import utils
 from ignis.gobject import IgnisProperty
@@ -9,9 +10,9 @@ from ignis.menu_model import (
     IgnisMenuItem,
     IgnisMenuSeparator,
     ItemsType,
+    MENU_ACTION_PREFIX,
 )
 
-
 DBUS_GET_LAYOUT_ARGS = (
     "(iias)",
     0,
@@ -28,6 +29,11 @@ DBUS_GET_LAYOUT_ARGS = (
     ],
 )
 
+# seconds to wait for more signals before updating the menu
+UPDATE_DELAY = 0.05
+# milliseconds after closing the menu, after which the loaded layout is dropped
+UNLOAD_TIMEOUT = 60_000
+
 
 class DBusMenuItem(IgnisMenuItem):
     """
@@ -49,9 +55,11 @@ class DBusMenuItem(IgnisMenuItem):
         super().__init__(
             label=label,
             enabled=enabled,
-            on_activate=lambda *_: asyncio.create_task(weak_self().__on_activate())  # type: ignore
-            if weak_self()
-            else None,
+            on_activate=lambda *_: (
+                asyncio.create_task(weak_self().__on_activate())  # type: ignore
+                if weak_self()
+                else None
+            ),
         )
 
     async def __on_activate(self) -> None:
@@ -71,6 +79,16 @@ class DBusMenu(Gtk.PopoverMenu):
     Like DbusmenuGtk3, but for GTK4.
 
     The bus must provide the ``com.canonical.dbusmenu`` D-Bus interface.
+
+    The menu is loaded on demand: the top level is fetched on the first :func:`popup`,
+    and each submenu is fetched right before it is opened.
+    The loaded layout is dropped after the menu has been closed for :obj:`UNLOAD_TIMEOUT` milliseconds.
+
+    The loaded part is updated incrementally:
+    ``ItemsPropertiesUpdated`` changes only the affected items,
+    ``LayoutUpdated`` refetches only the updated submenu,
+    and bursts of signals are coalesced into a single update.
+    Menu items (and their actions) are reused across updates.
     """
 
     def __init__(self, proxy: DBusProxy):
@@ -78,14 +96,32 @@ class DBusMenu(Gtk.PopoverMenu):
 
         self.__proxy = proxy
         self._menu_id: int = 0
-        self._model: IgnisMenuModel | None = None
 
+        # the layout tree, by item ID
+        self._properties: dict[int, dict[str, Any]] = {}
+        self._children: dict[int, list[int]] = {}
+        self._parents: dict[int, int | None] = {}
+        # IDs of items whose children have been fetched
+        self._loaded: set[int] = set()
+
+        self._menu_items: dict[int, DBusMenuItem] = {}
+        self._submenus: dict[int, IgnisMenuModel] = {}
+        self._submenu_actions: dict[int, Gio.SimpleAction] = {}
+
+        self._pending_layouts: set[int] = set()
+        self._dirty_menus: set[int] = set()
+        self._update_task: asyncio.Task | None = None
+        self._unload_timeout: utils.Timeout | None = None
+
+        self._model: IgnisMenuModel = self.__get_submenu(self._menu_id)
+        self.insert_action_group(MENU_ACTION_PREFIX, self._model.action_group)
+        self.set_menu_model(self._model.gmenu)
+
+        self.connect("closed", self.__on_closed)
+
+        self.__proxy.signal_subscribe("LayoutUpdated", self.__on_layout_updated)
         self.__proxy.signal_subscribe(
-            "LayoutUpdated", lambda *args: asyncio.create_task(self.__sync())
-        )
-        self.__proxy.signal_subscribe(
-            "ItemsPropertiesUpdated",
-            lambda *args: asyncio.create_task(self.__sync()),
+            "ItemsPropertiesUpdated", self.__on_items_properties_updated
         )
 
     @classmethod
@@ -105,10 +141,7 @@ class DBusMenu(Gtk.PopoverMenu):
             interface_name="com.canonical.dbusmenu",
             info=utils.load_interface_xml("com.canonical.dbusmenu"),
         )
-        obj = cls(proxy)
-        layout = proxy.GetLayout(*DBUS_GET_LAYOUT_ARGS)
-        obj._update_menu(layout)
-        return obj
+        return cls(proxy)
 
     @classmethod
     async def new_async(cls, name: str, object_path: str) -> "DBusMenu":
@@ -127,10 +160,7 @@ class DBusMenu(Gtk.PopoverMenu):
             interface_name="com.canonical.dbusmenu",
             info=utils.load_interface_xml("com.canonical.dbusmenu"),
         )
-        obj = cls(proxy)
-        layout = await proxy.GetLayoutAsync(*DBUS_GET_LAYOUT_ARGS)
-        obj._update_menu(layout)
-        return obj
+        return cls(proxy)
 
     @IgnisProperty
     def name(self) -> str:
@@ -146,41 +176,215 @@ class DBusMenu(Gtk.PopoverMenu):
         """
         return self.__proxy.object_path
 
-    def _update_menu(self, layout: list) -> None:
-        if self._model:
-            self._model.clean_gmenu()
-            self._model = None
+    def _update_menu(self, layout: tuple, depth: int = -1) -> None:
+        self.__apply_layout(layout[1], depth)
+        self.__rebuild_dirty_menus()
 
-        self._menu_id = layout[1][0]
-
-        items = layout[1][2]
-        contents = self.__parse(items=items)
+    async def __load(self, item_id: int) -> None:
+        try:
+            (need_update,) = await self.__proxy.AboutToShowAsync("(i)", item_id)
+        except GLib.Error:
+            need_update = False
 
-        self._model = IgnisMenuModel(*contents)
-        self.set_menu_model(self._model.gmenu)
+        if item_id in self._loaded and not need_update:
+            return
 
-    async def __sync(self) -> None:
         try:
-            layout = await self.__proxy.GetLayoutAsync(*DBUS_GET_LAYOUT_ARGS)
+            layout = await self.__proxy.GetLayoutAsync(
+                "(iias)", item_id, 1, DBUS_GET_LAYOUT_ARGS[3]
+            )
         except GLib.Error:
             return
 
-        if not layout:
+        if layout:
+            self._update_menu(layout, depth=1)
+
+    def __on_closed(self, *args) -> None:
+        self.__cancel_unload()
+        self._unload_timeout = utils.Timeout(UNLOAD_TIMEOUT, self.__unload)
+
+    def __cancel_unload(self) -> None:
+        if self._unload_timeout:
+            self._unload_timeout.cancel()
+            self._unload_timeout = None
+
+    def __unload(self) -> None:
+        self._unload_timeout = None
+
+        self._properties.clear()
+        self._children.clear()
+        self._parents.clear()
+        self._loaded.clear()
+        self._pending_layouts.clear()
+        self._dirty_menus.clear()
+
+        self._model.items = []
+        self.__remove_unused()
+
+    def __on_layout_updated(self, *args) -> None:
+        parent = args[5].unpack()[1]
+
+        # not loaded submenus are fetched when they are opened
+        if parent not in self._loaded:
+            return
+
+        self._pending_layouts.add(parent)
+        self.__schedule_update()
+
+    def __on_items_properties_updated(self, *args) -> None:
+        updated_props, removed_props = args[5].unpack()
+
+        changes: dict[int, set[str]] = {}
+
+        for item_id, props in updated_props:
+            if item_id in self._properties:
+                self._properties[item_id].update(props)
+                changes.setdefault(item_id, set()).update(props)
+
+        for item_id, names in removed_props:
+            if item_id in self._properties:
+                for name in names:
+                    self._properties[item_id].pop(name, None)
+                changes.setdefault(item_id, set()).update(names)
+
+        for item_id, names in changes.items():
+            names = names.intersection(DBUS_GET_LAYOUT_ARGS[3])
+            if not names:
+                continue
+
+            item = self._menu_items.get(item_id, None)
+            if item and names == {"enabled"}:
+                # no need to rebuild the menu, the action of the item is just enabled/disabled
+                item.enabled = self._properties[item_id].get("enabled", True)
+            else:
+                parent = self._parents.get(item_id, None)
+                self._dirty_menus.add(self._menu_id if parent is None else parent)
+
+        if self._dirty_menus:
+            self.__schedule_update()
+
+    def __schedule_update(self) -> None:
+        if self._update_task is None:
+            self._update_task = asyncio.create_task(self.__update())
+
+    async def __update(self) -> None:
+        try:
+            # signals received while fetching layouts are handled by the next iteration
+            while self._pending_layouts or self._dirty_menus:
+                await asyncio.sleep(UPDATE_DELAY)
+
+                parents = self.__get_outermost(self._pending_layouts)
+                self._pending_layouts = set()
+
+                for parent in parents:
+                    try:
+                        layout = await self.__proxy.GetLayoutAsync(
+                            "(iias)", parent, 1, DBUS_GET_LAYOUT_ARGS[3]
+                        )
+                    except GLib.Error:
+                        continue
+
+                    # the menu may have been unloaded while fetching
+                    if layout and parent in self._loaded:
+                        self._update_menu(layout, depth=1)
+
+                self.__rebuild_dirty_menus()
+        finally:
+            self._update_task = None
+
+    def __get_outermost(self, item_ids: set[int]) -> list[int]:
+        # refetching an ancestor marks its submenus as not loaded, so they are fetched again on opening
+        result = []
+        for item_id in item_ids:
+            parent = self._parents.get(item_id, None)
+            while parent is not None and parent not in item_ids:
+                parent = self._parents.get(parent, None)
+
+            if parent is None:
+                result.append(item_id)
+
+        return result
+
+    def __get_subtree(self, item_id: int) -> list[int]:
+        result = []
+        for child_id in self._children.get(item_id, []):
+            result.append(child_id)
+            result.extend(self.__get_subtree(child_id))
+        return result
+
+    def __is_submenu(self, item_id: int) -> bool:
+        if self._children.get(item_id):
+            return True
+
+        # children of not loaded submenus are unknown
+        return (
+            self._properties.get(item_id, {}).get("children-display", None) == "submenu"
+        )
+
+    def __apply_layout(self, layout: tuple, depth: int) -> None:
+        item_id = layout[0]
+        old_ids = set(self.__get_subtree(item_id))
+        old_properties = self._properties.get(item_id, None)
+        was_submenu = self.__is_submenu(item_id)
+
+        new_ids: set[int] = set()
+        self.__store_layout(layout, self._parents.get(item_id, None), depth, new_ids)
+
+        for removed_id in old_ids - new_ids:
+            self._properties.pop(removed_id, None)
+            self._children.pop(removed_id, None)
+            self._parents.pop(removed_id, None)
+            self._loaded.discard(removed_id)
+
+        self._dirty_menus.update(i for i in new_ids if self.__is_submenu(i))
+        self._dirty_menus.add(item_id)
+
+        # the parent shows the label of this submenu, and may need to show it as an item instead
+        parent = self._parents.get(item_id, None)
+        if parent is not None and (
+            old_properties != self._properties[item_id]
+            or was_submenu != self.__is_submenu(item_id)
+        ):
+            self._dirty_menus.add(parent)
+
+    def __store_layout(
+        self, layout: tuple, parent: int | None, depth: int, new_ids: set[int]
+    ) -> None:
+        item_id, props, children = layout
+
+        self._properties[item_id] = dict(props)
+        self._parents[item_id] = parent
+        new_ids.add(item_id)
+
+        if depth == 0:
+            # children were not fetched, keep the known ones, but fetch them again on opening
+            new_ids.update(self.__get_subtree(item_id))
+            self._loaded.discard(item_id)
             return
 
-        self._update_menu(layout)
+        self._children[item_id] = [child[0] for child in children]
+        self._loaded.add(item_id)
+
+        for child in children:
+            self.__store_layout(child, item_id, depth - 1, new_ids)
+
+    def __rebuild_dirty_menus(self) -> None:
+        dirty_menus = self._dirty_menus
+        self._dirty_menus = set()
+
+        for item_id in dirty_menus:
+            if item_id == self._menu_id or self.__is_submenu(item_id):
+                self.__get_submenu(item_id).items = self.__get_contents(item_id)
 
-    def __parse(self, items: tuple) -> list:
+        self.__remove_unused()
+
+    def __get_contents(self, parent: int) -> ItemsType:
         contents: ItemsType = []
 
-        for i in items:
-            item_id = i[0]
-            data_dict = i[1]
-            child = i[2]
+        for item_id in self._children.get(parent, []):
+            data_dict = self._properties[item_id]
 
             visible = data_dict.get("visible", True)
-            enabled = data_dict.get("enabled", True)
-            label = data_dict.get("label", None)
             type_ = data_dict.get("type", None)
 
             if type_ == "separator":
@@ -188,21 +392,85 @@ class DBusMenu(Gtk.PopoverMenu):
                 continue
 
             if visible:
-                if child != []:
-                    submenu_contents = self.__parse(items=child)
-                    contents.append(IgnisMenuModel(*submenu_contents, label=label))
+                if self.__is_submenu(item_id):
+                    contents.append(self.__get_submenu(item_id))
                 else:
-                    contents.append(
-                        DBusMenuItem(
-                            proxy=self.__proxy,
-                            item_id=item_id,
-                            enabled=enabled,
-                            label=label,
-                        )
-                    )
+                    contents.append(self.__get_menu_item(item_id))
 
         return contents
 
+    def __get_submenu(self, item_id: int) -> IgnisMenuModel:
+        label = self._properties.get(item_id, {}).get("label", None)
+
+        submenu = self._submenus.get(item_id, None)
+        if submenu is None:
+            submenu = IgnisMenuModel(label=label)
+            self._submenus[item_id] = submenu
+
+            if item_id != self._menu_id:
+                submenu.submenu_action = self.__create_submenu_action(item_id)
+        else:
+            submenu.label = label
+
+        return submenu
+
+    def __create_submenu_action(self, item_id: int) -> str:
+        action = Gio.SimpleAction.new_stateful(
+            f"submenu-{item_id}", None, GLib.Variant("b", False)
+        )
+        action.connect("change-state", self.__on_submenu_change_state, item_id)
+        self._model.action_group.add_action(action)
+        self._submenu_actions[item_id] = action
+        return f"{MENU_ACTION_PREFIX}.{action.get_name()}"
+
+    def __on_submenu_change_state(
+        self, action: Gio.SimpleAction, value: GLib.Variant, item_id: int
+    ) -> None:
+        if not value.get_boolean():
+            action.set_state(value)
+            return
+
+        async def load() -> None:
+            await self.__load(item_id)
+            # GTK shows the submenu only now, when its items are ready
+            action.set_state(value)
+
+        asyncio.create_task(load())
+
+    def __get_menu_item(self, item_id: int) -> "DBusMenuItem":
+        data_dict = self._properties[item_id]
+        label = data_dict.get("label", None)
+        enabled = data_dict.get("enabled", True)
+
+        item = self._menu_items.get(item_id, None)
+        if item is None:
+            item = DBusMenuItem(
+                proxy=self.__proxy,
+                item_id=item_id,
+                enabled=enabled,
+                label=label,
+            )
+            self._menu_items[item_id] = item
+        else:
+            item.label = label
+            item.enabled = enabled
+
+        return item
+
+    def __remove_unused(self) -> None:
+        for item_id in list(self._menu_items):
+            if item_id not in self._properties or self.__is_submenu(item_id):
+                self._menu_items.pop(item_id)._destroy()
+
+        for item_id in list(self._submenus):
+            if item_id == self._menu_id:
+                continue
+
+            if item_id not in self._properties or not self.__is_submenu(item_id):
+                self._submenus.pop(item_id).items = []
+                action = self._submenu_actions.pop(item_id)
+                self._model.action_group.remove_action(action.get_name())
+
     def __copy__(self):
         return self.copy()
 
@@ -225,8 +493,9 @@ class DBusMenu(Gtk.PopoverMenu):
         return await DBusMenu.new_async(self.__proxy.name, self.__proxy.object_path)
 
     def popup(self) -> None:
-        try:
-            self.__proxy.AboutToShow("(i)", self._menu_id)
-        except GLib.Error:
-            pass
-        return super().popup()
+        self.__cancel_unload()
+        asyncio.create_task(self.__popup())
+
+    async def __popup(self) -> None:
+        await self.__load(self._menu_id)
+        super().popup()
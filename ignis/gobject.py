@@ -63,6 +63,7 @@ class IgnisGObject(GObject.Object):
 
     def __init__(self, **kwargs):
         super().__init__()
+        self._binding_handlers: list[tuple[GObject.Object, int]] = []
         for key in kwargs.keys():
             self.set_property(key, kwargs[key])
 
@@ -148,10 +149,44 @@ class IgnisGObject(GObject.Object):
             self.set_property(source_property, value)
 
         for target_property in target_properties:
-            target.connect(f"notify::{target_property.replace('_', '-')}", callback)
+            handler_id = target.connect(
+                f"notify::{target_property.replace('_', '-')}", callback
+            )
+            self._binding_handlers.append((target, handler_id))
+
+        if isinstance(target, IgnisGObject):
+            target._on_bound(self)
 
         callback()
 
+    def _disconnect_bindings(self) -> None:
+        """
+        :meta private:
+        """
+        # Long-lived targets (e.g., services) hold references to the binding callbacks,
+        # so bindings must be disconnected explicitly when ``self`` is no longer used.
+        for target, handler_id in self._binding_handlers:
+            if target.handler_is_connected(handler_id):
+                target.disconnect(handler_id)
+
+        for target in {target for target, _ in self._binding_handlers}:
+            if isinstance(target, IgnisGObject):
+                target._on_unbound(self)
+
+        self._binding_handlers.clear()
+
+    def _on_bound(self, consumer: GObject.Object) -> None:
+        """
+        :meta private:
+        """
+        # Called when a property of ``consumer`` is bound to a property of ``self``.
+        # Sources can override it to track who uses their values (e.g., Poll pauses when its widgets are hidden).
+
+    def _on_unbound(self, consumer: GObject.Object) -> None:
+        """
+        :meta private:
+        """
+
     def bind(self, property_name: str, transform: Callable | None = None) -> Binding:
         """
         Creates ``Binding`` from property name on ``self``.
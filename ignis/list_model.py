@@ -0,0 +1,179 @@
+import threading
+from functools import wraps
+from gi.repository import Gio, GLib, GObject  # type: ignore
+from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from .gobject import IgnisGObject, IgnisProperty
+
+
+def _in_main_thread(func: Callable) -> Callable:
+    # Consumers of a Gio.ListModel (e.g., Gtk.ListView) read items synchronously in the "items-changed" handler,
+    # so a change and its signal must happen together, in the main thread.
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> None:
+        if threading.current_thread() is threading.main_thread():
+            func(*args, **kwargs)
+        else:
+            GLib.idle_add(lambda: func(*args, **kwargs) and False)
+
+    return wrapper
+
+
+class IgnisListModel(IgnisGObject, Gio.ListModel):
+    """
+    Bases: :class:`~ignis.gobject.IgnisGObject`, :class:`Gio.ListModel`
+
+    An observable list of objects.
+
+    On each change, it emits ``items-changed`` with the position and the number of removed and added items,
+    so consumers (e.g., :class:`~ignis.widgets.ListView`) update only the changed items instead of rebuilding everything.
+    Services expose their collections as list models too (e.g., :attr:`HyprlandService.windows_model <ignis.services.hyprland.HyprlandService.windows_model>`).
+
+    Changes made from a non-main thread are applied in the main thread (with ``GLib.idle_add``).
+
+    Args:
+        items: Initial items.
+        item_type: The type of items.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from ignis.list_model import IgnisListModel
+
+        model = IgnisListModel()
+        model.connect(
+            "items-changed",
+            lambda model, position, removed, added: print(position, removed, added),
+        )
+
+        model.append(obj1)  # 0 0 1
+        model.update([obj2, obj1])  # 0 0 1
+        model.remove(obj1)  # 1 1 0
+    """
+
+    def __init__(
+        self,
+        items: Iterable[GObject.Object] = (),
+        item_type: type[GObject.Object] = GObject.Object,
+    ):
+        super().__init__()
+        self._item_type = item_type
+        self._items: list[GObject.Object] = list(items)
+
+    def do_get_item_type(self) -> GObject.GType:
+        return self._item_type.__gtype__
+
+    def do_get_n_items(self) -> int:
+        return len(self._items)
+
+    def do_get_item(self, position: int) -> GObject.Object | None:
+        if 0 <= position < len(self._items):
+            return self._items[position]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items.copy())
+
+    def __getitem__(self, position: int) -> Any:
+        return self._items[position]
+
+    def __contains__(self, item: object) -> bool:
+        return any(i is item for i in self._items)
+
+    @IgnisProperty
+    def items(self) -> list[Any]:
+        """
+        A copy of the list of items.
+        """
+        return self._items.copy()
+
+    @_in_main_thread
+    def append(self, item: GObject.Object) -> None:
+        """
+        Append an item to the end of the list.
+
+        Args:
+            item: The item to append.
+        """
+        self._items.append(item)
+        self.__items_changed(len(self._items) - 1, 0, 1)
+
+    @_in_main_thread
+    def insert(self, position: int, item: GObject.Object) -> None:
+        """
+        Insert an item at the given position.
+
+        Args:
+            position: The position.
+            item: The item to insert.
+        """
+        position = max(0, min(position, len(self._items)))
+        self._items.insert(position, item)
+        self.__items_changed(position, 0, 1)
+
+    @_in_main_thread
+    def remove(self, item: GObject.Object) -> None:
+        """
+        Remove an item. Does nothing if the item is not in the list.
+
+        Args:
+            item: The item to remove.
+        """
+        for position, i in enumerate(self._items):
+            if i is item:
+                del self._items[position]
+                self.__items_changed(position, 1, 0)
+                return
+
+    @_in_main_thread
+    def clear(self) -> None:
+        """
+        Remove all items.
+        """
+        removed = len(self._items)
+        if removed:
+            self._items.clear()
+            self.__items_changed(0, removed, 0)
+
+    def update(self, items: Iterable[GObject.Object]) -> None:
+        """
+        Replace the content of the list with ``items``.
+
+        Items are compared by identity, and only the changed range is replaced,
+        so adding, removing or moving a single item emits a single ``items-changed`` for that range.
+
+        Args:
+            items: The new items, e.g., ``dict.values()`` of a service collection.
+        """
+        # take a snapshot now, the iterable may change before the update is applied in the main thread
+        self.__update(list(items))
+
+    @_in_main_thread
+    def __update(self, new: list[GObject.Object]) -> None:
+        old = self._items
+
+        start = 0
+        while start < len(old) and start < len(new) and old[start] is new[start]:
+            start += 1
+
+        old_end = len(old)
+        new_end = len(new)
+        while (
+            old_end > start and new_end > start and old[old_end - 1] is new[new_end - 1]
+        ):
+            old_end -= 1
+            new_end -= 1
+
+        if start == old_end and start == new_end:
+            return
+
+        self._items = new
+        self.__items_changed(start, old_end - start, new_end - start)
+
+    def __items_changed(self, position: int, removed: int, added: int) -> None:
+        self.items_changed(position, removed, added)
+        self.notify("items")
@@ -1,13 +1,32 @@
+import itertools
 from ignis.gobject import IgnisGObject, IgnisProperty
-from gi.repository import Gio  # type: ignore
+from gi.repository import Gio, GLib  # type: ignore
 from collections.abc import Callable
-from ignis.app import IgnisApp
 from typing import TypeAlias
 
-app = IgnisApp.get_default()
-
 ItemsType: TypeAlias = "list[IgnisMenuItem | IgnisMenuModel | IgnisMenuSeparator]"
 
+# The prefix of the action group of a menu on the widget that shows it.
+MENU_ACTION_PREFIX = "menu"
+
+# Actions of destroyed items are reused by new items, so rebuilt menus don't create new actions.
+# An item removes its action from its group before releasing it, so a reused name is never in two groups.
+_MAX_FREE_ACTIONS = 256
+_action_ids = itertools.count()
+_free_actions: list[Gio.SimpleAction] = []
+
+
+def _acquire_action() -> Gio.SimpleAction:
+    if _free_actions:
+        return _free_actions.pop()
+
+    return Gio.SimpleAction.new(f"item-{next(_action_ids)}", None)
+
+
+def _release_action(action: Gio.SimpleAction) -> None:
+    if len(_free_actions) < _MAX_FREE_ACTIONS:
+        _free_actions.append(action)
+
 
 class IgnisMenuItem(IgnisGObject):
     """
@@ -29,34 +48,47 @@ class IgnisMenuItem(IgnisGObject):
         self._label = label
         self._enabled = enabled
         self._on_activate = on_activate
-        self._uniq_name = hex(id(self))
 
-        self._action = Gio.SimpleAction.new(self._uniq_name, None)
+        self._action: Gio.SimpleAction | None = _acquire_action()
         self._action.set_enabled(enabled)
+        # the action group of the menu that contains this item
+        self._group: Gio.SimpleActionGroup | None = None
         self._activate_id = self._action.connect("activate", self.__on_activate)
-
-        app.add_action(self._action)
+        self._uniq_name: str = self._action.get_name()
 
     @IgnisProperty
     def label(self) -> str:
         """
         The label of item.
+
+        A :class:`Gio.Menu` copies the label, so set :attr:`IgnisMenuModel.items` again to show a new label.
         """
         return self._label
 
+    @label.setter
+    def label(self, value: str) -> None:
+        self._label = value
+
     @IgnisProperty
     def uniq_name(self) -> str:
         """
         The unique name of the ``Gio.Action``.
+        It is unique among actions of live menu items.
         """
         return self._uniq_name
 
     @IgnisProperty
     def action_name(self) -> str:
         """
-        The full action name (``app.UNIQ_NAME``).
+        The full action name (``menu.UNIQ_NAME``).
+        The action is in :attr:`IgnisMenuModel.action_group` of the menu that contains this item.
+
+        .. note::
+            Actions used to be added to the application with the ``app`` prefix, now they are not.
+            If you show :attr:`IgnisMenuModel.gmenu` in your own widget (not :class:`~ignis.widgets.PopoverMenu`),
+            insert :attr:`IgnisMenuModel.action_group` into it: ``widget.insert_action_group("menu", model.action_group)``.
         """
-        return f"app.{self.uniq_name}"
+        return f"{MENU_ACTION_PREFIX}.{self.uniq_name}"
 
     @IgnisProperty
     def enabled(self) -> bool:
@@ -65,6 +97,12 @@ class IgnisMenuItem(IgnisGObject):
         """
         return self._enabled
 
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        if self._action:
+            self._action.set_enabled(value)
+
     @IgnisProperty
     def on_activate(self) -> Callable:
         """
@@ -80,10 +118,27 @@ class IgnisMenuItem(IgnisGObject):
         if self.on_activate:
             self.on_activate(self)
 
+    def _set_group(self, group: Gio.SimpleActionGroup | None) -> None:
+        if self._action is None or group is self._group:
+            return
+
+        if self._group is not None:
+            self._group.remove_action(self._uniq_name)
+
+        self._group = group
+
+        if group is not None:
+            group.add_action(self._action)
+
     def _destroy(self) -> None:
-        app.remove_action(self._uniq_name)
+        if self._action is None:
+            return
+
+        # the action may be reused by another item right away
+        self._set_group(None)
         self._action.disconnect(self._activate_id)
-        self._action = None  # type: ignore
+        _release_action(self._action)
+        self._action = None
 
 
 class IgnisMenuSeparator:
@@ -141,8 +196,10 @@ class IgnisMenuModel(IgnisGObject):
         self._gmenu: Gio.Menu | None = None
         self._items: ItemsType = []
         self._links: list[Gio.MenuItem] = []
+        self._action_group = Gio.SimpleActionGroup()
 
         self._label = label
+        self._submenu_action: str | None = None
         self.items = list(args)
 
     @IgnisProperty
@@ -154,7 +211,9 @@ class IgnisMenuModel(IgnisGObject):
 
     @items.setter
     def items(self, value: ItemsType) -> None:
+        old_items = self._items
         self._items = value
+        self.__update_actions(old_items, value)
         self.__generate_gmenu(value)
 
     @IgnisProperty
@@ -164,6 +223,18 @@ class IgnisMenuModel(IgnisGObject):
         """
         return self._gmenu
 
+    @IgnisProperty
+    def action_group(self) -> Gio.SimpleActionGroup:
+        """
+        The action group with actions of all items, including items of submenus (submenus share the group of the parent model).
+
+        Insert it with the ``"menu"`` prefix into the widget that shows :attr:`gmenu`.
+        :class:`~ignis.widgets.PopoverMenu` does it automatically.
+
+        The group is replaced when this model is added to a parent model (``notify::action-group`` is emitted).
+        """
+        return self._action_group
+
     @IgnisProperty
     def label(self) -> str | None:
         """
@@ -171,6 +242,61 @@ class IgnisMenuModel(IgnisGObject):
         """
         return self._label
 
+    @label.setter
+    def label(self, value: str | None) -> None:
+        self._label = value
+
+    @IgnisProperty
+    def submenu_action(self) -> str | None:
+        """
+        The full name of a stateful boolean action that tracks whether this submenu is open.
+        Only works if this model passed as an item of the parent model.
+
+        When the user opens the submenu, GTK requests the action state to change to ``True``
+        and shows the submenu only after the state has actually changed.
+        This allows filling the submenu right before it is shown.
+        """
+        return self._submenu_action
+
+    @submenu_action.setter
+    def submenu_action(self, value: str | None) -> None:
+        self._submenu_action = value
+
+    def _set_action_group(self, group: Gio.SimpleActionGroup) -> None:
+        if group is self._action_group:
+            return
+
+        for item in self._items:
+            if isinstance(item, IgnisMenuItem):
+                item._set_group(group)
+
+            elif isinstance(item, IgnisMenuModel):
+                item._set_action_group(group)
+
+        self._action_group = group
+        self.notify("action_group")
+
+    def __update_actions(self, old_items: ItemsType, new_items: ItemsType) -> None:
+        new_ids = {id(item) for item in new_items}
+
+        for item in old_items:
+            if id(item) in new_ids:
+                continue
+
+            if isinstance(item, IgnisMenuItem):
+                item._set_group(None)
+
+            elif isinstance(item, IgnisMenuModel):
+                # the submenu is detached, take its actions out of the shared group
+                item._set_action_group(Gio.SimpleActionGroup())
+
+        for item in new_items:
+            if isinstance(item, IgnisMenuItem):
+                item._set_group(self._action_group)
+
+            elif isinstance(item, IgnisMenuModel):
+                item._set_action_group(self._action_group)
+
     def __add_section(self, root_menu: Gio.Menu) -> Gio.Menu:
         current_section = Gio.Menu()
         gitem = Gio.MenuItem.new_section(None, current_section)
@@ -187,11 +313,23 @@ class IgnisMenuModel(IgnisGObject):
         self, current_section: Gio.Menu, submenu: "IgnisMenuModel"
     ) -> None:
         gitem = Gio.MenuItem.new_submenu(submenu.label, submenu.gmenu)
+        if submenu.submenu_action:
+            gitem.set_attribute_value(
+                "submenu-action", GLib.Variant("s", submenu.submenu_action)
+            )
         current_section.append_item(gitem)
         self._links.append(gitem)
 
     def __generate_gmenu(self, items: ItemsType) -> None:
-        root_menu = Gio.Menu()
+        # Refill the existing Gio.Menu instead of creating a new one,
+        # so parent menus and popovers showing it update only this menu.
+        if self._gmenu is None:
+            root_menu = Gio.Menu()
+        else:
+            root_menu = self._gmenu
+            root_menu.remove_all()
+            self._links.clear()
+
         current_section = self.__add_section(root_menu)
 
         for item in items:
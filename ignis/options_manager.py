@@ -1,4 +1,9 @@
+import os
 import json
+import atexit
+import hashlib
+import tempfile
+import weakref
 from ignis.gobject import IgnisGObject, Binding, IgnisProperty, IgnisSignal
 from ignis import utils
 from typing import Any, TypeVar
@@ -8,6 +13,62 @@ from ignis import is_sphinx_build
 
 T = TypeVar("T")
 
+_managers: "weakref.WeakSet[OptionsManager]" = weakref.WeakSet()
+
+
+def _get_hash(contents: bytes) -> str:
+    return hashlib.sha256(contents).hexdigest()
+
+
+def _get_umask() -> int:
+    # there is no way to read the umask without setting it
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _write_atomic(path: str, contents: bytes) -> None:
+    # write to a temporary file in the same directory and rename it over the target,
+    # so readers (and the hot reload) never see a partially written file
+    # resolve symlinks (e.g., options kept in a dotfiles repository), so the link itself is kept
+    path = os.path.realpath(path)
+    dir_name = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=dir_name, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(contents)
+            fp.flush()
+            os.fsync(fp.fileno())
+
+        # mkstemp() creates files with 0600, keep the mode of an existing file, or use the usual one for a new file
+        if os.path.exists(path):
+            mode = os.stat(path).st_mode & 0o777
+        else:
+            mode = 0o666 & ~_get_umask()
+        os.chmod(tmp_path, mode)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _flush_all_managers() -> None:
+    """
+    :meta private:
+
+    Write pending changes of all option managers to their files.
+    """
+    for manager in list(_managers):
+        manager.flush()
+
+
+atexit.register(_flush_all_managers)
+
 
 class TrackedList(list[T]):
     """
@@ -315,6 +376,7 @@ class OptionsManager(OptionsGroup):
     Args:
         file: The path to the file used for saving and loading options. Cannot be changed after initialization.
         hot_reload: Whether to enable hot-reloading.
+        autosave_delay: The delay in milliseconds before changes are saved to the file. Several changes within this delay are saved at once.
 
     .. hint::
         The recommended directory for storing the options file is :obj:`ignis.DATA_DIR`.
@@ -347,9 +409,17 @@ class OptionsManager(OptionsGroup):
 
     """
 
-    def __init__(self, file: str | None = None, hot_reload: bool = True):
+    def __init__(
+        self,
+        file: str | None = None,
+        hot_reload: bool = True,
+        autosave_delay: int = 100,
+    ):
         super().__init__()
         self._file = file
+        self._last_hash: str | None = None
+        self._save_pending = False
+        self.__save_task = utils.DebounceTask(autosave_delay, self.flush)
 
         if not is_sphinx_build and self._file is not None:
             self.connect("autosave", self.__autosave)
@@ -359,30 +429,74 @@ class OptionsManager(OptionsGroup):
             if hot_reload:
                 utils.FileMonitor(path=self._file, callback=self.__hot_reload)
 
+            _managers.add(self)
+
     def __hot_reload(self, x, path: str, event_type: str) -> None:
         if not self._file:
             return
 
-        if event_type != "changes_done_hint":
+        # "created" is emitted when the file is replaced by renaming (atomic writes)
+        if event_type not in ("changes_done_hint", "created"):
+            return
+
+        try:
+            with open(self._file, "rb") as fp:
+                contents = fp.read()
+        except FileNotFoundError:
+            return
+
+        # skip reloads triggered by our own writes, or if nothing has changed
+        content_hash = _get_hash(contents)
+        if content_hash == self._last_hash:
+            return
+
+        try:
+            data = json.loads(contents)
+        except json.JSONDecodeError:
+            # the file is being written by someone else, wait for the next event
             return
 
-        with open(self._file) as fp:
-            data = json.load(fp)
+        self._last_hash = content_hash
 
+        # apply_from_dict() only emits "changed" for options whose value differs
         self.apply_from_dict(data, autosave=False)
 
     def __autosave(self, *args) -> None:
-        self.save_to_file(self._file)  # type: ignore
+        # coalesce several changes in a row into a single write
+        self._save_pending = True
+        self.__save_task.run()
+
+    def flush(self) -> None:
+        """
+        Immediately save pending changes to the file.
+
+        Changes are saved automatically after a short delay (``autosave_delay``),
+        so several changes in a row result in a single write.
+        Pending changes are also saved when Ignis quits.
+        """
+        if not self._save_pending or self._file is None:
+            return
+
+        self._save_pending = False
+        self.save_to_file(self._file)
 
     def save_to_file(self, file: str) -> None:
         """
         Manually save options to the specified file.
+        The file is written atomically.
 
         Args:
             file: The path to the file where options will be saved.
         """
-        with open(file, "w") as fp:
-            json.dump(self.get_modified_options(), fp, indent=4)
+        contents = json.dumps(self.get_modified_options(), indent=4).encode()
+
+        if file == self._file:
+            if _get_hash(contents) == self._last_hash:
+                return
+
+            self._last_hash = _get_hash(contents)
+
+        _write_atomic(file, contents)
 
     def load_from_file(self, file: str, emit: bool = True) -> None:
         """
@@ -392,6 +506,11 @@ class OptionsManager(OptionsGroup):
             file: The path to the file from which options will be loaded.
             emit: Whether to emit the :attr:`changed `and :attr:`subgroup_changed` signals for options in `file` that differ from those on `self`.
         """
-        with open(file) as fp:
-            data = json.load(fp)
-            self.apply_from_dict(data=data, emit=emit, autosave=False)
+        with open(file, "rb") as fp:
+            contents = fp.read()
+
+        if file == self._file:
+            self._last_hash = _get_hash(contents)
+
+        data = json.loads(contents)
+        self.apply_from_dict(data=data, emit=emit, autosave=False)
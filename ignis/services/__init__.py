@@ -0,0 +1,34 @@
+import importlib
+from types import ModuleType
+
+# Service packages are imported on first access (PEP 562).
+# Each of them loads its own GI typelibs (e.g., NM, Gvc, GnomeBluetooth),
+# so only services that are actually used pay this cost.
+_SERVICES = (
+    "applications",
+    "audio",
+    "backlight",
+    "bluetooth",
+    "fetch",
+    "hyprland",
+    "mpris",
+    "network",
+    "niri",
+    "notifications",
+    "recorder",
+    "system_tray",
+    "systemd",
+    "upower",
+    "wallpaper",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in _SERVICES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_SERVICES])
@@ -1,5 +1,6 @@
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty, IgnisSignal
+from ignis.list_model import IgnisListModel
 from ._imports import Gvc
 from .stream import Stream, DefaultStream
 
@@ -32,11 +33,16 @@ class AudioService(BaseService):
         self._microphone = DefaultStream(control=self._control, _type="source")
 
         self._streams: dict[int, Stream] = {}
+        self._streams_model = IgnisListModel(item_type=Stream)
 
         self._speakers: dict[int, Stream] = {}
         self._microphones: dict[int, Stream] = {}
         self._apps: dict[int, Stream] = {}
         self._recorders: dict[int, Stream] = {}
+        self._speakers_model = IgnisListModel(item_type=Stream)
+        self._microphones_model = IgnisListModel(item_type=Stream)
+        self._apps_model = IgnisListModel(item_type=Stream)
+        self._recorders_model = IgnisListModel(item_type=Stream)
 
         self._control.connect("default-sink-changed", self.__default_changed, "speaker")
         self._control.connect(
@@ -124,6 +130,13 @@ class AudioService(BaseService):
         """
         return list(self._streams.values())
 
+    @IgnisProperty
+    def streams_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of all streams.
+        """
+        return self._streams_model
+
     @IgnisProperty
     def speakers(self) -> list[Stream]:
         """
@@ -131,6 +144,13 @@ class AudioService(BaseService):
         """
         return list(self._speakers.values())
 
+    @IgnisProperty
+    def speakers_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of speakers.
+        """
+        return self._speakers_model
+
     @IgnisProperty
     def microphones(self) -> list[Stream]:
         """
@@ -138,6 +158,13 @@ class AudioService(BaseService):
         """
         return list(self._microphones.values())
 
+    @IgnisProperty
+    def microphones_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of microphones.
+        """
+        return self._microphones_model
+
     @IgnisProperty
     def apps(self) -> list[Stream]:
         """
@@ -145,6 +172,13 @@ class AudioService(BaseService):
         """
         return list(self._apps.values())
 
+    @IgnisProperty
+    def apps_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of applications currently playing sound.
+        """
+        return self._apps_model
+
     @IgnisProperty
     def recorders(self) -> list[Stream]:
         """
@@ -152,6 +186,13 @@ class AudioService(BaseService):
         """
         return list(self._recorders.values())
 
+    @IgnisProperty
+    def recorders_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of audio recorders.
+        """
+        return self._recorders_model
+
     def __add_stream(self, control: Gvc.MixerControl, id: int):
         stream = control.lookup_stream_id(id)
         audio_stream = Stream(stream=stream, control=control)
@@ -159,14 +200,18 @@ class AudioService(BaseService):
         if stream_type:
             getattr(self, f"_{stream_type}s")[id] = audio_stream
             self._streams[id] = audio_stream
+            getattr(self, f"_{stream_type}s_model").append(audio_stream)
+            self._streams_model.append(audio_stream)
             self.emit(f"{stream_type}-added", audio_stream)
             self.notify(f"{stream_type}s")
 
     def __remove_stream(self, control: Gvc.MixerControl, id: int):
         audio_stream = self._streams.pop(id)
+        self._streams_model.remove(audio_stream)
         stream_type = self.__get_stream_type(audio_stream.stream)
         if stream_type:
             getattr(self, f"_{stream_type}s").pop(id)
+            getattr(self, f"_{stream_type}s_model").remove(audio_stream)
             audio_stream._remove()
             self.notify(f"{stream_type}s")
 
@@ -3,7 +3,7 @@ from ignis.gobject import IgnisGObject, IgnisProperty
 from ignis import utils
 from ignis.dbus import DBusProxy
 from .constants import SYS_BACKLIGHT
-from .util import get_session_path
+from .util import get_session_path, get_session_path_async
 
 
 class BacklightDevice(IgnisGObject):
@@ -34,16 +34,34 @@ class BacklightDevice(IgnisGObject):
             else None,
         )
 
-        self.__session_proxy = DBusProxy.new(
-            name="org.freedesktop.login1",
-            object_path=get_session_path(),
-            info=utils.load_interface_xml("org.freedesktop.login1.Session"),
-            interface_name="org.freedesktop.login1.Session",
-            bus_type="system",
-        )
+        # created on first use, so no D-Bus calls are made at startup
+        self.__session_proxy: DBusProxy | None = None
 
         self.__sync_brightness()
 
+    def __get_session_proxy(self) -> DBusProxy:
+        if self.__session_proxy is None:
+            self.__session_proxy = DBusProxy.new(
+                object_path=get_session_path(), **self.__get_session_kwargs()
+            )
+        return self.__session_proxy
+
+    async def __get_session_proxy_async(self) -> DBusProxy:
+        if self.__session_proxy is None:
+            self.__session_proxy = await DBusProxy.new_async(
+                object_path=await get_session_path_async(),
+                **self.__get_session_kwargs(),
+            )
+        return self.__session_proxy
+
+    def __get_session_kwargs(self) -> dict:
+        return {
+            "name": "org.freedesktop.login1",
+            "info": utils.load_interface_xml("org.freedesktop.login1.Session"),
+            "interface_name": "org.freedesktop.login1.Session",
+            "bus_type": "system",
+        }
+
     def __sync_brightness(self) -> None:
         with open(self._PATH_TO_BRIGHTNESS) as backlight_file:
             self._brightness = int(backlight_file.read().strip())
@@ -73,7 +91,7 @@ class BacklightDevice(IgnisGObject):
 
     @brightness.setter
     def brightness(self, value: int) -> None:
-        self.__session_proxy.SetBrightness(
+        self.__get_session_proxy().SetBrightness(
             "(ssu)",
             "backlight",
             self._device_name,
@@ -87,7 +105,8 @@ class BacklightDevice(IgnisGObject):
         Args:
             value: The value to set.
         """
-        await self.__session_proxy.SetBrightnessAsync(
+        proxy = await self.__get_session_proxy_async()
+        await proxy.SetBrightnessAsync(
             "(ssu)",
             "backlight",
             self._device_name,
@@ -3,14 +3,18 @@ from ignis.dbus import DBusProxy
 from ignis import utils
 
 
+def _get_manager_kwargs() -> dict:
+    return {
+        "name": "org.freedesktop.login1",
+        "object_path": "/org/freedesktop/login1",
+        "info": utils.load_interface_xml("org.freedesktop.login1.Manager"),
+        "interface_name": "org.freedesktop.login1.Manager",
+        "bus_type": "system",
+    }
+
+
 def get_session_path() -> str:
-    proxy = DBusProxy.new(
-        name="org.freedesktop.login1",
-        object_path="/org/freedesktop/login1",
-        info=utils.load_interface_xml("org.freedesktop.login1.Manager"),
-        interface_name="org.freedesktop.login1.Manager",
-        bus_type="system",
-    )
+    proxy = DBusProxy.new(**_get_manager_kwargs())
 
     session_id = os.getenv("XDG_SESSION_ID")
     if session_id is None:
@@ -18,3 +22,12 @@ def get_session_path() -> str:
 
     session_path = proxy.GetSession("(s)", session_id)
     return session_path
+
+
+async def get_session_path_async() -> str:
+    session_id = os.getenv("XDG_SESSION_ID")
+    if session_id is None:
+        return ""
+
+    proxy = await DBusProxy.new_async(**_get_manager_kwargs())
+    return (await proxy.GetSessionAsync("(s)", session_id))[0]
@@ -6,6 +6,7 @@ from ignis import utils
 from ignis.exceptions import HyprlandIPCNotFoundError
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty, IgnisSignal
+from ignis.list_model import IgnisListModel
 from collections.abc import Callable
 from dataclasses import dataclass
 from .constants import HYPR_SOCKET_DIR
@@ -58,11 +59,14 @@ class HyprlandService(BaseService):
         super().__init__()
 
         self._workspaces: dict[int, HyprlandWorkspace] = {}
+        self._workspaces_model = IgnisListModel(item_type=HyprlandWorkspace)
         self._active_workspace: HyprlandWorkspace = HyprlandWorkspace(self)
         self._main_keyboard: HyprlandKeyboard = HyprlandKeyboard(self)
         self._windows: dict[str, HyprlandWindow] = {}
+        self._windows_model = IgnisListModel(item_type=HyprlandWindow)
         self._active_window: HyprlandWindow = HyprlandWindow()
         self._monitors: dict[str, HyprlandMonitor] = {}
+        self._monitors_model = IgnisListModel(item_type=HyprlandMonitor)
 
         self._OBJ_TYPES: dict[str, _HyprlandObjDesc] = {
             "workspace": _HyprlandObjDesc(
@@ -143,6 +147,13 @@ class HyprlandService(BaseService):
         """
         return list(self._workspaces.values())
 
+    @IgnisProperty
+    def workspaces_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of workspaces, sorted by ID.
+        """
+        return self._workspaces_model
+
     @IgnisProperty
     def active_workspace(self) -> HyprlandWorkspace:
         """
@@ -164,6 +175,13 @@ class HyprlandService(BaseService):
         """
         return list(self._windows.values())
 
+    @IgnisProperty
+    def windows_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of windows.
+        """
+        return self._windows_model
+
     @IgnisProperty
     def active_window(self) -> HyprlandWindow:
         """
@@ -178,6 +196,13 @@ class HyprlandService(BaseService):
         """
         return list(self._monitors.values())
 
+    @IgnisProperty
+    def monitors_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of monitors.
+        """
+        return self._monitors_model
+
     @utils.run_in_thread
     def __listen_events(self) -> None:
         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
@@ -250,6 +275,10 @@ class HyprlandService(BaseService):
     def __get_self_dict(self, obj_desc: _HyprlandObjDesc) -> dict:
         return getattr(self, f"_{obj_desc.prop_name}")
 
+    def __sync_model(self, obj_desc: _HyprlandObjDesc) -> None:
+        model: IgnisListModel = getattr(self, f"_{obj_desc.prop_name}_model")
+        model.update(self.__get_self_dict(obj_desc).values())
+
     def __initial_sync_obj_list(self, type_: _SupportedTypes) -> None:
         obj_desc = self._OBJ_TYPES[type_]
 
@@ -263,6 +292,7 @@ class HyprlandService(BaseService):
         if obj_desc.sort_func:
             obj_desc.sort_func()
 
+        self.__sync_model(obj_desc)
         self.notify(obj_desc.prop_name)
 
     def __get_obj_data(self, type_: _SupportedTypes, key: Any) -> dict:
@@ -290,6 +320,7 @@ class HyprlandService(BaseService):
             obj_desc.sort_func()
 
         self.emit(obj_desc.added_signal, obj)
+        self.__sync_model(obj_desc)
         self.notify(obj_desc.prop_name)
 
     def __remove_obj(self, type_: _SupportedTypes, key: Any) -> None:
@@ -302,6 +333,7 @@ class HyprlandService(BaseService):
             if obj_desc.sort_func:
                 obj_desc.sort_func()
 
+            self.__sync_model(obj_desc)
             self.notify(obj_desc.prop_name)
 
     def __sync_obj_data(
@@ -9,6 +9,25 @@ from collections.abc import Callable
 from .constants import ART_URL_CACHE_DIR
 from .util import uri_to_unix_path
 
+_PLAYER_PROPERTIES = (
+    "can_control",
+    "can_go_next",
+    "can_go_previous",
+    "can_pause",
+    "can_play",
+    "can_seek",
+    "loop_status",
+    "metadata",
+    "playback_status",
+    "shuffle",
+    "volume",
+)
+
+_MPRIS_PROPERTIES = (
+    "identity",
+    "desktop_entry",
+)
+
 
 class MprisPlayer(IgnisGObject):
     """
@@ -52,10 +71,16 @@ class MprisPlayer(IgnisGObject):
 
         self.__mpris_proxy.watch_name(on_name_vanished=lambda *_: self.__close())
 
+        # the caches are kept fresh from PropertiesChanged after the initial GetAll
+        self._conn_mgr.connect(
+            self.__player_proxy,
+            "notify::cached-properties",
+            lambda *_: self.__sync_from_cache(self.__player_proxy, _PLAYER_PROPERTIES),
+        )
         self._conn_mgr.connect(
-            self.__player_proxy.gproxy,
-            "g-properties-changed",
-            lambda *_: asyncio.create_task(self.__sync_all()),
+            self.__mpris_proxy,
+            "notify::cached-properties",
+            lambda *_: self.__sync_from_cache(self.__mpris_proxy, _MPRIS_PROPERTIES),
         )
         self._conn_mgr.connect(
             self,
@@ -95,39 +120,33 @@ class MprisPlayer(IgnisGObject):
         self._sync_pos_task.cancel()
         self.emit("closed")
 
-    async def __sync_property(self, proxy: DBusProxy, py_name: str) -> None:
-        try:
-            value = await proxy.get_dbus_property_async(utils.snake_to_pascal(py_name))
-        except GLib.Error:
-            return
+    def __sync_from_cache(self, proxy: DBusProxy, py_names: tuple[str, ...]) -> None:
+        cache = proxy.cached_properties
 
-        if value == getattr(self, f"_{py_name}"):
-            return
+        for py_name in py_names:
+            dbus_name = utils.snake_to_pascal(py_name)
+            if dbus_name not in cache:
+                continue
 
-        setattr(self, f"_{py_name}", value)
-        self.notify(py_name.replace("_", "-"))
+            value = cache[dbus_name]
+            if value == getattr(self, f"_{py_name}"):
+                continue
+
+            setattr(self, f"_{py_name}", value)
+            self.notify(py_name.replace("_", "-"))
 
     async def __sync_all(self) -> None:
-        for prop_name in (
-            "can_control",
-            "can_go_next",
-            "can_go_previous",
-            "can_pause",
-            "can_play",
-            "can_seek",
-            "loop_status",
-            "metadata",
-            "playback_status",
-            "shuffle",
-            "volume",
+        # one GetAll per interface instead of one Get per property
+        for proxy, py_names in (
+            (self.__player_proxy, _PLAYER_PROPERTIES),
+            (self.__mpris_proxy, _MPRIS_PROPERTIES),
         ):
-            await self.__sync_property(self.__player_proxy, prop_name)
+            try:
+                await proxy.get_all_dbus_properties_async()
+            except GLib.Error:
+                continue
 
-        for prop_name in (
-            "identity",
-            "desktop_entry",
-        ):
-            await self.__sync_property(self.__mpris_proxy, prop_name)
+            self.__sync_from_cache(proxy, py_names)
 
     def __sync_metadata_property(
         self, key: str, py_name: str, custom_func: Callable | None = None
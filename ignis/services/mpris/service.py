@@ -3,6 +3,7 @@ from ignis.dbus import DBusProxy
 from ignis import utils
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty, IgnisSignal
+from ignis.list_model import IgnisListModel
 from .player import MprisPlayer
 
 
@@ -24,8 +25,12 @@ class MprisService(BaseService):
     def __init__(self):
         super().__init__()
         self._players: dict[str, MprisPlayer] = {}
+        self._players_model = IgnisListModel(item_type=MprisPlayer)
 
-        self.__dbus = DBusProxy.new(
+        asyncio.create_task(self.__setup())
+
+    async def __setup(self) -> None:
+        self.__dbus = await DBusProxy.new_async(
             name="org.freedesktop.DBus",
             object_path="/org/freedesktop/DBus",
             interface_name="org.freedesktop.DBus",
@@ -37,10 +42,10 @@ class MprisService(BaseService):
             callback=lambda *args: asyncio.create_task(self.__init_player(args[5][0])),
         )
 
-        asyncio.create_task(self.__get_players())
+        await self.__get_players()
 
     async def __get_players(self) -> None:
-        all_names = self.__dbus.ListNames()
+        all_names = (await self.__dbus.ListNamesAsync())[0]
         for name in all_names:
             await self.__init_player(name)
 
@@ -53,13 +58,14 @@ class MprisService(BaseService):
             player = await MprisPlayer.new_async(name)
 
             self._players[name] = player
+            self._players_model.append(player)
             player.connect("closed", lambda x: self.__remove_player(name))
             self.emit("player_added", player)
             self.notify("players")
 
     def __remove_player(self, name: str) -> None:
         if name in self._players:
-            self._players.pop(name)
+            self._players_model.remove(self._players.pop(name))
             self.notify("players")
 
     @IgnisSignal
@@ -78,3 +84,10 @@ class MprisService(BaseService):
         A list of currently active players.
         """
         return list(self._players.values())
+
+    @IgnisProperty
+    def players_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of currently active players.
+        """
+        return self._players_model
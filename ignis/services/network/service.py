@@ -1,3 +1,4 @@
+from typing import Any
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty
 from ._imports import NM
@@ -11,13 +12,22 @@ class NetworkService(BaseService):
     A Network service. Uses ``NetworkManager``.
     """
 
-    def __init__(self):
+    def __init__(self, client: NM.Client | None = None):
         super().__init__()
-        self._client = NM.Client.new(None)
+
+        if client is None:
+            client = NM.Client.new(None)
+
+        self._client = client
         self._wifi = Wifi(self._client)
         self._ethernet = Ethernet(self._client)
         self._vpn = Vpn(self._client)
 
+    @classmethod
+    async def _get_init_kwargs_async(cls) -> dict[str, Any]:
+        # NM.Client.new() loads the whole NetworkManager state over D-Bus synchronously
+        return {"client": await NM.Client.new_async(None)}  # type: ignore
+
     @IgnisProperty
     def wifi(self) -> Wifi:
         """
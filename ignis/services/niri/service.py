@@ -5,6 +5,7 @@ from ignis import utils
 from ignis.exceptions import NiriIPCNotFoundError
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty, IgnisSignal
+from ignis.list_model import IgnisListModel
 from ignis.app import IgnisApp
 from .constants import NIRI_SOCKET
 from .keyboard import NiriKeyboardLayouts
@@ -44,8 +45,10 @@ class NiriService(BaseService):
 
         self._keyboard_layouts: NiriKeyboardLayouts = NiriKeyboardLayouts(self)
         self._windows: dict[int, NiriWindow] = {}
+        self._windows_model = IgnisListModel(item_type=NiriWindow)
         self._active_window: NiriWindow = NiriWindow(self)
         self._workspaces: dict[int, NiriWorkspace] = {}
+        self._workspaces_model = IgnisListModel(item_type=NiriWorkspace)
         self._active_output: str = ""
         self._overview_opened = False
 
@@ -85,6 +88,13 @@ class NiriService(BaseService):
         """
         return list(self._windows.values())
 
+    @IgnisProperty
+    def windows_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of windows, sorted by ID.
+        """
+        return self._windows_model
+
     @IgnisProperty
     def active_window(self) -> NiriWindow:
         """
@@ -99,6 +109,13 @@ class NiriService(BaseService):
         """
         return list(self._workspaces.values())
 
+    @IgnisProperty
+    def workspaces_model(self) -> IgnisListModel:
+        """
+        A :class:`~ignis.list_model.IgnisListModel` of workspaces, sorted by index.
+        """
+        return self._workspaces_model
+
     @IgnisProperty
     def active_output(self) -> str:
         """
@@ -182,6 +199,7 @@ class NiriService(BaseService):
 
     def __sort_windows(self) -> None:
         self._windows = dict(sorted(self._windows.items()))
+        self._windows_model.update(self._windows.values())
 
     def __destroy_window(self, data: dict) -> None:
         window = self._windows.pop(data["id"])
@@ -273,6 +291,7 @@ class NiriService(BaseService):
         self._workspaces = dict(
             sorted(self._workspaces.items(), key=lambda w: w[1].idx)
         )
+        self._workspaces_model.update(self._workspaces.values())
 
     def __update_workspaces(self, data: dict) -> None:
         workspaces = data["workspaces"]
@@ -1,6 +1,5 @@
 import asyncio
-from typing import Literal
-from collections.abc import Callable
+from typing import Any, Literal
 from ignis import utils
 from ignis.dbus import DBusProxy
 from gi.repository import GLib, GdkPixbuf, Gtk  # type: ignore
@@ -8,6 +7,17 @@ from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
 from ignis.dbus_menu import DBusMenu
 from ignis.connection_manager import ConnectionManager, DBusConnectionManager
 
+# Python property name -> D-Bus property name
+_PROPERTIES = {
+    "id": "Id",
+    "category": "Category",
+    "title": "Title",
+    "status": "Status",
+    "window_id": "WindowId",
+    "item_is_menu": "ItemIsMenu",
+    "tooltip": "ToolTip",
+}
+
 
 class SystemTrayItem(IgnisGObject):
     """
@@ -83,101 +93,92 @@ class SystemTrayItem(IgnisGObject):
         return obj
 
     async def _initial_sync(self) -> None:
-        menu_path: str = await self._proxy.get_dbus_property_async("Menu")
+        # fetch everything with a single GetAll call
+        values = await self.__get_all_properties()
+
+        menu_path: str | None = values.get("Menu", None)
 
         if menu_path:
             self._menu = await DBusMenu.new_async(
                 name=self._proxy.name, object_path=menu_path
             )
 
-        await self.__sync_icon()
+        self.__apply_icon(values)
 
-        # sync all properties
-        await self.__sync_property("id")
-        await self.__sync_property("category")
-        await self.__sync_property("title")
-        await self.__sync_property("status")
-        await self.__sync_property("window_id")
-        await self.__sync_property("item_is_menu")
-        await self.__sync_property("tooltip")
+        for py_name in _PROPERTIES:
+            self.__apply_property(py_name, values)
 
     def __remove(self) -> None:
         self._conn_mgr.disconnect_all()
         self._dbus_conn_mgr.unsubscribe_all()
         self.emit("removed")
 
-    async def __sync_property(self, py_name: str) -> None:
+    async def __get_all_properties(self) -> dict[str, Any]:
         try:
-            value = await self._proxy.get_dbus_property_async(
-                utils.snake_to_pascal(py_name)
-            )
+            return await self._proxy.get_all_dbus_properties_async()
         except GLib.Error:
+            pass
+
+        # some items fail the whole GetAll call if a single property is broken,
+        # so fall back to getting properties one by one
+        names = self._proxy.properties
+        results = await asyncio.gather(
+            *(self._proxy.get_dbus_property_async(name) for name in names),
+            return_exceptions=True,
+        )
+        return {
+            name: value
+            for name, value in zip(names, results, strict=True)
+            if not isinstance(value, BaseException)
+        }
+
+    def __apply_property(self, py_name: str, values: dict[str, Any]) -> None:
+        dbus_name = _PROPERTIES[py_name]
+        if dbus_name not in values:
             return
 
-        setattr(self, f"_{py_name}", value)
+        setattr(self, f"_{py_name}", values[dbus_name])
         self.notify(py_name.replace("_", "-"))
 
+    async def __sync_property(self, py_name: str) -> None:
+        try:
+            value = await self._proxy.get_dbus_property_async(_PROPERTIES[py_name])
+        except GLib.Error:
+            return
+
+        self.__apply_property(py_name, {_PROPERTIES[py_name]: value})
+
     async def __sync_icon(self) -> None:
-        async def add_to_search_path(icon_name: str) -> None:
-            search_path = self._icon_theme.get_search_path()
-            try:
-                icon_theme_path = await self._proxy.get_dbus_property_async("IconName")
-            except GLib.Error:
-                return
-            if (
-                not self._icon_theme.has_icon(icon_name)
-                and icon_theme_path is not None
-                and search_path is not None
-                and icon_theme_path not in search_path
-            ):
-                self._icon_theme.add_search_path(icon_theme_path)
-
-        async def try_set_prop(
-            property_name: str,
-            callback: Callable | None = None,
-            add_search_path: bool = False,
-        ) -> bool:
-            try:
-                value = await self._proxy.get_dbus_property_async(property_name)
-            except GLib.Error:
-                return False
-
-            if value:
-                if add_search_path:
-                    await add_to_search_path(value)
-                if callback:
-                    self._icon = callback(value)
-                else:
-                    self._icon = value
+        self.__apply_icon(await self.__get_all_properties())
+
+    def __apply_icon(self, values: dict[str, Any]) -> None:
+        for name_prop in ("IconName", "AttentionIconName"):
+            icon_name = values.get(name_prop, None)
+            if icon_name:
+                self.__add_to_search_path(icon_name, values.get("IconThemePath", None))
+                self._icon = icon_name
                 self.notify("icon")
-                return True
-            else:
-                return False
-
-        async def try_set_icon_name() -> None:
-            is_success = await try_set_prop("IconName", add_search_path=True)
-            if not is_success:
-                await try_set_attention_icon_name()
-
-        async def try_set_attention_icon_name() -> None:
-            is_success = await try_set_prop("AttentionIconName", add_search_path=True)
-            if not is_success:
-                await try_set_icon_pixmap()
-
-        async def try_set_icon_pixmap() -> None:
-            is_success = await try_set_prop("IconPixmap", callback=self.__get_pixbuf)
-            if not is_success:
-                await try_set_attention_icon_pixmap()
-
-        async def try_set_attention_icon_pixmap() -> None:
-            is_success = await try_set_prop(
-                "AttentionIconPixmap", callback=self.__get_pixbuf
-            )
-            if not is_success:
-                self._icon = "image-missing"
+                return
+
+        for pixmap_prop in ("IconPixmap", "AttentionIconPixmap"):
+            pixmap = values.get(pixmap_prop, None)
+            if pixmap:
+                self._icon = self.__get_pixbuf(pixmap)
                 self.notify("icon")
+                return
 
-        await try_set_icon_name()
+        self._icon = "image-missing"
+        self.notify("icon")
+
+    def __add_to_search_path(self, icon_name: str, icon_theme_path: str | None) -> None:
+        search_path = self._icon_theme.get_search_path()
+        if (
+            not self._icon_theme.has_icon(icon_name)
+            and icon_theme_path
+            and search_path is not None
+            and icon_theme_path not in search_path
+        ):
+            self._icon_theme.add_search_path(icon_theme_path)
 
     @IgnisSignal
     def removed(self):
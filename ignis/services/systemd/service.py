@@ -1,7 +1,7 @@
 from __future__ import annotations
 import os
 from ignis.dbus import DBusProxy
-from ignis import utils
+from ignis import utils, _config_scope
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty
 from typing import Literal
@@ -36,18 +36,29 @@ class SystemdService(BaseService):
     _session_instance: SystemdService | None = None
     _system_instance: SystemdService | None = None
 
-    def __init__(self, bus_type: Literal["session", "system"] = "session") -> None:
+    def __init__(
+        self,
+        bus_type: Literal["session", "system"] = "session",
+        proxy: DBusProxy | None = None,
+    ) -> None:
         super().__init__()
 
         self._bus_type = bus_type
 
-        self._proxy = DBusProxy.new(
-            name="org.freedesktop.systemd1",
-            object_path="/org/freedesktop/systemd1",
-            interface_name="org.freedesktop.systemd1.Manager",
-            info=utils.load_interface_xml("org.freedesktop.systemd1.Manager"),
-            bus_type=bus_type,
-        )
+        if proxy is None:
+            proxy = DBusProxy.new(**self.__get_proxy_kwargs(bus_type))
+
+        self._proxy = proxy
+
+    @staticmethod
+    def __get_proxy_kwargs(bus_type: Literal["session", "system"]) -> dict:
+        return {
+            "name": "org.freedesktop.systemd1",
+            "object_path": "/org/freedesktop/systemd1",
+            "interface_name": "org.freedesktop.systemd1.Manager",
+            "info": utils.load_interface_xml("org.freedesktop.systemd1.Manager"),
+            "bus_type": bus_type,
+        }
 
     @classmethod
     def get_default(  # type: ignore
@@ -69,7 +80,32 @@ class SystemdService(BaseService):
         instance_attr = f"_{bus_type}_instance"
 
         if getattr(cls, instance_attr) is None:
-            setattr(cls, instance_attr, cls(bus_type))  # type: ignore
+            with _config_scope.suspended():
+                setattr(cls, instance_attr, cls(bus_type))  # type: ignore
+        return getattr(cls, instance_attr)
+
+    @classmethod
+    async def get_default_async(  # type: ignore
+        cls: SystemdService, bus_type: Literal["session", "system"] = "session"
+    ) -> SystemdService:
+        """
+        Asynchronous version of :func:`get_default`.
+        The D-Bus proxy is created without blocking the main loop.
+
+        Args:
+            bus_type: The bus type.
+        """
+        if bus_type not in ("session", "system"):
+            raise TypeError(f"Invalid bus type: {bus_type}")
+
+        instance_attr = f"_{bus_type}_instance"
+
+        if getattr(cls, instance_attr) is None:
+            proxy = await DBusProxy.new_async(**cls.__get_proxy_kwargs(bus_type))  # type: ignore
+            # get_default() could have been called while we were waiting
+            if getattr(cls, instance_attr) is None:
+                with _config_scope.suspended():
+                    setattr(cls, instance_attr, cls(bus_type, proxy=proxy))  # type: ignore
         return getattr(cls, instance_attr)
 
     @IgnisProperty
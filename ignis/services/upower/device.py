@@ -10,19 +10,16 @@ class UPowerDevice(IgnisGObject):
     The general class for power devices, including batteries.
     """
 
-    def __init__(self, object_path: str):
+    def __init__(self, object_path: str, proxy: DBusProxy | None = None):
         super().__init__()
 
         self.__watching_props: dict[str, tuple[str, ...]] = {}
         self._object_path = object_path
 
-        self._proxy = DBusProxy.new(
-            name="org.freedesktop.UPower",
-            object_path=object_path,
-            interface_name="org.freedesktop.UPower.Device",
-            info=utils.load_interface_xml("org.freedesktop.UPower.Device"),
-            bus_type="system",
-        )
+        if proxy is None:
+            proxy = DBusProxy.new(**self.__get_proxy_kwargs(object_path))
+
+        self._proxy = proxy
         self._proxy.gproxy.connect("g-properties-changed", self.__sync)
 
         self.__watch_property("Percentage", "percent")
@@ -40,6 +37,26 @@ class UPowerDevice(IgnisGObject):
         self.__watch_property("TimeToFull", "time-remaining")
         self.__watch_property("TimeToEmpty", "time-remaining")
 
+    @staticmethod
+    def __get_proxy_kwargs(object_path: str) -> dict:
+        return {
+            "name": "org.freedesktop.UPower",
+            "object_path": object_path,
+            "interface_name": "org.freedesktop.UPower.Device",
+            "info": utils.load_interface_xml("org.freedesktop.UPower.Device"),
+            "bus_type": "system",
+        }
+
+    @classmethod
+    async def new_async(cls, object_path: str) -> "UPowerDevice":
+        """
+        :meta private:
+
+        Asynchronously initialize a new instance.
+        """
+        proxy = await DBusProxy.new_async(**cls.__get_proxy_kwargs(object_path))
+        return cls(object_path, proxy=proxy)
+
     def __watch_property(self, dbus_property: str, *prop_names: str) -> None:
         self.__watching_props[dbus_property] = prop_names
 
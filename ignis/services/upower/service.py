@@ -1,3 +1,5 @@
+import asyncio
+from typing import Any
 from ignis.base_service import BaseService
 from ignis.dbus import DBusProxy
 from ignis import utils
@@ -15,36 +17,77 @@ class UPowerService(BaseService):
         UPowerNotRunningError: If UPower D-Bus service is not running.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        proxy: DBusProxy | None = None,
+        display_device: UPowerDevice | None = None,
+        devices: list[UPowerDevice] | None = None,
+    ) -> None:
         super().__init__()
 
-        self._proxy = DBusProxy.new(
-            name="org.freedesktop.UPower",
-            object_path="/org/freedesktop/UPower",
-            interface_name="org.freedesktop.UPower",
-            info=utils.load_interface_xml("org.freedesktop.UPower"),
-            bus_type="system",
-        )
+        if proxy is None:
+            proxy = DBusProxy.new(**self.__get_proxy_kwargs())
+
+        self._proxy = proxy
 
         if not self._proxy.has_owner:
             raise UPowerNotRunningError()
 
         self._devices: dict[str, UPowerDevice] = {}
         self._batteries: dict[str, UPowerDevice] = {}
-        self._display_device = UPowerDevice(object_path=self._proxy.GetDisplayDevice())
+
+        if display_device is None:
+            display_device = UPowerDevice(object_path=self._proxy.GetDisplayDevice())
+
+        self._display_device = display_device
 
         self._proxy.signal_subscribe(
             "DeviceAdded",
-            lambda *args: self.__add_device(self.__get_device_object_path(args)),
+            lambda *args: self.__add_device(
+                UPowerDevice(object_path=self.__get_device_object_path(args))
+            ),
         )
         self._proxy.signal_subscribe(
             "DeviceRemoved",
             lambda *args: self.__remove_device(self.__get_device_object_path(args)),
         )
 
-        for device in self._proxy.EnumerateDevices():
+        if devices is None:
+            devices = [
+                UPowerDevice(object_path=object_path)
+                for object_path in self._proxy.EnumerateDevices()
+            ]
+
+        for device in devices:
             self.__add_device(device)
 
+    @staticmethod
+    def __get_proxy_kwargs() -> dict:
+        return {
+            "name": "org.freedesktop.UPower",
+            "object_path": "/org/freedesktop/UPower",
+            "interface_name": "org.freedesktop.UPower",
+            "info": utils.load_interface_xml("org.freedesktop.UPower"),
+            "bus_type": "system",
+        }
+
+    @classmethod
+    async def _get_init_kwargs_async(cls) -> dict[str, Any]:
+        proxy = await DBusProxy.new_async(**cls.__get_proxy_kwargs())
+
+        if not proxy.has_owner:
+            raise UPowerNotRunningError()
+
+        display_path = (await proxy.GetDisplayDeviceAsync())[0]
+        object_paths = (await proxy.EnumerateDevicesAsync())[0]
+
+        display_device, *devices = await asyncio.gather(
+            UPowerDevice.new_async(display_path),
+            *(UPowerDevice.new_async(object_path) for object_path in object_paths),
+        )
+
+        return {"proxy": proxy, "display_device": display_device, "devices": devices}
+
     def __get_device_object_path(self, args) -> str:
         return args[-1].unpack()[0]  # -1 element is the device object path (Variant)
 
@@ -87,8 +130,8 @@ class UPowerService(BaseService):
         """
         return self._display_device
 
-    def __add_device(self, object_path: str) -> None:
-        device = UPowerDevice(object_path=object_path)
+    def __add_device(self, device: UPowerDevice) -> None:
+        object_path = device.object_path
         self._devices[object_path] = device
         self.emit("device-added", device)
 
@@ -1,4 +1,5 @@
 from typing import TypeVar
+from ignis import _config_scope
 
 _SingletonT = TypeVar("_SingletonT", bound="IgnisSingleton")
 
@@ -16,5 +17,7 @@ class IgnisSingleton:
         Returns the default instance for this process, creating it if necessary.
         """
         if cls._instance is None:
-            cls._instance = cls()
+            # the instance outlives the configuration that created it
+            with _config_scope.suspended():
+                cls._instance = cls()
         return cls._instance
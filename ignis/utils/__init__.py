@@ -8,10 +8,23 @@ from .monitor import get_monitor, get_n_monitors, get_monitors
 from .pixbuf import scale_pixbuf, crop_pixbuf
 from .poll import Poll
 from .sass import sass_compile
-from .shell import exec_sh, exec_sh_async, AsyncCompletedProcess
+from .shell import (
+    exec_sh,
+    exec_sh_async,
+    AsyncCompletedProcess,
+    StreamingProcess,
+    clear_exec_sh_cache,
+)
 from .socket import send_socket, listen_socket
 from .str_cases import snake_to_pascal, pascal_to_snake
-from .thread import thread, run_in_thread, ThreadTask
+from .thread import (
+    thread,
+    run_in_thread,
+    ThreadTask,
+    ThreadPool,
+    get_thread_pool,
+    get_thread_pools,
+)
 from .timeout import Timeout
 from .version import (
     get_ignis_version,
@@ -67,8 +80,11 @@ __all__ = [
     "DebounceTask",
     "FileMonitor",
     "Poll",
+    "StreamingProcess",
+    "ThreadPool",
     "ThreadTask",
     "Timeout",
+    "clear_exec_sh_cache",
     "crop_pixbuf",
     "debounce",
     "exec_sh",
@@ -84,6 +100,8 @@ __all__ = [
     "get_monitors",
     "get_n_monitors",
     "get_paintable",
+    "get_thread_pool",
+    "get_thread_pools",
     "get_gdk_display",
     "listen_socket",
     "load_interface_xml",
@@ -1,5 +1,7 @@
 import os
-from gi.repository import Gio  # type: ignore
+import fnmatch
+from gi.repository import Gio, GLib  # type: ignore
+from ignis import _config_scope
 from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
 from collections.abc import Callable
 
@@ -17,6 +19,9 @@ EVENT = {
     Gio.FileMonitorEvent.MOVED_IN: "moved_in",
 }
 
+# events that override a coalesced "changes_done_hint"
+_REMOVAL_EVENTS = ("deleted", "moved_out", "renamed", "pre_unmount", "unmounted")
+
 file_monitors = []
 
 
@@ -30,6 +35,8 @@ class FileMonitor(IgnisGObject):
         flags: What the monitor will watch for. See :class:`Gio.FileMonitorFlags` for more info.
         callback: A function to call when the file or directory changes. See :attr:`callback` for more info.
         prevent_gc: Whether to prevent the garbage collector from collecting this file monitor.
+        ignore: A list of glob patterns (e.g., ``"__pycache__"``, ``"*.swp"``). Paths with any component matching a pattern are neither monitored nor reported.
+        debounce: Coalesce events per path over this interval (in milliseconds), only the last event for a path is reported. A ``changes_done_hint`` is kept over later events of the interval, unless the path was removed. ``0`` disables coalescing.
 
     Example usage:
 
@@ -40,6 +47,15 @@ class FileMonitor(IgnisGObject):
             recursive=False,
             callback=lambda path, event_type: print(path, event_type),
         )
+
+        # ignore caches and VCS directories, report at most one event per file per 100 ms
+        utils.FileMonitor(
+            path="path/to/directory",
+            recursive=True,
+            ignore=["__pycache__", ".git", "node_modules"],
+            debounce=100,
+            callback=lambda path, event_type: print(path, event_type),
+        )
     """
 
     def __init__(
@@ -49,6 +65,8 @@ class FileMonitor(IgnisGObject):
         flags: Gio.FileMonitorFlags = Gio.FileMonitorFlags.NONE,
         callback: Callable | None = None,
         prevent_gc: bool = True,
+        ignore: list[str] | None = None,
+        debounce: int = 0,
     ):
         super().__init__()
         self._file = Gio.File.new_for_path(path)
@@ -60,19 +78,22 @@ class FileMonitor(IgnisGObject):
         self._callback = callback
         self._recursive = recursive
         self._prevent_gc = prevent_gc
+        self._ignore = ignore or []
+        self._debounce = debounce
 
-        self._sub_monitors: list[Gio.FileMonitor] = []
-        self._sub_paths: list[str] = []
+        self._sub_monitors: dict[str, Gio.FileMonitor] = {}
+        # path -> (event type, timeout source id)
+        self._pending: dict[str, tuple[str, int]] = {}
 
         if recursive:
-            for root, dirs, _files in os.walk(path):
-                for d in dirs:
-                    subdir_path = os.path.join(root, d)
-                    self.__add_submonitor(subdir_path)
+            self.__add_tree(path)
 
         if prevent_gc:
             file_monitors.append(self)
 
+        # e.g., the monitor of an OptionsManager created by the configuration, cancelled on an in-process reload
+        _config_scope.add_cleanup(self.cancel)
+
         self.connect(
             "changed", lambda *args: self._callback(*args) if self._callback else None
         )
@@ -88,22 +109,80 @@ class FileMonitor(IgnisGObject):
         """
         pass
 
+    def __is_ignored(self, path: str) -> bool:
+        if not self._ignore:
+            return False
+
+        relpath = os.path.relpath(path, self._path)
+        return any(
+            fnmatch.fnmatch(part, pattern)
+            for part in relpath.split(os.sep)
+            for pattern in self._ignore
+        )
+
     def __on_change(self, file_monitor, file, other_file, event_type) -> None:
         path = file.get_path()
-        self.emit("changed", path, EVENT[event_type])
+        if path is None or self.__is_ignored(path):
+            return
+
+        event = EVENT[event_type]
+
+        if self.recursive:
+            if event in ("deleted", "moved_out", "renamed", "unmounted"):
+                self.__remove_tree(path)
+            if event == "renamed" and other_file is not None:
+                new_path = other_file.get_path()
+                if new_path and os.path.isdir(new_path):
+                    self.__add_tree(new_path)
+            # only new directories need a walk, other events don't change the tree
+            elif event in ("created", "moved_in") and os.path.isdir(path):
+                self.__add_tree(path)
+
+        if self._debounce <= 0:
+            self.emit("changed", path, event)
+            return
+
+        pending = self._pending.get(path, None)
+        if pending is not None:
+            GLib.source_remove(pending[1])
 
-        if self.recursive and os.path.isdir(path):
+            # e.g., "attribute_changed" right after a save must not hide the "changes_done_hint" of that save
+            if pending[0] == "changes_done_hint" and event not in _REMOVAL_EVENTS:
+                event = pending[0]
+
+        source_id = GLib.timeout_add(self._debounce, self.__flush_pending, path)
+        self._pending[path] = (event, source_id)
+
+    def __flush_pending(self, path: str) -> bool:
+        event, _ = self._pending.pop(path)
+        self.emit("changed", path, event)
+        return GLib.SOURCE_REMOVE
+
+    def __add_tree(self, path: str) -> None:
+        if path != self._path:
             self.__add_submonitor(path)
 
+        for root, dirs, _files in os.walk(path):
+            # prune ignored directories, so os.walk doesn't descend into them
+            dirs[:] = [d for d in dirs if not self.__is_ignored(os.path.join(root, d))]
+            for d in dirs:
+                self.__add_submonitor(os.path.join(root, d))
+
     def __add_submonitor(self, path: str) -> None:
-        if path in self._sub_paths:
+        if path in self._sub_monitors or self.__is_ignored(path):
             return
 
         sub_gfile = Gio.File.new_for_path(path)
         monitor = sub_gfile.monitor(self.flags, None)
         monitor.connect("changed", self.__on_change)
-        self._sub_monitors.append(monitor)
-        self._sub_paths.append(path)
+        self._sub_monitors[path] = monitor
+
+    def __remove_tree(self, path: str) -> None:
+        prefix = path + os.sep
+        for sub_path in [
+            p for p in self._sub_monitors if p == path or p.startswith(prefix)
+        ]:
+            self._sub_monitors.pop(sub_path).cancel()
 
     @IgnisProperty
     def path(self) -> str:
@@ -159,6 +238,27 @@ class FileMonitor(IgnisGObject):
         """
         return self._recursive
 
+    @IgnisProperty
+    def ignore(self) -> list[str]:
+        """
+        A list of glob patterns. Paths with any component matching a pattern are neither monitored nor reported.
+        """
+        return self._ignore
+
+    @IgnisProperty
+    def debounce(self) -> int:
+        """
+        The interval (in milliseconds) over which events are coalesced per path. ``0`` means no coalescing.
+        """
+        return self._debounce
+
+    @IgnisProperty
+    def monitored_paths(self) -> list[str]:
+        """
+        A list of all currently monitored directories (including :attr:`path`).
+        """
+        return [self._path, *self._sub_monitors]
+
     @IgnisProperty
     def prevent_gc(self) -> bool:
         """
@@ -171,3 +271,14 @@ class FileMonitor(IgnisGObject):
         Cancel the monitoring process.
         """
         self._monitor.cancel()
+
+        for monitor in self._sub_monitors.values():
+            monitor.cancel()
+        self._sub_monitors.clear()
+
+        for _, source_id in self._pending.values():
+            GLib.source_remove(source_id)
+        self._pending.clear()
+
+        if self in file_monitors:
+            file_monitors.remove(self)
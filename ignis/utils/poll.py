@@ -1,7 +1,120 @@
+import time
+import asyncio
+import inspect
+from loguru import logger
 from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
-from gi.repository import GLib  # type: ignore
+from gi.repository import GLib, GObject, Gtk  # type: ignore
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from ignis import _config_scope
+from .thread import ThreadPool, get_thread_pool
+
+# An aligned timer may fire slightly before the boundary,
+# in this case the next run is scheduled for the following boundary, not for the same one.
+_ALIGN_TOLERANCE_MS = 20
+
+
+class _PollGroup:
+    """
+    Polls with the same interval and alignment, run by a single timer.
+    """
+
+    def __init__(self, interval: int, align: bool):
+        self._interval = interval
+        self._align = align
+        self._polls: list[Poll] = []
+        self._id: int | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self._polls)
+
+    def add(self, poll: "Poll") -> None:
+        if poll in self._polls:
+            return
+
+        self._polls.append(poll)
+        if self._id is None:
+            self.__schedule()
+
+    def remove(self, poll: "Poll") -> None:
+        if poll not in self._polls:
+            return
+
+        self._polls.remove(poll)
+        if not self._polls and self._id is not None:
+            GLib.source_remove(self._id)
+            self._id = None
+
+    def __schedule(self) -> None:
+        if self._align:
+            # one-shot timer to the next wall-clock boundary, computed again on each run, so it doesn't drift
+            delay = self._interval - int(time.time() * 1000) % self._interval
+            if delay < _ALIGN_TOLERANCE_MS:
+                delay += self._interval
+            self._id = GLib.timeout_add(delay, self.__on_timeout)
+        elif self._interval % 1000 == 0:
+            # GLib groups such timers with other second-based timers of the process into a single wakeup
+            self._id = GLib.timeout_add_seconds(
+                self._interval // 1000, self.__on_timeout
+            )
+        else:
+            self._id = GLib.timeout_add(self._interval, self.__on_timeout)
+
+    def __on_timeout(self) -> bool:
+        source_id = self._id
+
+        for poll in self._polls.copy():
+            # an exception would remove the shared source and stop all polls of the group
+            try:
+                poll._run()
+            except Exception:
+                logger.exception(f"Poll callback {poll.callback} raised an exception")
+
+        # the last poll was removed during the run, the source is already removed
+        if self._id != source_id:
+            return GLib.SOURCE_REMOVE
+
+        if self._align:
+            self._id = None
+            if self._polls:
+                self.__schedule()
+            return GLib.SOURCE_REMOVE
+
+        return GLib.SOURCE_CONTINUE
+
+
+class _PollScheduler:
+    """
+    Runs polls with equal intervals (and alignment) together, with a single timer per group.
+    """
+
+    def __init__(self):
+        self._groups: dict[tuple[int, bool], _PollGroup] = {}
+
+    def add(self, poll: "Poll") -> None:
+        key = (poll.timeout, poll.align)
+
+        group = self._groups.get(key, None)
+        if group is None:
+            group = _PollGroup(*key)
+            self._groups[key] = group
+
+        group.add(poll)
+
+    def remove(self, poll: "Poll") -> None:
+        # must be called before changing the timeout or alignment of the poll
+        key = (poll.timeout, poll.align)
+
+        group = self._groups.get(key, None)
+        if group is None:
+            return
+
+        group.remove(poll)
+        if not group:
+            self._groups.pop(key)
+
+
+_scheduler = _PollScheduler()
 
 
 class Poll(IgnisGObject):
@@ -10,31 +123,102 @@ class Poll(IgnisGObject):
 
     You can pass arguments to the constructor, and they will be passed to the callback.
 
+    Polls with the same timeout are run together by a single timer, so they don't wake the CPU up separately.
+    If the timeout is a multiple of a second, a second-based GLib timer is used,
+    so the wakeups are also shared with other second-based timers.
+
+    If :attr:`output` is bound to widgets (e.g., ``label=poll.bind("output")``),
+    the poll is paused while none of these widgets is mapped (e.g., their window is hidden),
+    and runs immediately when one of them is shown again if the timeout has elapsed.
+    To disable this, set :attr:`pause_when_hidden` to ``False``.
+
+    Slow callbacks (e.g., shell commands or file reads) shouldn't block the main loop.
+    The callback can be a coroutine function (or return an awaitable), or can run in a :class:`~ignis.utils.ThreadPool` (``pool``).
+    In both cases, :attr:`output` and ``changed`` are delivered on the main loop when the callback has finished,
+    a new run is skipped while the previous one is still running (see :attr:`skip_if_running`),
+    and ``callback_timeout`` limits how long a run may take.
+
     Args:
         timeout: The timeout interval in milliseconds.
         callback: The function to call when the timeout is reached. The ``self`` will passed as an argument.
         *args: Arguments to pass to `callback`.
+        align: Whether to run the callback at wall-clock multiples of the timeout (e.g., for a clock, at the start of each second or minute). Must be passed as a **keyword** argument.
+        pause_when_hidden: Whether to pause the poll while widgets bound to :attr:`output` are not mapped. Must be passed as a **keyword** argument.
+        pool: The name of a pool (see :func:`~ignis.utils.get_thread_pool`) or a :class:`~ignis.utils.ThreadPool` to run the callback in. The callback must not touch widgets in this case. Must be passed as a **keyword** argument.
+        skip_if_running: Whether to skip a run if the previous asynchronous run hasn't finished yet. Must be passed as a **keyword** argument.
+        callback_timeout: The maximum duration of an asynchronous run in milliseconds. When exceeded, the run is cancelled (a threaded callback keeps running, but its result is ignored). Must be passed as a **keyword** argument.
 
     Example usage:
 
     .. code-block:: python
 
-        from ignis import utils
+        import datetime
+        from ignis import utils, widgets
 
         # print "Hello" every second
         utils.Poll(timeout=1_000, callback=lambda self: print("Hello"))
+
+        # a clock that is updated exactly at the start of each minute
+        widgets.Label(
+            label=utils.Poll(
+                60_000, lambda x: datetime.datetime.now().strftime("%H:%M"), align=True
+            ).bind("output")
+        )
+
+        # a shell command that doesn't block the main loop
+        async def get_uptime(poll: utils.Poll) -> str:
+            return (await utils.exec_sh_async("uptime -p")).stdout.strip()
+
+        widgets.Label(
+            label=utils.Poll(60_000, get_uptime, callback_timeout=5_000).bind("output")
+        )
+
+        # or run a blocking function in a thread pool
+        widgets.Label(
+            label=utils.Poll(
+                5_000, lambda x: utils.exec_sh("nproc").stdout.strip(), pool="default"
+            ).bind("output")
+        )
     """
 
-    def __init__(self, timeout: int, callback: Callable, *args):
+    def __init__(
+        self,
+        timeout: int,
+        callback: Callable,
+        *args,
+        align: bool = False,
+        pause_when_hidden: bool = True,
+        pool: str | ThreadPool | None = None,
+        skip_if_running: bool = True,
+        callback_timeout: int | None = None,
+    ):
         super().__init__()
-        self._id: int | None = None
         self._output: Any = None
 
         self._timeout = timeout
         self._callback = callback
         self._args = args
+        self._align = align
+        self._pause_when_hidden = pause_when_hidden
+        self._pool = get_thread_pool(pool) if isinstance(pool, str) else pool
+        self._skip_if_running = skip_if_running
+        self._callback_timeout = callback_timeout
 
-        self.__main()
+        # asynchronous runs, a result is delivered only if no later run has delivered its result yet
+        self._tasks: set[asyncio.Task] = set()
+        self._last_run_id = 0
+        self._delivered_run_id = 0
+
+        self._cancelled = False
+        self._scheduled = False
+        self._last_run: float = 0.0
+        self._consumers: dict[Gtk.Widget, list[int]] = {}
+
+        self._run()
+        self.__update_scheduling()
+
+        # a poll created by the configuration is cancelled on an in-process reload
+        _config_scope.add_cleanup(self.cancel)
 
     @IgnisSignal
     def changed(self):
@@ -51,7 +235,9 @@ class Poll(IgnisGObject):
 
     @timeout.setter
     def timeout(self, value: int) -> None:
+        self.__unschedule()
         self._timeout = value
+        self.__update_scheduling()
 
     @IgnisProperty
     def callback(self) -> Callable:
@@ -64,6 +250,74 @@ class Poll(IgnisGObject):
     def callback(self, value: Callable) -> None:
         self._callback = value
 
+    @IgnisProperty
+    def align(self) -> bool:
+        """
+        Whether to run the callback at wall-clock multiples of the timeout.
+        """
+        return self._align
+
+    @align.setter
+    def align(self, value: bool) -> None:
+        self.__unschedule()
+        self._align = value
+        self.__update_scheduling()
+
+    @IgnisProperty
+    def pause_when_hidden(self) -> bool:
+        """
+        Whether to pause the poll while widgets bound to :attr:`output` are not mapped.
+        """
+        return self._pause_when_hidden
+
+    @pause_when_hidden.setter
+    def pause_when_hidden(self, value: bool) -> None:
+        self._pause_when_hidden = value
+        self.__update_scheduling()
+
+    @IgnisProperty
+    def pool(self) -> ThreadPool | None:
+        """
+        The thread pool to run the callback in, or ``None`` to run it on the main loop.
+        """
+        return self._pool
+
+    @IgnisProperty
+    def skip_if_running(self) -> bool:
+        """
+        Whether to skip a run if the previous asynchronous run hasn't finished yet.
+        """
+        return self._skip_if_running
+
+    @skip_if_running.setter
+    def skip_if_running(self, value: bool) -> None:
+        self._skip_if_running = value
+
+    @IgnisProperty
+    def callback_timeout(self) -> int | None:
+        """
+        The maximum duration of an asynchronous run in milliseconds, or ``None`` for no limit.
+        """
+        return self._callback_timeout
+
+    @callback_timeout.setter
+    def callback_timeout(self, value: int | None) -> None:
+        self._callback_timeout = value
+
+    @IgnisProperty
+    def running(self) -> bool:
+        """
+        Whether an asynchronous run is in progress.
+        """
+        return bool(self._tasks)
+
+    @IgnisProperty
+    def paused(self) -> bool:
+        """
+        Whether the poll is paused because widgets bound to :attr:`output` are not mapped.
+        """
+        return not self._cancelled and not self._scheduled
+
     @IgnisProperty
     def output(self) -> Any:
         """
@@ -74,18 +328,130 @@ class Poll(IgnisGObject):
         """
         return self._output
 
-    def __main(self) -> None:
-        self._output = self._callback(self, *self._args)
+    def _run(self) -> None:
+        if self._tasks and self._skip_if_running:
+            return
+
+        self._last_run = time.monotonic()
+
+        if self._pool is not None:
+            self.__start(self._pool.run_async(self._callback, self, *self._args))
+            return
+
+        result = self._callback(self, *self._args)
+        if inspect.isawaitable(result):
+            self.__start(result)
+        else:
+            self.__set_output(result)
+
+    def __set_output(self, value: Any) -> None:
+        self._output = value
         self.emit("changed")
         self.notify("output")
-        self._id = GLib.timeout_add(self._timeout, self.__main)
+
+    def __start(self, awaitable: Awaitable) -> None:
+        self._last_run_id += 1
+        task = asyncio.create_task(self.__wait(awaitable, self._last_run_id))
+        self._tasks.add(task)
+        task.add_done_callback(self.__on_task_done)
+
+        if len(self._tasks) == 1:
+            self.notify("running")
+
+    def __on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not self._tasks:
+            self.notify("running")
+
+    async def __wait(self, awaitable: Awaitable, run_id: int) -> None:
+        try:
+            if self._callback_timeout is None:
+                result = await awaitable
+            else:
+                result = await asyncio.wait_for(
+                    awaitable, self._callback_timeout / 1000
+                )
+        except TimeoutError:
+            logger.warning(
+                f"Poll callback {self._callback} timed out after {self._callback_timeout} ms"
+            )
+            return
+        except Exception as e:
+            logger.opt(exception=e).error(
+                f"Poll callback {self._callback} raised an exception"
+            )
+            return
+
+        # a later run has already finished, this result is outdated
+        if run_id < self._delivered_run_id or self._cancelled:
+            return
+
+        self._delivered_run_id = run_id
+        self.__set_output(result)
+
+    def __is_visible(self) -> bool:
+        if not self._pause_when_hidden or not self._consumers:
+            return True
+
+        return any(widget.get_mapped() for widget in self._consumers)
+
+    def __update_scheduling(self, *args) -> None:
+        if self._cancelled:
+            return
+
+        visible = self.__is_visible()
+
+        if visible and not self._scheduled:
+            self._scheduled = True
+            _scheduler.add(self)
+
+            # the output may be outdated after the pause
+            if (time.monotonic() - self._last_run) * 1000 >= self._timeout:
+                self._run()
+
+            self.notify("paused")
+
+        elif not visible and self._scheduled:
+            self.__unschedule()
+            self.notify("paused")
+
+    def __unschedule(self) -> None:
+        if self._scheduled:
+            self._scheduled = False
+            _scheduler.remove(self)
+
+    def _on_bound(self, consumer: GObject.Object) -> None:
+        if not isinstance(consumer, Gtk.Widget) or consumer in self._consumers:
+            return
+
+        self._consumers[consumer] = [
+            consumer.connect("map", self.__update_scheduling),
+            consumer.connect("unmap", self.__update_scheduling),
+            consumer.connect("destroy", self._on_unbound),
+        ]
+        self.__update_scheduling()
+
+    def _on_unbound(self, consumer: GObject.Object) -> None:
+        handler_ids = self._consumers.pop(consumer, None)  # type: ignore
+        if handler_ids is None:
+            return
+
+        for handler_id in handler_ids:
+            if consumer.handler_is_connected(handler_id):
+                consumer.disconnect(handler_id)
+
+        self.__update_scheduling()
 
     def cancel(self) -> None:
         """
         Cancel polling.
+        A running asynchronous callback is cancelled too.
         """
-        if not self._id:
-            return
+        self.__unschedule()
+        self._cancelled = True
 
-        if GLib.MainContext.default().find_source_by_id(self._id):
-            GLib.source_remove(self._id)
+        for task in list(self._tasks):
+            task.cancel()
+
+        for consumer in list(self._consumers):
+            self._on_unbound(consumer)
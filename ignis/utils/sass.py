@@ -1,3 +1,5 @@
+import os
+import re
 import shutil
 import subprocess
 from typing import Literal
@@ -15,6 +17,75 @@ for cmd in ("sass", "grass"):
         sass_compilers[cmd] = path
 
 
+_COMMENT_RE = re.compile(r"/\*.*?\*/|(?<![:\"'])//[^\n]*", re.DOTALL)
+_IMPORT_RE = re.compile(r"@(?:use|forward|import)\s+([^;\n]+)")
+_URL_RE = re.compile(r"""url\(\s*["']?([^"')]+)["']?\s*\)|["']([^"']+)["']""")
+_EXTENSIONS = (".scss", ".sass", ".css")
+
+
+def _resolve_import(url: str, base_dir: str) -> str | None:
+    # builtin modules (e.g., "sass:math") and remote stylesheets
+    if url.startswith("sass:") or "://" in url:
+        return None
+
+    path = os.path.join(base_dir, url)
+    directory, name = os.path.split(path)
+
+    if name.endswith(_EXTENSIONS):
+        candidates = [path, os.path.join(directory, f"_{name}")]
+    else:
+        candidates = [
+            os.path.join(directory, f"{prefix}{name}{ext}")
+            for prefix in ("", "_")
+            for ext in _EXTENSIONS
+        ]
+        candidates += [
+            os.path.join(path, f"{index}{ext}")
+            for index in ("_index", "index")
+            for ext in _EXTENSIONS
+        ]
+
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return os.path.realpath(candidate)
+
+    return None
+
+
+def get_dependencies(path: str) -> set[str]:
+    """
+    Get the real paths of all files that the style at ``path`` imports (``@use``, ``@forward``, ``@import``), recursively.
+    The result includes ``path`` itself.
+    Imports that can't be resolved (e.g., builtin modules or load paths) are ignored.
+    """
+    root = os.path.realpath(path)
+    dependencies: set[str] = set()
+    queue = [root]
+
+    while queue:
+        current = queue.pop()
+        if current in dependencies:
+            continue
+
+        dependencies.add(current)
+
+        try:
+            with open(current) as file:
+                content = _COMMENT_RE.sub("", file.read())
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        base_dir = os.path.dirname(current)
+        for statement in _IMPORT_RE.findall(content):
+            for match in _URL_RE.finditer(statement):
+                url = match.group(1) or match.group(2)
+                resolved = _resolve_import(url.strip(), base_dir)
+                if resolved:
+                    queue.append(resolved)
+
+    return dependencies
+
+
 def compile_file(path: str, compiler_path: str) -> str:
     compiled_css = f"{get_temp_dir()}/compiled.css"
 
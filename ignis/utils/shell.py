@@ -1,19 +1,148 @@
+import os
+import time
+import shlex
+import signal
 import asyncio
 import subprocess
+from loguru import logger
+from typing import Any, Literal
+from collections.abc import AsyncIterator, Hashable, Iterable
+from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
 
 
-def exec_sh(command: str, **kwargs) -> subprocess.CompletedProcess:
+# Characters that need a shell (expansions, redirections, pipes, globs, etc.).
+# With direct=True, commands without them are split with shlex and executed without spawning /bin/sh.
+_SHELL_CHARS = frozenset("|&;<>()$`\\*?[]#~=%{}!\n")
+_SHELL_WORDS = frozenset(
+    (
+        "if",
+        "then",
+        "else",
+        "elif",
+        "fi",
+        "for",
+        "while",
+        "until",
+        "do",
+        "done",
+        "case",
+        "esac",
+        "function",
+        "select",
+        "time",
+    )
+)
+
+_MAX_CACHED_RESULTS = 256
+_results_cache: dict[Hashable, tuple[float, Any]] = {}
+# key -> the shared task and the TTLs requested by its callers
+_in_flight: dict[Hashable, tuple[asyncio.Task, list[int]]] = {}
+
+
+def _split_command(command: str) -> list[str] | None:
+    if any(char in _SHELL_CHARS for char in command):
+        return None
+
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+
+    if not argv or argv[0] in _SHELL_WORDS:
+        return None
+
+    return argv
+
+
+def _get_cached(key: Hashable) -> Any:
+    entry = _results_cache.get(key, None)
+    if entry is None:
+        return None
+
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        _results_cache.pop(key, None)
+        return None
+
+    return result
+
+
+def _set_cached(key: Hashable, result: Any, ttl: int) -> None:
+    if ttl <= 0:
+        return
+
+    if len(_results_cache) >= _MAX_CACHED_RESULTS:
+        now = time.monotonic()
+        for cached_key, (expires_at, _) in list(_results_cache.items()):
+            if now >= expires_at:
+                _results_cache.pop(cached_key)
+
+        # still full, drop the oldest entry
+        if len(_results_cache) >= _MAX_CACHED_RESULTS:
+            _results_cache.pop(next(iter(_results_cache)))
+
+    _results_cache[key] = (time.monotonic() + ttl / 1000, result)
+
+
+def clear_exec_sh_cache() -> None:
+    """
+    Clear results cached by :func:`exec_sh` and :func:`exec_sh_async` with ``cache_ttl``.
+    """
+    _results_cache.clear()
+
+
+def exec_sh(
+    command: str, cache_ttl: int | None = None, direct: bool = False, **kwargs
+) -> subprocess.CompletedProcess:
     """
-    Execute a shell (bash) command.
+    Execute a shell command (with ``/bin/sh``).
 
     Args:
         command: The command to execute.
+        cache_ttl: If provided, the result is cached for this time in milliseconds,
+            and calls with the same command (and ``kwargs``) during this time return the cached result instead of running the command again.
+        direct: Whether to execute the command directly, without spawning a shell, if it doesn't use shell features
+            (pipes, redirections, variables, globs, etc.). This saves a process per call, but the output may differ
+            for commands that are also shell builtins: e.g., ``echo -e`` is handled by the ``echo`` builtin of ``/bin/sh`` by default, and by ``/bin/echo`` with ``direct=True``.
+            Commands that can't be found (e.g., other builtins) are still executed with the shell.
 
     ``**kwargs`` will be passed to ``subprocess.run()``.
 
     Returns:
         The result of the command execution. You can use the ``stdout`` property to get the command's output.
     """
+    key: Hashable | None = None
+    if cache_ttl is not None:
+        try:
+            key = ("sync", command, direct, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # e.g., "env" is a dict, such calls are not cached
+            key = None
+
+    if key is not None:
+        cached = _get_cached(key)
+        if cached is not None:
+            return cached
+
+    result = _run_sh(command, direct, **kwargs)
+
+    if key is not None and cache_ttl is not None:
+        _set_cached(key, result, cache_ttl)
+
+    return result
+
+
+def _run_sh(command: str, direct: bool, **kwargs) -> subprocess.CompletedProcess:
+    argv = _split_command(command) if direct and "executable" not in kwargs else None
+
+    if argv is not None:
+        try:
+            return subprocess.run(argv, text=True, capture_output=True, **kwargs)
+        except (FileNotFoundError, PermissionError):
+            # e.g., a shell builtin, let the shell handle (and report) it
+            pass
+
     return subprocess.run(command, shell=True, text=True, capture_output=True, **kwargs)
 
 
@@ -49,24 +178,390 @@ class AsyncCompletedProcess:
         return self._stderr
 
 
-async def exec_sh_async(command: str) -> AsyncCompletedProcess:
+async def exec_sh_async(
+    command: str, cache_ttl: int | None = None, direct: bool = False
+) -> AsyncCompletedProcess:
     """
-    Execute a shell (bash) command asynchronously.
+    Execute a shell command (with ``/bin/sh``) asynchronously.
+
+    Concurrent calls with the same command share a single process if ``cache_ttl`` is provided
+    (e.g., the same widget on several monitors runs the command only once).
+    The result is then cached for the longest ``cache_ttl`` among these calls.
 
     Args:
         command: The command to execute.
-        on_finished: A function to call when the process is finished. An instance of :class:`~ignis.utils.exec_sh.AsyncCompletedProcess` will be passed to this function.
+        cache_ttl: If provided, the result is cached for this time in milliseconds,
+            and calls with the same command during this time return the cached result instead of running the command again.
+            Pass ``0`` to only share the result between concurrent calls.
+        direct: Whether to execute the command directly, without spawning a shell, if it doesn't use shell features.
+            See :func:`exec_sh` for the differences.
 
     Returns:
-        The instance of ``Gio.Subprocess``.
+        An instance of :class:`~ignis.utils.AsyncCompletedProcess`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from ignis import utils
+
+        async def get_connections() -> str:
+            # runs at most once per 2 seconds, no matter how many widgets call it
+            result = await utils.exec_sh_async("nmcli -t connection show --active", cache_ttl=2000)
+            return result.stdout
     """
+    if cache_ttl is None:
+        return await _run_sh_async(command, direct)
+
+    key = ("async", command, direct)
+    cached = _get_cached(key)
+    if cached is not None:
+        return cached
+
+    in_flight = _in_flight.get(key, None)
+    if in_flight is None:
+        task = asyncio.create_task(_run_sh_async(command, direct))
+        ttls = [cache_ttl]
+        _in_flight[key] = (task, ttls)
+
+        def on_done(task: asyncio.Task) -> None:
+            _in_flight.pop(key, None)
+            if not task.cancelled() and task.exception() is None:
+                _set_cached(key, task.result(), max(ttls))
+
+        task.add_done_callback(on_done)
+    else:
+        task, ttls = in_flight
+        ttls.append(cache_ttl)
+
+    # shield the shared task, so cancelling one caller doesn't cancel the others
+    return await asyncio.shield(task)
+
+
+async def _run_sh_async(command: str, direct: bool) -> AsyncCompletedProcess:
+    process = None
+
+    argv = _split_command(command) if direct else None
+    if argv is not None:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+        except (FileNotFoundError, PermissionError):
+            # e.g., a shell builtin, let the shell handle (and report) it
+            pass
+
+    if process is None:
+        process = await asyncio.create_subprocess_shell(
+            command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
 
-    process = await asyncio.create_subprocess_shell(
-        command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-    )
     stdout, stderr = await process.communicate()
     returncode = process.returncode
 
     return AsyncCompletedProcess(
         stdout.decode(), stderr.decode(), returncode if returncode is not None else -1
     )
+
+
+RestartPolicy = Literal["never", "on-failure", "always"]
+OverflowPolicy = Literal["drop-oldest", "block"]
+
+# started processes, they run in their own sessions and don't receive signals of the terminal,
+# so the application stops them itself on quit and on an in-process reload
+_live_streaming_processes: set["StreamingProcess"] = set()
+
+
+def _stop_streaming_processes(
+    processes: "Iterable[StreamingProcess] | None" = None,
+) -> None:
+    """
+    :meta private:
+
+    Stop the given streaming processes, or all started ones.
+    """
+    for process in list(_live_streaming_processes if processes is None else processes):
+        process.stop()
+
+
+class StreamingProcess(IgnisGObject):
+    """
+    Run a long-running shell command and handle its output line by line (e.g., ``pactl subscribe``, ``journalctl -f``, ``playerctl --follow``).
+
+    This is much cheaper than polling a command: the process reports changes itself, and nothing runs when nothing changes.
+
+    The process starts immediately.
+    Each line of stdout is emitted with the ``line`` signal and stored in :attr:`last_line`,
+    and can also be consumed with the asynchronous iterator returned by :func:`lines`.
+
+    Args:
+        command: The shell command to run.
+        restart: When to restart the process after it has exited: ``"never"``, ``"on-failure"`` (non-zero exit code) or ``"always"``.
+        restart_delay: The delay before a restart in milliseconds.
+        max_buffered_lines: The maximum number of lines buffered for each :func:`lines` iterator.
+        overflow: What to do when a :func:`lines` iterator doesn't keep up: ``"drop-oldest"`` drops the oldest buffered line,
+            ``"block"`` stops reading the output until there is free space (the process blocks when the pipe is full).
+        max_line_length: The maximum length of a line in bytes. Longer lines are dropped.
+        merge_stderr: Whether to read stderr together with stdout. Otherwise, stderr is discarded.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from ignis import utils, widgets
+
+        # update the volume only when PulseAudio reports a change
+        pactl = utils.StreamingProcess("pactl subscribe", restart="always")
+        pactl.connect("line", lambda x, line: print(line) if "sink" in line else None)
+
+        # show the current track
+        playerctl = utils.StreamingProcess(
+            "playerctl --follow metadata --format '{{ artist }} - {{ title }}'",
+            restart="always",
+        )
+        widgets.Label(label=playerctl.bind("last_line"))
+
+        # or read lines in a coroutine
+        async def follow_journal() -> None:
+            journal = utils.StreamingProcess("journalctl -f -n 0")
+            async for line in journal.lines():
+                print(line)
+    """
+
+    def __init__(
+        self,
+        command: str,
+        restart: RestartPolicy = "never",
+        restart_delay: int = 1000,
+        max_buffered_lines: int = 1000,
+        overflow: OverflowPolicy = "drop-oldest",
+        max_line_length: int = 64 * 1024,
+        merge_stderr: bool = False,
+    ):
+        super().__init__()
+        self._command = command
+        self._restart = restart
+        self._restart_delay = restart_delay
+        self._max_buffered_lines = max_buffered_lines
+        self._overflow = overflow
+        self._max_line_length = max_line_length
+        self._merge_stderr = merge_stderr
+
+        self._process: asyncio.subprocess.Process | None = None
+        self._task: asyncio.Task | None = None
+        self._queues: list[asyncio.Queue] = []
+        self._last_line: str | None = None
+        self._returncode: int | None = None
+
+        self.start()
+
+    @IgnisSignal
+    def line(self, line: str):
+        """
+        Emitted for each line of the output.
+
+        Args:
+            line: The line, without the trailing newline.
+        """
+
+    @IgnisSignal
+    def exited(self, returncode: int):
+        """
+        Emitted when the process has exited (before a possible restart).
+
+        Args:
+            returncode: The exit code of the process.
+        """
+
+    @IgnisProperty
+    def command(self) -> str:
+        """
+        The shell command.
+        """
+        return self._command
+
+    @IgnisProperty
+    def restart(self) -> str:
+        """
+        When to restart the process after it has exited.
+        """
+        return self._restart
+
+    @restart.setter
+    def restart(self, value: RestartPolicy) -> None:
+        self._restart = value
+
+    @IgnisProperty
+    def running(self) -> bool:
+        """
+        Whether the process is running.
+        """
+        return self._process is not None and self._process.returncode is None
+
+    @IgnisProperty
+    def pid(self) -> int | None:
+        """
+        The PID of the process, or ``None`` if it isn't running.
+        """
+        return self._process.pid if self.running else None  # type: ignore
+
+    @IgnisProperty
+    def returncode(self) -> int | None:
+        """
+        The exit code of the last exited process, or ``None``.
+        """
+        return self._returncode
+
+    @IgnisProperty
+    def last_line(self) -> str | None:
+        """
+        The last line of the output.
+        """
+        return self._last_line
+
+    def start(self) -> None:
+        """
+        Start the process. Does nothing if it is already started.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self.__main())
+            _live_streaming_processes.add(self)
+
+    def stop(self) -> None:
+        """
+        Stop the process (and its children) and end all :func:`lines` iterators.
+        The process is not restarted.
+        """
+        task = self._task
+        self._task = None
+        _live_streaming_processes.discard(self)
+
+        self.__kill()
+
+        if task is not None:
+            task.cancel()
+
+        self.__end_iterators()
+
+    async def lines(self) -> AsyncIterator[str]:
+        """
+        Get an asynchronous iterator over lines of the output.
+
+        Lines are buffered for the iterator (up to ``max_buffered_lines``) from the moment it is first awaited
+        (the first ``__anext__()``, e.g., the first iteration of ``async for``), not from this call.
+        The iterator ends when the process exits without a restart, or when :func:`stop` is called.
+        If the process isn't running at that moment (it has exited or has been stopped), the iterator ends immediately.
+        """
+        if self._task is None:
+            return
+
+        queue: asyncio.Queue[str | None] = asyncio.Queue(
+            maxsize=self._max_buffered_lines
+        )
+        self._queues.append(queue)
+
+        try:
+            while True:
+                line = await queue.get()
+                if line is None:
+                    return
+                yield line
+        finally:
+            if queue in self._queues:
+                self._queues.remove(queue)
+
+    async def __main(self) -> None:
+        while True:
+            try:
+                returncode = await self.__run_once()
+            except OSError as e:
+                logger.opt(exception=e).error(
+                    f"StreamingProcess ({self._command}): failed to start the process"
+                )
+                break
+
+            if self._restart == "never" or (
+                self._restart == "on-failure" and returncode == 0
+            ):
+                break
+
+            await asyncio.sleep(self._restart_delay / 1000)
+
+        self._task = None
+        _live_streaming_processes.discard(self)
+        self.__end_iterators()
+
+    async def __run_once(self) -> int:
+        self._process = await asyncio.create_subprocess_shell(
+            self._command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+            if self._merge_stderr
+            else asyncio.subprocess.DEVNULL,
+            limit=self._max_line_length,
+            # a new process group, to stop the command along with the shell
+            start_new_session=True,
+        )
+        self.notify("running")
+        self.notify("pid")
+
+        stdout = self._process.stdout
+        assert stdout is not None
+
+        try:
+            while True:
+                try:
+                    data = await stdout.readline()
+                except ValueError:
+                    logger.warning(
+                        f"StreamingProcess ({self._command}): a line is longer than {self._max_line_length} bytes, dropped"
+                    )
+                    continue
+
+                if not data:
+                    break
+
+                await self.__handle_line(data.decode(errors="replace").rstrip("\n"))
+
+            returncode = await self._process.wait()
+        except asyncio.CancelledError:
+            self.__kill()
+            raise
+
+        self._returncode = returncode
+        self.notify("running")
+        self.notify("pid")
+        self.notify("returncode")
+        self.emit("exited", returncode)
+
+        return returncode
+
+    async def __handle_line(self, line: str) -> None:
+        self._last_line = line
+        self.notify("last_line")
+        self.emit("line", line)
+
+        for queue in self._queues.copy():
+            if self._overflow == "block":
+                await queue.put(line)
+                continue
+
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(line)
+
+    def __kill(self) -> None:
+        if self._process is None or self._process.returncode is not None:
+            return
+
+        try:
+            os.killpg(self._process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def __end_iterators(self) -> None:
+        for queue in self._queues.copy():
+            # make room for the end marker, the iterator ends anyway
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
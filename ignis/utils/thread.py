@@ -1,6 +1,16 @@
+import os
+import asyncio
 import threading
+from loguru import logger
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 from collections.abc import Callable
-from ignis.gobject import IgnisGObject, IgnisSignal
+from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_pools: dict[str, "ThreadPool"] = {}
+_pools_lock = threading.Lock()
 
 
 def thread(target: Callable, *args, **kwargs) -> threading.Thread:
@@ -8,6 +18,10 @@ def thread(target: Callable, *args, **kwargs) -> threading.Thread:
     Simply run the given function in a thread.
     The provided args and kwargs will be passed to the function.
 
+    .. hint::
+        This always creates a new dedicated thread, which is suitable for long-running loops (e.g., listening to a socket).
+        For short-lived work (file reads, shell calls, etc.) use :class:`ThreadPool` instead.
+
     Args:
         target: The function to run.
 
@@ -22,6 +36,8 @@ def thread(target: Callable, *args, **kwargs) -> threading.Thread:
 def run_in_thread(func: Callable) -> Callable:
     """
     Decorator to run the decorated function in a thread.
+
+    The same as :func:`thread`, a new dedicated thread is created on every call.
     """
 
     def wrapper(*args, **kwargs):
@@ -30,26 +46,243 @@ def run_in_thread(func: Callable) -> Callable:
     return wrapper
 
 
+class ThreadPool(IgnisGObject):
+    """
+    A managed pool of worker threads.
+
+    Unlike :func:`thread`, the pool reuses a bounded number of threads,
+    provides futures that can be awaited from the asyncio loop, can cancel pending work, and collects statistics.
+
+    .. hint::
+        Use :func:`get_thread_pool` to get a named pool shared across the process.
+
+    Args:
+        name: The name of the pool.
+        max_workers: The maximum number of worker threads.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from ignis import utils
+
+        pool = utils.get_thread_pool("my-service", max_workers=2)
+
+        # get a concurrent.futures.Future
+        future = pool.submit(lambda: utils.exec_sh("sleep 1; echo hello").stdout)
+        future.add_done_callback(lambda f: print(f.result()))
+
+        # or await the result
+        async def some_func():
+            output = await pool.run_async(utils.read_file, path="/etc/hostname")
+            print(output)
+    """
+
+    def __init__(self, name: str, max_workers: int = DEFAULT_MAX_WORKERS):
+        super().__init__()
+        self._name = name
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"ignis-{name}"
+        )
+
+        self._lock = threading.Lock()
+        self._queue_length = 0
+        self._active_workers = 0
+        self._completed = 0
+
+    @IgnisProperty
+    def name(self) -> str:
+        """
+        The name of the pool.
+        """
+        return self._name
+
+    @IgnisProperty
+    def max_workers(self) -> int:
+        """
+        The maximum number of worker threads.
+        """
+        return self._max_workers
+
+    @IgnisProperty
+    def queue_length(self) -> int:
+        """
+        The number of submitted functions waiting for a free worker.
+        """
+        return self._queue_length
+
+    @IgnisProperty
+    def active_workers(self) -> int:
+        """
+        The number of workers currently running a function.
+        """
+        return self._active_workers
+
+    @IgnisProperty
+    def completed(self) -> int:
+        """
+        The number of functions that have finished running (successfully or not).
+        """
+        return self._completed
+
+    @IgnisProperty
+    def stats(self) -> dict[str, Any]:
+        """
+        A dictionary with all statistics of the pool.
+        """
+        with self._lock:
+            return {
+                "name": self._name,
+                "max_workers": self._max_workers,
+                "queue_length": self._queue_length,
+                "active_workers": self._active_workers,
+                "completed": self._completed,
+            }
+
+    def __run_target(self, target: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            self._queue_length -= 1
+            self._active_workers += 1
+
+        try:
+            return target(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active_workers -= 1
+                self._completed += 1
+
+    def __on_done(self, future: Future) -> None:
+        # cancelled before a worker picked it up, __run_target was never called
+        if future.cancelled():
+            with self._lock:
+                self._queue_length -= 1
+
+    def submit(self, target: Callable, *args, **kwargs) -> Future:
+        """
+        Run the given function in the pool.
+        The provided args and kwargs will be passed to the function.
+
+        Args:
+            target: The function to run.
+
+        Returns:
+            A :class:`concurrent.futures.Future` representing the result.
+            Call ``cancel()`` on it to cancel the function if it hasn't started yet.
+        """
+        with self._lock:
+            self._queue_length += 1
+
+        try:
+            future = self._executor.submit(self.__run_target, target, *args, **kwargs)
+        except RuntimeError:
+            with self._lock:
+                self._queue_length -= 1
+            raise
+
+        future.add_done_callback(self.__on_done)
+        return future
+
+    async def run_async(self, target: Callable, *args, **kwargs) -> Any:
+        """
+        Run the given function in the pool and asynchronously wait for the result.
+        The provided args and kwargs will be passed to the function.
+
+        If the awaiting task is cancelled, the function is cancelled too (if it hasn't started yet).
+
+        Args:
+            target: The function to run.
+
+        Returns:
+            The return value of the function.
+        """
+        return await asyncio.wrap_future(self.submit(target, *args, **kwargs))
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """
+        Shut down the pool.
+        Running functions are not interrupted.
+
+        Args:
+            cancel_pending: Whether to cancel functions that haven't started yet.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=cancel_pending)
+
+        with _pools_lock:
+            if _pools.get(self._name, None) is self:
+                _pools.pop(self._name)
+
+
+def get_thread_pool(
+    name: str = "default", max_workers: int | None = None
+) -> ThreadPool:
+    """
+    Get a named :class:`ThreadPool`, creating it if necessary.
+
+    Services and configs can use their own named pools,
+    so slow work in one pool doesn't delay another.
+
+    Args:
+        name: The name of the pool.
+        max_workers: The maximum number of worker threads. Only used when the pool is created.
+
+    Returns:
+        The thread pool.
+    """
+    with _pools_lock:
+        pool = _pools.get(name, None)
+        if pool is None:
+            pool = ThreadPool(
+                name=name,
+                max_workers=max_workers
+                if max_workers is not None
+                else DEFAULT_MAX_WORKERS,
+            )
+            _pools[name] = pool
+
+        return pool
+
+
+def get_thread_pools() -> list[ThreadPool]:
+    """
+    Get a list of all named thread pools created with :func:`get_thread_pool`.
+    """
+    with _pools_lock:
+        return list(_pools.values())
+
+
 class ThreadTask(IgnisGObject):
     """
     Execute a function in another thread and call a callback when it's finished.
     The output from the function is passed to the callback.
 
+    The function runs in a :class:`ThreadPool` rather than a new thread.
+
     Parameters:
         target: The function to execute in another thread.
         callback: The function to call when ``target`` has finished.
+        pool: The name of the pool (see :func:`get_thread_pool`) or a :class:`ThreadPool` instance.
     """
 
-    def __init__(self, target: Callable, callback: Callable):
+    def __init__(
+        self, target: Callable, callback: Callable, pool: "str | ThreadPool" = "default"
+    ):
         super().__init__()
         self._target = target
         self._callback = callback
+        self._pool = pool if isinstance(pool, ThreadPool) else get_thread_pool(pool)
+        self._future: Future | None = None
 
         self.connect("finished", lambda x, result: callback(result))
 
-    @run_in_thread
     def __run(self) -> None:
-        result = self._target()
+        try:
+            result = self._target()
+        except Exception:
+            # the exception is stored on the future, which is rarely checked, so report it like a thread would
+            logger.exception(f"ThreadTask target {self._target} raised an exception")
+            raise
+
         self.emit("finished", result)
 
     @IgnisSignal
@@ -59,8 +292,24 @@ class ThreadTask(IgnisGObject):
             output: The output from the function.
         """
 
-    def run(self) -> None:
+    def run(self) -> Future:
         """
         Run this task.
+
+        Returns:
+            A :class:`concurrent.futures.Future` of the task.
         """
-        self.__run()
+        self._future = self._pool.submit(self.__run)
+        return self._future
+
+    def cancel(self) -> bool:
+        """
+        Cancel this task if it hasn't started yet.
+
+        Returns:
+            Whether the task was cancelled.
+        """
+        if self._future is None:
+            return False
+
+        return self._future.cancel()
@@ -1,81 +1,116 @@
-from typing import TypeAlias
-from .window import Window
-from .label import Label
-from .button import Button
-from .box import Box
-from .calendar import Calendar
-from .scale import Scale
-from .icon import Icon
-from .picture import Picture
-from .centerbox import CenterBox
-from .revealer import Revealer
-from .scroll import Scroll
-from .entry import Entry
-from .switch import Switch
-from .separator import Separator
-from .toggle_button import ToggleButton
-from .regular_window import RegularWindow
-from .file_chooser_button import FileChooserButton
-from .file_filter import FileFilter
-from .file_dialog import FileDialog
-from .grid import Grid
-from .popover_menu import PopoverMenu
-from .eventbox import EventBox
-from .headerbar import HeaderBar
-from .listboxrow import ListBoxRow
-from .listbox import ListBox
-from .check_button import CheckButton
-from .spin_button import SpinButton
-from .dropdown import DropDown
-from .overlay import Overlay
-from .arrow import Arrow
-from .arrow_button import ArrowButton
-from .revealer_window import RevealerWindow
-from .stack import Stack
-from .stack_switcher import StackSwitcher
-from .stack_page import StackPage
-from ignis._deprecation import deprecated_getattribute
+import importlib
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from .window import Window
+    from .label import Label
+    from .button import Button
+    from .box import Box
+    from .calendar import Calendar
+    from .scale import Scale
+    from .icon import Icon
+    from .picture import Picture
+    from .centerbox import CenterBox
+    from .revealer import Revealer
+    from .scroll import Scroll
+    from .entry import Entry
+    from .switch import Switch
+    from .separator import Separator
+    from .toggle_button import ToggleButton
+    from .regular_window import RegularWindow
+    from .file_chooser_button import FileChooserButton
+    from .file_filter import FileFilter
+    from .file_dialog import FileDialog
+    from .grid import Grid
+    from .popover_menu import PopoverMenu
+    from .eventbox import EventBox
+    from .headerbar import HeaderBar
+    from .listboxrow import ListBoxRow
+    from .listbox import ListBox
+    from .check_button import CheckButton
+    from .spin_button import SpinButton
+    from .dropdown import DropDown
+    from .overlay import Overlay
+    from .arrow import Arrow
+    from .arrow_button import ArrowButton
+    from .revealer_window import RevealerWindow
+    from .stack import Stack
+    from .stack_switcher import StackSwitcher
+    from .stack_page import StackPage
+    from .list_view import ListView
+    from .grid_view import GridView
 
-@deprecated_getattribute(
-    """The "Widget" class is deprecated, please use "from ignis import widgets" instead."""
-)
-class Widget:
-    Window: TypeAlias = Window
-    Label: TypeAlias = Label
-    Button: TypeAlias = Button
-    Box: TypeAlias = Box
-    Calendar: TypeAlias = Calendar
-    Scale: TypeAlias = Scale
-    Icon: TypeAlias = Icon
-    CenterBox: TypeAlias = CenterBox
-    Revealer: TypeAlias = Revealer
-    Scroll: TypeAlias = Scroll
-    Entry: TypeAlias = Entry
-    Switch: TypeAlias = Switch
-    Separator: TypeAlias = Separator
-    ToggleButton: TypeAlias = ToggleButton
-    RegularWindow: TypeAlias = RegularWindow
-    FileChooserButton: TypeAlias = FileChooserButton
-    FileFilter: TypeAlias = FileFilter
-    Grid: TypeAlias = Grid
-    PopoverMenu: TypeAlias = PopoverMenu
-    EventBox: TypeAlias = EventBox
-    FileDialog: TypeAlias = FileDialog
-    HeaderBar: TypeAlias = HeaderBar
-    ListBoxRow: TypeAlias = ListBoxRow
-    ListBox: TypeAlias = ListBox
-    Picture: TypeAlias = Picture
-    CheckButton: TypeAlias = CheckButton
-    SpinButton: TypeAlias = SpinButton
-    DropDown: TypeAlias = DropDown
-    Overlay: TypeAlias = Overlay
-    Arrow: TypeAlias = Arrow
-    ArrowButton: TypeAlias = ArrowButton
-    RevealerWindow: TypeAlias = RevealerWindow
-    Stack: TypeAlias = Stack
-    StackSwitcher: TypeAlias = StackSwitcher
-    StackPage = StackPage
+# Widgets are imported on first access (PEP 562),
+# so a configuration doesn't pay the import cost of widgets it doesn't use.
+_WIDGET_MODULES: dict[str, str] = {
+    "Window": "window",
+    "Label": "label",
+    "Button": "button",
+    "Box": "box",
+    "Calendar": "calendar",
+    "Scale": "scale",
+    "Icon": "icon",
+    "Picture": "picture",
+    "CenterBox": "centerbox",
+    "Revealer": "revealer",
+    "Scroll": "scroll",
+    "Entry": "entry",
+    "Switch": "switch",
+    "Separator": "separator",
+    "ToggleButton": "toggle_button",
+    "RegularWindow": "regular_window",
+    "FileChooserButton": "file_chooser_button",
+    "FileFilter": "file_filter",
+    "FileDialog": "file_dialog",
+    "Grid": "grid",
+    "PopoverMenu": "popover_menu",
+    "EventBox": "eventbox",
+    "HeaderBar": "headerbar",
+    "ListBoxRow": "listboxrow",
+    "ListBox": "listbox",
+    "CheckButton": "check_button",
+    "SpinButton": "spin_button",
+    "DropDown": "dropdown",
+    "Overlay": "overlay",
+    "Arrow": "arrow",
+    "ArrowButton": "arrow_button",
+    "RevealerWindow": "revealer_window",
+    "Stack": "stack",
+    "StackSwitcher": "stack_switcher",
+    "StackPage": "stack_page",
+    "ListView": "list_view",
+    "GridView": "grid_view",
+}
+
+
+def _create_deprecated_widget_class() -> type:
+    from ignis._deprecation import deprecated_getattribute
+
+    widget_cls = type(
+        "Widget", (), {name: __getattr__(name) for name in _WIDGET_MODULES}
+    )
+
+    return deprecated_getattribute(
+        """The "Widget" class is deprecated, please use "from ignis import widgets" instead."""
+    )(widget_cls)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _WIDGET_MODULES.get(name, None)
+
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    elif name == "Widget":
+        value = _create_deprecated_widget_class()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_WIDGET_MODULES])
 
 
 __all__ = [
@@ -93,11 +128,13 @@ __all__ = [
     "FileDialog",
     "FileFilter",
     "Grid",
+    "GridView",
     "HeaderBar",
     "Icon",
     "Label",
     "ListBox",
     "ListBoxRow",
+    "ListView",
     "Overlay",
     "Picture",
     "PopoverMenu",
@@ -0,0 +1,30 @@
+from typing import Any
+from gi.repository import Gtk  # type: ignore
+from ignis.gobject import IgnisGObject
+
+
+def disconnect_widget_bindings(widget: Gtk.Widget) -> None:
+    """
+    Disconnect bindings of a widget and all its descendants.
+    """
+    if isinstance(widget, IgnisGObject):
+        widget._disconnect_bindings()
+
+    child = widget.get_first_child()
+    while child:
+        disconnect_widget_bindings(child)
+        child = child.get_next_sibling()
+
+
+def disconnect_child_bindings(child: Any) -> None:
+    """
+    Disconnect bindings of a container child: a widget or an object holding one (e.g., ``StackPage``).
+    """
+    if isinstance(child, Gtk.Widget):
+        disconnect_widget_bindings(child)
+    elif isinstance(child, IgnisGObject):
+        child._disconnect_bindings()
+
+        widget = getattr(child, "child", None)
+        if isinstance(widget, Gtk.Widget):
+            disconnect_widget_bindings(widget)
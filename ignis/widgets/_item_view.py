@@ -0,0 +1,109 @@
+from typing import Any, Literal
+from collections.abc import Callable, Iterable
+from gi.repository import Gtk, Gio, GObject  # type: ignore
+from ignis.list_model import IgnisListModel
+
+SelectionMode = Literal["none", "single", "multiple"]
+
+
+class _ItemViewController:
+    """
+    Shared logic of :class:`~ignis.widgets.ListView` and :class:`~ignis.widgets.GridView`:
+    the item factory, the backing :class:`~ignis.list_model.IgnisListModel`, and the selection model.
+    """
+
+    def __init__(self, view: Gtk.ListView | Gtk.GridView):
+        self._view = view
+        self._store = IgnisListModel()
+        self._model: Gio.ListModel = self._store
+        self._selection_mode: SelectionMode = "none"
+
+        self.setup_item: Callable[[], Gtk.Widget] | None = None
+        self.bind_item: Callable[[Gtk.Widget, Any], None] | None = None
+        self.unbind_item: Callable[[Gtk.Widget, Any], None] | None = None
+        self.on_activate: Callable[[Any], None] | None = None
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self.__on_setup)
+        factory.connect("bind", self.__on_bind)
+        factory.connect("unbind", self.__on_unbind)
+        view.props.factory = factory
+
+        view.connect("activate", self.__on_activate)
+
+        self.__update_selection_model()
+
+    @property
+    def items(self) -> list[GObject.Object]:
+        return self._store.items
+
+    @items.setter
+    def items(self, value: Iterable[GObject.Object]) -> None:
+        # only the changed range is replaced, so unchanged rows keep their widgets
+        self._store.update(value)
+
+        if self._model is not self._store:
+            self._model = self._store
+            self.__update_selection_model()
+
+    @property
+    def model(self) -> Gio.ListModel:
+        return self._model
+
+    @model.setter
+    def model(self, value: Gio.ListModel) -> None:
+        self._model = value
+        self.__update_selection_model()
+
+    @property
+    def selection_mode(self) -> SelectionMode:
+        return self._selection_mode
+
+    @selection_mode.setter
+    def selection_mode(self, value: SelectionMode) -> None:
+        self._selection_mode = value
+        self.__update_selection_model()
+
+    def get_selected_items(self) -> list[Any]:
+        selection = self._view.props.model
+        if selection is None:
+            return []
+
+        bitset = selection.get_selection()
+        return [
+            self._model.get_item(bitset.get_nth(i)) for i in range(bitset.get_size())
+        ]
+
+    def __update_selection_model(self) -> None:
+        if self._selection_mode == "single":
+            selection = Gtk.SingleSelection(
+                model=self._model, autoselect=False, can_unselect=True
+            )
+        elif self._selection_mode == "multiple":
+            selection = Gtk.MultiSelection(model=self._model)
+        else:
+            selection = Gtk.NoSelection(model=self._model)
+
+        self._view.props.model = selection
+
+    def __on_setup(
+        self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        if self.setup_item:
+            list_item.set_child(self.setup_item())
+
+    def __on_bind(
+        self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        if self.bind_item:
+            self.bind_item(list_item.get_child(), list_item.get_item())
+
+    def __on_unbind(
+        self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        if self.unbind_item:
+            self.unbind_item(list_item.get_child(), list_item.get_item())
+
+    def __on_activate(self, view: Gtk.Widget, position: int) -> None:
+        if self.on_activate:
+            self.on_activate(self._model.get_item(position))
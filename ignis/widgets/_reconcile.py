@@ -0,0 +1,72 @@
+from typing import Any, TypeVar
+from collections.abc import Callable, Iterable
+from ignis.widgets._bindings import disconnect_child_bindings
+
+_T = TypeVar("_T")
+
+
+def reconcile(
+    current: list[_T],
+    new: Iterable[Any],
+    key: Callable[[Any], Any] | None,
+    factory: Callable[[Any], _T] | None,
+    keyed: dict[Any, _T],
+) -> tuple[list[_T], list[_T]]:
+    """
+    Match a new list of children against the current children.
+
+    Without ``factory``, ``new`` is a list of children, and they are matched by identity.
+    With ``factory``, ``new`` is a list of items (e.g., service objects), and keys are computed first:
+    an item whose key (the item itself without ``key``) belongs to a current child gets this child,
+    and ``factory`` is called only for items with new keys, so no child is created just to be discarded.
+    Bindings of removed children are disconnected in this case.
+
+    Args:
+        current: The current children.
+        new: The new children or items.
+        key: A function that returns a key for an item.
+        factory: A function that creates a child for an item.
+        keyed: The mapping of keys to children from the previous call, updated in place.
+
+    Returns:
+        The resulting list of children and the current children that are not in it.
+    """
+    current_ids = {id(child) for child in current}
+    result: list[_T] = []
+
+    if factory is None:
+        keyed.clear()
+        result = [child for child in new if child]
+    else:
+        new_keyed: dict[Any, _T] = {}
+
+        for item in new:
+            if item is None:
+                continue
+
+            item_key = item if key is None else key(item)
+            if item_key in new_keyed:
+                # a duplicate key, its child can't be matched next time
+                result.append(factory(item))
+                continue
+
+            child = keyed.get(item_key, None)
+            # the child may have been removed manually (e.g., with remove())
+            if child is None or id(child) not in current_ids:
+                child = factory(item)
+
+            new_keyed[item_key] = child
+            result.append(child)
+
+        keyed.clear()
+        keyed.update(new_keyed)
+
+    result_ids = {id(child) for child in result}
+    removed = [child for child in current if id(child) not in result_ids]
+
+    # children created by the factory aren't reused after removal
+    if factory is not None:
+        for child in removed:
+            disconnect_child_bindings(child)
+
+    return result, removed
@@ -1,6 +1,9 @@
 from gi.repository import Gtk  # type: ignore
+from typing import Any
+from collections.abc import Callable
 from ignis.base_widget import BaseWidget
 from ignis.gobject import IgnisProperty
+from ignis.widgets._reconcile import reconcile
 
 
 class Box(Gtk.Box, BaseWidget):
@@ -34,37 +37,122 @@ class Box(Gtk.Box, BaseWidget):
     __gtype_name__ = "IgnisBox"
     __gproperties__ = {**BaseWidget.gproperties}
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        child_key: Callable[[Any], Any] | None = None,
+        child_factory: Callable[[Any], Gtk.Widget] | None = None,
+        **kwargs,
+    ):
         Gtk.Box.__init__(self)
         self._child: list[Gtk.Widget] = []
+        self._child_key = child_key
+        self._child_factory = child_factory
+        self._keyed_child: dict[Any, Gtk.Widget] = {}
         BaseWidget.__init__(self, **kwargs)
 
     @IgnisProperty
     def child(self) -> list[Gtk.Widget]:
         """
         A list of child widgets.
+
+        Setting a new list only changes what differs from the current children:
+        widgets that are already children stay in place (or are moved), others are added or removed.
+        If :attr:`child_factory` is set, it is a list of items to create children for instead.
         """
         return self._child
 
     @child.setter
-    def child(self, child: list[Gtk.Widget]) -> None:
-        for c in self._child:
+    def child(self, child: list[Any]) -> None:
+        result, removed = reconcile(
+            self._child, child, self._child_key, self._child_factory, self._keyed_child
+        )
+
+        for c in removed:
+            # drop the unparent wrapper installed in __track_unparent()
+            c.__dict__.pop("unparent", None)
             super().remove(c)
 
-        self._child = []
-        for c in child:
-            if c:
-                self.append(c)
+        prev = None
+        for c in result:
+            if c.get_parent() is self:
+                if c.get_prev_sibling() is not prev:
+                    self.reorder_child_after(c, prev)
+            else:
+                self.__track_unparent(c)
+                self.insert_child_after(c, prev)
+            prev = c
+
+        self._child = result
+        self.notify("child")
 
-    def append(self, child: Gtk.Widget) -> None:
+    @IgnisProperty
+    def child_key(self) -> Callable[[Any], Any] | None:
+        """
+        A function that returns a key for an item passed to :attr:`child`, e.g., ``lambda workspace: workspace.id``.
+        Used only with :attr:`child_factory`. If not set, items are matched by identity.
+        """
+        return self._child_key
+
+    @child_key.setter
+    def child_key(self, value: Callable[[Any], Any] | None) -> None:
+        self._child_key = value
+        self._keyed_child.clear()
+
+    @IgnisProperty
+    def child_factory(self) -> Callable[[Any], Gtk.Widget] | None:
+        """
+        A function that creates a child widget for an item.
+
+        If set, :attr:`child` accepts a list of items (e.g., service objects) instead of widgets.
+        Keys of the items (see :attr:`child_key`) are computed first: an item with the key of a current child keeps this child as is,
+        and the factory is called only for items with new keys.
+        Binding :attr:`child` to a service property then creates widgets only for new objects.
+
+        The kept widgets are not created again, so they should bind their own state
+        (e.g., to properties of the object they represent).
+
+        .. code-block:: python
+
+            from ignis import widgets
+            from ignis.services.hyprland import HyprlandService
+
+            hyprland = HyprlandService.get_default()
+
+            def workspace_button(workspace) -> widgets.Button:
+                return widgets.Button(
+                    child=widgets.Label(label=str(workspace.id)),
+                    on_click=lambda x: workspace.switch_to(),
+                    css_class_states=hyprland.bind(
+                        "active_workspace", lambda active: {"active": active.id == workspace.id}
+                    ),
+                )
+
+            widgets.Box(
+                child_key=lambda workspace: workspace.id,
+                child_factory=workspace_button,
+                child=hyprland.bind("workspaces"),
+            )
+        """
+        return self._child_factory
+
+    @child_factory.setter
+    def child_factory(self, value: Callable[[Any], Gtk.Widget] | None) -> None:
+        self._child_factory = value
+        self._keyed_child.clear()
+
+    def __track_unparent(self, child: Gtk.Widget) -> None:
         _orig_unparent = child.unparent
 
         def unparent_wrapper(*args, **kwargs):
-            self.remove(child)
+            if child in self._child:
+                self.remove(child)
             _orig_unparent(*args, **kwargs)
             child.unparent = _orig_unparent
 
         child.unparent = unparent_wrapper
+
+    def append(self, child: Gtk.Widget) -> None:
+        self.__track_unparent(child)
         self._child.append(child)
         super().append(child)
         self.notify("child")
@@ -0,0 +1,153 @@
+from gi.repository import Gtk, Gio, GObject  # type: ignore
+from typing import Any
+from collections.abc import Callable
+from ignis.base_widget import BaseWidget
+from ignis.gobject import IgnisProperty
+from ignis.widgets._item_view import _ItemViewController, SelectionMode
+
+
+class GridView(Gtk.GridView, BaseWidget):
+    """
+    Bases: :class:`Gtk.GridView`
+
+    A grid that efficiently displays a large number of items.
+
+    Unlike :class:`~ignis.widgets.Grid`, widgets are created only for visible items and are reused while scrolling,
+    so memory usage doesn't depend on the number of items.
+    To enable this, put it in a :class:`~ignis.widgets.Scroll`.
+
+    Widgets are created by :attr:`setup_item` and filled with item data by :attr:`bind_item`.
+    Items can be set as a list (e.g., bound to a service property) with :attr:`items`,
+    or as any :class:`Gio.ListModel` with :attr:`model`.
+
+    Args:
+        **kwargs: Properties to set.
+
+    .. code-block:: python
+
+        from ignis import widgets
+        from ignis.services.applications import ApplicationsService
+
+        applications = ApplicationsService.get_default()
+
+        widgets.Scroll(
+            vexpand=True,
+            child=widgets.GridView(
+                max_columns=6,
+                setup_item=lambda: widgets.Icon(pixel_size=48),
+                bind_item=lambda icon, app: icon.set_image(app.icon),
+                single_click_activate=True,
+                on_activate=lambda app: app.launch(),
+                items=applications.bind("apps"),
+            ),
+        )
+    """
+
+    __gtype_name__ = "IgnisGridView"
+    __gproperties__ = {**BaseWidget.gproperties}
+
+    def __init__(self, **kwargs):
+        Gtk.GridView.__init__(self)
+        self._controller = _ItemViewController(self)
+        BaseWidget.__init__(self, **kwargs)
+
+    @IgnisProperty
+    def items(self) -> list[GObject.Object]:
+        """
+        A list of items (``GObject.Object`` instances, e.g., objects from services).
+
+        When a new list is set, only the changed part of the backing :class:`~ignis.list_model.IgnisListModel` is updated,
+        so widgets of unchanged items are kept.
+        """
+        return self._controller.items
+
+    @items.setter
+    def items(self, value: list[GObject.Object]) -> None:
+        self._controller.items = value
+
+    @IgnisProperty
+    def model(self) -> Gio.ListModel:
+        """
+        The list model with items.
+        By default, it is an :class:`~ignis.list_model.IgnisListModel` filled by :attr:`items`.
+        Set it to use another :class:`Gio.ListModel`, e.g., a service collection (``HyprlandService.windows_model``),
+        :class:`Gtk.FilterListModel` or :class:`Gtk.SortListModel`.
+        """
+        return self._controller.model
+
+    @model.setter
+    def model(self, value: Gio.ListModel) -> None:
+        self._controller.model = value
+
+    @IgnisProperty
+    def setup_item(self) -> Callable[[], Gtk.Widget] | None:
+        """
+        A function that creates a widget for an item. It takes no arguments and must return a widget.
+        The widget is reused for different items.
+        """
+        return self._controller.setup_item
+
+    @setup_item.setter
+    def setup_item(self, value: Callable[[], Gtk.Widget] | None) -> None:
+        self._controller.setup_item = value
+
+    @IgnisProperty
+    def bind_item(self) -> Callable[[Gtk.Widget, Any], None] | None:
+        """
+        A function that fills a widget (created by :attr:`setup_item`) with data of an item.
+        It takes two arguments: the widget and the item.
+        """
+        return self._controller.bind_item
+
+    @bind_item.setter
+    def bind_item(self, value: Callable[[Gtk.Widget, Any], None] | None) -> None:
+        self._controller.bind_item = value
+
+    @IgnisProperty
+    def unbind_item(self) -> Callable[[Gtk.Widget, Any], None] | None:
+        """
+        A function that is called when a widget no longer shows an item.
+        It takes two arguments: the widget and the item.
+        Use it to disconnect signals connected in :attr:`bind_item`.
+        """
+        return self._controller.unbind_item
+
+    @unbind_item.setter
+    def unbind_item(self, value: Callable[[Gtk.Widget, Any], None] | None) -> None:
+        self._controller.unbind_item = value
+
+    @IgnisProperty
+    def selection_mode(self) -> SelectionMode:
+        """
+        The selection mode.
+
+        - ``"none"``: items can't be selected.
+        - ``"single"``: a single item can be selected.
+        - ``"multiple"``: multiple items can be selected.
+
+        Default: ``"none"``.
+        """
+        return self._controller.selection_mode
+
+    @selection_mode.setter
+    def selection_mode(self, value: SelectionMode) -> None:
+        self._controller.selection_mode = value
+
+    @IgnisProperty
+    def selected_items(self) -> list[Any]:
+        """
+        A list of selected items.
+        """
+        return self._controller.get_selected_items()
+
+    @IgnisProperty
+    def on_activate(self) -> Callable[[Any], None] | None:
+        """
+        A function to call when an item is activated (e.g., on double click or Enter, or on single click if ``single_click_activate`` is ``True``).
+        The item is passed as an argument.
+        """
+        return self._controller.on_activate
+
+    @on_activate.setter
+    def on_activate(self, value: Callable[[Any], None] | None) -> None:
+        self._controller.on_activate = value
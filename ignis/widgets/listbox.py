@@ -1,6 +1,9 @@
 from gi.repository import Gtk  # type: ignore
+from typing import Any
+from collections.abc import Callable
 from ignis.base_widget import BaseWidget
 from ignis.widgets.listboxrow import ListBoxRow
+from ignis.widgets._reconcile import reconcile
 from ignis.gobject import IgnisProperty
 
 
@@ -32,9 +35,17 @@ class ListBox(Gtk.ListBox, BaseWidget):
     __gtype_name__ = "IgnisListBox"
     __gproperties__ = {**BaseWidget.gproperties}
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        rows_key: Callable[[Any], Any] | None = None,
+        rows_factory: Callable[[Any], Gtk.Widget] | None = None,
+        **kwargs,
+    ):
         Gtk.ListBox.__init__(self)
         self._rows: list[Gtk.Widget] = []
+        self._rows_key = rows_key
+        self._rows_factory = rows_factory
+        self._keyed_rows: dict[Any, Gtk.Widget] = {}
         BaseWidget.__init__(self, **kwargs)
 
         self.connect("row_activated", self.__on_row_activated)
@@ -58,22 +69,70 @@ class ListBox(Gtk.ListBox, BaseWidget):
     def rows(self) -> list[Gtk.Widget]:
         """
         A list of rows.
+
+        Setting a new list only changes what differs from the current rows:
+        rows that are already in the list box stay in place (or are moved), others are added or removed.
+        If :attr:`rows_factory` is set, it is a list of items to create rows for instead.
         """
         return self._rows
 
     @rows.setter
-    def rows(self, value: list[Gtk.Widget]) -> None:
-        for i in self._rows:
-            self.remove(i)
+    def rows(self, value: list[Any]) -> None:
+        result, removed = reconcile(
+            self._rows, value, self._rows_key, self._rows_factory, self._keyed_rows
+        )
+
+        for i in removed:
+            super().remove(i)
+
+        current = [i for i in self._rows if i not in removed]
+        for position, row in enumerate(result):
+            if position < len(current) and current[position] is row:
+                continue
+
+            # Gtk.ListBox can't reorder rows, so a moved row is removed and inserted again
+            if row in current:
+                super().remove(row)
+                current.remove(row)
 
-        for i in value:
-            self.append(i)
+            super().insert(row, position)
+            current.insert(position, row)
 
-            if isinstance(i, ListBoxRow):
-                if i.selected:
-                    self.select_row(i)
+            if isinstance(row, ListBoxRow):
+                if row.selected:
+                    self.select_row(row)
+
+        self._rows = result
+        self.notify("rows")
+
+    @IgnisProperty
+    def rows_key(self) -> Callable[[Any], Any] | None:
+        """
+        A function that returns a key for an item passed to :attr:`rows`.
+        Used only with :attr:`rows_factory`. If not set, items are matched by identity.
+        """
+        return self._rows_key
+
+    @rows_key.setter
+    def rows_key(self, value: Callable[[Any], Any] | None) -> None:
+        self._rows_key = value
+        self._keyed_rows.clear()
+
+    @IgnisProperty
+    def rows_factory(self) -> Callable[[Any], Gtk.Widget] | None:
+        """
+        A function that creates a row for an item.
+
+        If set, :attr:`rows` accepts a list of items instead of widgets,
+        and the factory is called only for items whose keys (see :attr:`rows_key`) don't belong to a current row.
+        See :attr:`ignis.widgets.Box.child_factory` for an example.
+        """
+        return self._rows_factory
 
-        self._rows = value
+    @rows_factory.setter
+    def rows_factory(self, value: Callable[[Any], Gtk.Widget] | None) -> None:
+        self._rows_factory = value
+        self._keyed_rows.clear()
 
     def append(self, child: Gtk.Widget) -> None:
         self._rows.append(child)
@@ -1,7 +1,7 @@
 from gi.repository import Gtk  # type: ignore
 from ignis.base_widget import BaseWidget
 from ignis.gobject import IgnisProperty
-from ignis.menu_model import IgnisMenuModel
+from ignis.menu_model import IgnisMenuModel, MENU_ACTION_PREFIX
 
 
 class PopoverMenu(Gtk.PopoverMenu, BaseWidget):
@@ -55,6 +55,7 @@ class PopoverMenu(Gtk.PopoverMenu, BaseWidget):
     def __init__(self, **kwargs):
         Gtk.PopoverMenu.__init__(self)
         self._model: IgnisMenuModel | None = None
+        self._action_group_handler: int | None = None
         BaseWidget.__init__(self, visible=False, **kwargs)
 
     @IgnisProperty
@@ -67,12 +68,28 @@ class PopoverMenu(Gtk.PopoverMenu, BaseWidget):
     @model.setter
     def model(self, value: IgnisMenuModel) -> None:
         if self._model:
+            self.__disconnect_model()
             self._model.clean_gmenu()
 
         self._model = value
+        # the model gets the group of its parent model if it is added to one
+        self._action_group_handler = value.connect(
+            "notify::action-group", lambda *_: self.__insert_action_group()
+        )
+        self.__insert_action_group()
         self.set_menu_model(value.gmenu)
 
+    def __insert_action_group(self) -> None:
+        if self._model:
+            self.insert_action_group(MENU_ACTION_PREFIX, self._model.action_group)
+
+    def __disconnect_model(self) -> None:
+        if self._model and self._action_group_handler is not None:
+            self._model.disconnect(self._action_group_handler)
+        self._action_group_handler = None
+
     def __del__(self) -> None:
         if self._model:
+            self.__disconnect_model()
             self._model.clean_gmenu()
             self._model = None
@@ -1,6 +1,9 @@
 from gi.repository import Gtk  # type: ignore
+from typing import Any
+from collections.abc import Callable
 from ignis.base_widget import BaseWidget
 from .stack_page import StackPage
+from ignis.widgets._reconcile import reconcile
 from ignis.gobject import IgnisProperty
 
 
@@ -47,23 +50,84 @@ class Stack(Gtk.Stack, BaseWidget):
     __gtype_name__ = "IgnisStack"
     __gproperties__ = {**BaseWidget.gproperties}
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        child_key: Callable[[Any], Any] | None = None,
+        child_factory: Callable[[Any], StackPage] | None = None,
+        **kwargs,
+    ):
         Gtk.Stack.__init__(self)
         self.override_enum("transition_type", Gtk.StackTransitionType)
         self._child: list[StackPage] = []
+        self._child_key = child_key
+        self._child_factory = child_factory
+        self._keyed_child: dict[Any, StackPage] = {}
         BaseWidget.__init__(self, **kwargs)
 
     @IgnisProperty
     def child(self) -> list[StackPage]:
         """
         A list of pages.
+
+        Setting a new list only changes what differs from the current pages:
+        pages that are already in the stack are kept, others are added or removed.
+        If :attr:`child_factory` is set, it is a list of items to create pages for instead.
         """
         return self._child
 
     @child.setter
-    def child(self, value: list[StackPage]) -> None:
-        for i in self._child:
+    def child(self, value: list[Any]) -> None:
+        result, removed = reconcile(
+            self._child, value, self._child_key, self._child_factory, self._keyed_child
+        )
+
+        for i in removed:
             self.remove(i.child)
 
-        for i in value:
+        # Gtk.Stack can't reorder pages, so pages after the first difference are added again
+        current = [i for i in self._child if i not in removed]
+        prefix = 0
+        while (
+            prefix < len(current)
+            and prefix < len(result)
+            and current[prefix] is result[prefix]
+        ):
+            prefix += 1
+
+        for i in current[prefix:]:
+            self.remove(i.child)
+
+        for i in result[prefix:]:
             self.add_titled(i.child, None, i.title)
+
+        self._child = result
+        self.notify("child")
+
+    @IgnisProperty
+    def child_key(self) -> Callable[[Any], Any] | None:
+        """
+        A function that returns a key for an item passed to :attr:`child`.
+        Used only with :attr:`child_factory`. If not set, items are matched by identity.
+        """
+        return self._child_key
+
+    @child_key.setter
+    def child_key(self, value: Callable[[Any], Any] | None) -> None:
+        self._child_key = value
+        self._keyed_child.clear()
+
+    @IgnisProperty
+    def child_factory(self) -> Callable[[Any], StackPage] | None:
+        """
+        A function that creates a :class:`~ignis.widgets.StackPage` for an item.
+
+        If set, :attr:`child` accepts a list of items instead of pages,
+        and the factory is called only for items whose keys (see :attr:`child_key`) don't belong to a current page.
+        See :attr:`ignis.widgets.Box.child_factory` for an example.
+        """
+        return self._child_factory
+
+    @child_factory.setter
+    def child_factory(self, value: Callable[[Any], StackPage] | None) -> None:
+        self._child_factory = value
+        self._keyed_child.clear()
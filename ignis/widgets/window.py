@@ -423,7 +423,9 @@ class Window(Gtk.Window, BaseWidget):
 
     def __remove(self, *args) -> None:
         try:
-            window_manager.remove_window(self.namespace)
+            # another window may have taken this namespace (e.g., after an in-process reload)
+            if window_manager.get_window(self.namespace) is self:
+                window_manager.remove_window(self.namespace)
         except WindowNotFoundError:
             pass
 
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Measure cold import time of Ignis modules, each in a fresh interpreter.
+
+Usage: tools/import_benchmark.py [-n RUNS] [STATEMENT ...]
+
+Use "python -X importtime -c 'import ignis.widgets'" to see a per-module breakdown.
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+
+DEFAULT_STATEMENTS = [
+    "import ignis",
+    "import ignis.widgets",
+    "from ignis import widgets; widgets.Label",
+    "from ignis import widgets; [getattr(widgets, name) for name in widgets.__all__]",
+    "import ignis.app",
+    "import ignis.services",
+    "from ignis.services.mpris import MprisService",
+    "from ignis.services.network import NetworkService",
+]
+
+TIMER = """
+import time
+start = time.perf_counter()
+exec({statement!r})
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results.append(float(output.strip().splitlines()[-1]))
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    parser.add_argument("statements", nargs="*", default=DEFAULT_STATEMENTS)
+    args = parser.parse_args()
+
+    print(f"{'min, ms':>10}  {'median, ms':>10}  statement")
+    for statement in args.statements:
+        try:
+            results = measure(statement, args.runs)
+        except subprocess.CalledProcessError as e:
+            print(
+                f"{'error':>10}  {'':>10}  {statement}: {e.stderr.strip().splitlines()[-1]}"
+            )
+            continue
+
+        print(
+            f"{min(results):>10.2f}  {statistics.median(results):>10.2f}  {statement}"
+        )
+
+
+if __name__ == "__main__":
+    main()